@@ -1,27 +1,27 @@
 #!/usr/bin/env python
 """Script to download and cache pre-trained models."""
 
+import importlib.util
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# Use the Rust-based downloader when available (must be set before importing HF libraries)
+if importlib.util.find_spec("hf_transfer") is not None:
+    os.environ.setdefault("HF_HUB_ENABLE_HF_TRANSFER", "1")
+
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.config import settings
+from src.ner.spacy_ner import SPACY_DISABLED_PIPES
 from src.utils.logger import logger
 
 
-def download_models():
-    """Download all required models."""
-    logger.info("="* 60)
-    logger.info("Downloading Pre-trained Models")
-    logger.info("=" * 60)
-
-    # Ensure directories exist
-    settings.ensure_dirs()
-
-    # 1. Download summarization model (BART)
-    logger.info(f"\n1. Downloading summarization model: {settings.summarization_model}")
+def download_summarization_model() -> bool:
+    """Download the summarization model (BART)."""
+    logger.info(f"Downloading summarization model: {settings.summarization_model}")
     try:
         from transformers import AutoModelForSeq2SeqLM, AutoTokenizer
 
@@ -39,43 +39,52 @@ def download_models():
         logger.error(f"✗ Failed to download summarization model: {e}")
         return False
 
-    # 2. Download spaCy model
-    logger.info(f"\n2. Downloading spaCy model: {settings.spacy_model}")
+    return True
+
+
+def download_spacy_model() -> bool:
+    """Download the spaCy model."""
+    logger.info(f"Downloading spaCy model: {settings.spacy_model}")
     try:
         import spacy
 
         # Try to load model
         try:
-            nlp = spacy.load(settings.spacy_model)
+            nlp = spacy.load(settings.spacy_model, disable=SPACY_DISABLED_PIPES)
             logger.info(f"✓ spaCy model {settings.spacy_model} already installed")
         except OSError:
             # Model not found, download it
             logger.info(f"  Downloading {settings.spacy_model}...")
-            import subprocess
+            from spacy.cli.download import download as spacy_download
 
-            result = subprocess.run(
-                ["python", "-m", "spacy", "download", settings.spacy_model],
-                capture_output=True,
-                text=True,
-            )
+            try:
+                spacy_download(settings.spacy_model)
+            except SystemExit as e:
+                # spaCy's CLI commands may exit instead of raising
+                if e.code not in (None, 0):
+                    logger.error(f"✗ Failed to download spaCy model (exit code {e.code})")
+                    return False
 
-            if result.returncode == 0:
-                logger.info(f"✓ Successfully downloaded {settings.spacy_model}")
-            else:
-                logger.error(f"✗ Failed to download spaCy model: {result.stderr}")
-                return False
+            logger.info(f"✓ Successfully downloaded {settings.spacy_model}")
 
     except Exception as e:
         logger.error(f"✗ Failed to download spaCy model: {e}")
         return False
 
-    # 3. Download HuggingFace NER model
-    logger.info(f"\n3. Downloading HuggingFace NER model: {settings.hf_ner_model}")
+    return True
+
+
+def download_hf_ner_model() -> bool:
+    """Download the HuggingFace NER model."""
+    logger.info(f"Downloading HuggingFace NER model: {settings.hf_ner_model}")
     try:
         from transformers import pipeline
 
         ner_pipeline = pipeline(
-            "ner", model=settings.hf_ner_model, aggregation_strategy="simple"
+            "ner",
+            model=settings.hf_ner_model,
+            aggregation_strategy="simple",
+            model_kwargs={"cache_dir": str(settings.transformers_cache)},
         )
 
         logger.info(f"✓ Successfully downloaded {settings.hf_ner_model}")
@@ -84,6 +93,28 @@ def download_models():
         logger.error(f"✗ Failed to download HuggingFace NER model: {e}")
         return False
 
+    return True
+
+
+def download_models():
+    """Download all required models."""
+    logger.info("="* 60)
+    logger.info("Downloading Pre-trained Models")
+    logger.info("=" * 60)
+
+    # Ensure directories exist
+    settings.ensure_dirs()
+    settings.ensure_hf_env()
+
+    # Downloads are network-bound, so fetch all models concurrently
+    downloaders = [download_summarization_model, download_spacy_model, download_hf_ner_model]
+    with ThreadPoolExecutor(max_workers=len(downloaders)) as executor:
+        futures = [executor.submit(download) for download in downloaders]
+        results = [future.result() for future in futures]
+
+    if not all(results):
+        return False
+
     logger.info("\n" + "=" * 60)
     logger.info("All models downloaded successfully!")
     logger.info("=" * 60)
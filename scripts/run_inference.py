@@ -51,6 +51,13 @@ def main():
         "--meeting-id", type=str, default=None, help="Optional meeting identifier"
     )
 
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=8,
+        help="Number of transcripts to summarize per batch (directory mode)",
+    )
+
     args = parser.parse_args()
 
     logger.info("=" * 60)
@@ -101,19 +108,12 @@ def main():
 
         logger.info(f"Found {len(transcript_files)} transcript files")
 
-        for i, transcript_file in enumerate(transcript_files, 1):
-            logger.info(f"\n[{i}/{len(transcript_files)}] Processing: {transcript_file.name}")
-
-            meeting_id = transcript_file.stem
-            output_dir = args.output / meeting_id
+        results = pipeline.process_batch(
+            transcript_files, output_dir=args.output, batch_size=args.batch_size
+        )
 
-            try:
-                pipeline.process_file(
-                    input_path=transcript_file, output_dir=output_dir, meeting_id=meeting_id
-                )
-                logger.info(f"  ✓ Completed: {transcript_file.name}")
-            except Exception as e:
-                logger.error(f"  ✗ Failed: {transcript_file.name} - {e}")
+        for result in results:
+            logger.info(f"  ✓ Completed: {result['meeting_id']}")
 
         logger.info("\n" + "=" * 60)
         logger.info("Batch inference completed!")
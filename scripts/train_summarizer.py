@@ -70,7 +70,7 @@ def main():
 
     # Load base model
     logger.info(f"\nLoading base model: {settings.summarization_model}")
-    model, tokenizer = load_base_model()
+    model, tokenizer = load_base_model(for_training=True)
 
     # Prepare dataset
     logger.info(f"\nPreparing dataset from {args.data_dir}")
@@ -14,6 +14,32 @@ from src.utils.io import save_json, save_markdown
 from src.utils.logger import logger
 
 
+class TranscriptFileWriter:
+    """Append recognized utterances to an open text file, tracking counts."""
+
+    def __init__(self, file):
+        """
+        Initialize writer.
+
+        Args:
+            file: Text file opened for writing
+        """
+        self.file = file
+        self.char_count = 0
+        self.word_count = 0
+
+    def __call__(self, text: str) -> None:
+        """Write one utterance, space-separated from the previous one."""
+        if self.char_count:
+            self.file.write(" ")
+            self.char_count += 1
+        self.file.write(text)
+        self.file.flush()  # Allow tailing the transcript while recognition runs
+
+        self.char_count += len(text)
+        self.word_count += len(text.split())
+
+
 def main():
     """Main transcription function."""
     parser = argparse.ArgumentParser(description="Transcribe audio files using Azure Speech")
@@ -54,35 +80,56 @@ def main():
     # Ensure output directory exists
     args.output.mkdir(parents=True, exist_ok=True)
 
+    meeting_id = args.audio.stem
+    txt_path = args.output / f"{meeting_id}_transcript.txt"
+
     # Transcribe
     try:
+        # In continuous mode the text transcript is written as it is recognized
+        stream_to_file = args.continuous and args.format in ["txt", "both"]
+
         if args.continuous:
             logger.info("Using continuous recognition mode...")
 
             def on_partial(text):
                 logger.info(f"Partial: {text[:100]}...")
 
-            transcript = AzureSpeechTranscriber.transcribe_audio_file_continuous(
-                str(args.audio), on_partial=on_partial
-            )
+            if stream_to_file:
+                with open(txt_path, "w", encoding="utf-8") as f:
+                    writer = TranscriptFileWriter(f)
+                    AzureSpeechTranscriber.transcribe_audio_file_continuous(
+                        str(args.audio), on_partial=on_partial, on_final=writer
+                    )
+                char_count = writer.char_count
+                word_count = writer.word_count
+                # JSON output needs the full text; read it back once
+                transcript = (
+                    txt_path.read_text(encoding="utf-8") if args.format == "both" else None
+                )
+            else:
+                transcript = AzureSpeechTranscriber.transcribe_audio_file_continuous(
+                    str(args.audio), on_partial=on_partial
+                )
         else:
             logger.info("Using single-shot recognition mode...")
             transcript = AzureSpeechTranscriber.transcribe_audio_file(str(args.audio))
 
-        if not transcript:
+        if not stream_to_file:
+            char_count = len(transcript)
+            word_count = len(transcript.split())
+
+        if not char_count:
             logger.warning("No transcript generated")
             return 1
 
-        logger.info(f"\nTranscript length: {len(transcript)} characters")
-        logger.info(f"Word count: {len(transcript.split())}")
+        logger.info(f"\nTranscript length: {char_count} characters")
+        logger.info(f"Word count: {word_count}")
 
         # Save outputs
-        meeting_id = args.audio.stem
-
         if args.format in ["txt", "both"]:
-            txt_path = args.output / f"{meeting_id}_transcript.txt"
-            with open(txt_path, "w", encoding="utf-8") as f:
-                f.write(transcript)
+            if not stream_to_file:
+                with open(txt_path, "w", encoding="utf-8") as f:
+                    f.write(transcript)
             logger.info(f"Saved text transcript: {txt_path}")
 
         if args.format in ["json", "both"]:
@@ -90,8 +137,8 @@ def main():
                 "meeting_id": meeting_id,
                 "audio_file": str(args.audio),
                 "transcript": transcript,
-                "character_count": len(transcript),
-                "word_count": len(transcript.split()),
+                "character_count": char_count,
+                "word_count": word_count,
                 "language": settings.azure_speech_language,
             }
             json_path = args.output / f"{meeting_id}_transcript.json"
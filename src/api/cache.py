@@ -0,0 +1,82 @@
+"""In-memory cache for summarization results."""
+
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+
+class ResponseCache:
+    """LRU cache with time-based expiry, keyed on transcript content."""
+
+    def __init__(self, maxsize: int = 1024, ttl: int = 3600):
+        """
+        Initialize response cache.
+
+        Args:
+            maxsize: Maximum number of cached results (0 disables caching)
+            ttl: Time-to-live for cached results in seconds
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[bytes, Tuple[float, Dict]]" = OrderedDict()
+
+    @staticmethod
+    def make_key(transcript: str) -> bytes:
+        """
+        Compute the cache key for a transcript.
+
+        Args:
+            transcript: Transcript text
+
+        Returns:
+            16-byte BLAKE2b digest of the transcript
+        """
+        return hashlib.blake2b(transcript.encode("utf-8"), digest_size=16).digest()
+
+    def get(self, key: bytes) -> Optional[Dict]:
+        """
+        Get a cached result.
+
+        Args:
+            key: Cache key from make_key
+
+        Returns:
+            Cached result, or None if missing or expired
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: bytes, value: Dict) -> None:
+        """
+        Cache a result, evicting the least recently used entry if full.
+
+        Args:
+            key: Cache key from make_key
+            value: Result to cache
+        """
+        if self.maxsize <= 0:
+            return
+
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached results."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        """Return the number of cached results."""
+        return len(self._entries)
@@ -2,11 +2,14 @@
 
 import tempfile
 from pathlib import Path
+from typing import Dict, Optional
 
 from fastapi import APIRouter, File, HTTPException, UploadFile
 from fastapi.responses import JSONResponse
+from starlette.concurrency import run_in_threadpool
 
 from src import __version__
+from src.api.cache import ResponseCache
 from src.api.schemas import (
     HealthResponse,
     SummarizeRequest,
@@ -15,6 +18,7 @@ from src.api.schemas import (
 )
 from src.config import settings
 from src.transcription.azure_stt import AzureSpeechTranscriber
+from src.utils.io import parse_transcript
 from src.utils.logger import logger
 
 # Import global pipeline from main
@@ -22,6 +26,106 @@ from src.api import main
 
 router = APIRouter()
 
+# Uploads are read in chunks of this size (bytes)
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Pipeline results keyed on transcript content (e.g. for replays and webhook retries)
+response_cache = ResponseCache(
+    maxsize=settings.response_cache_size, ttl=settings.response_cache_ttl
+)
+
+
+async def _spool_upload(file: UploadFile, suffix: str) -> Path:
+    """
+    Stream an uploaded file to a temporary file without buffering it in memory.
+
+    Args:
+        file: Uploaded file
+        suffix: Suffix for the temporary file
+
+    Returns:
+        Path to the temporary file (caller is responsible for deleting it)
+    """
+    tmp_file = tempfile.NamedTemporaryFile(mode="wb", delete=False, suffix=suffix)
+    try:
+        while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+            await run_in_threadpool(tmp_file.write, chunk)
+    except Exception:
+        tmp_file.close()
+        Path(tmp_file.name).unlink(missing_ok=True)
+        raise
+    tmp_file.close()
+    return Path(tmp_file.name)
+
+
+async def _read_upload(file: UploadFile, max_bytes: int) -> bytes:
+    """
+    Read an uploaded file into memory, rejecting bodies larger than max_bytes.
+
+    Args:
+        file: Uploaded file
+        max_bytes: Maximum accepted size in bytes
+
+    Returns:
+        File content
+
+    Raises:
+        HTTPException: 413 if the upload exceeds max_bytes
+    """
+    too_large = HTTPException(
+        status_code=413, detail=f"File too large. Maximum size is {max_bytes} bytes"
+    )
+
+    # Reject early when the size is known up front
+    if file.size is not None and file.size > max_bytes:
+        raise too_large
+
+    content = bytearray()
+    while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+        content.extend(chunk)
+        if len(content) > max_bytes:
+            raise too_large
+
+    return bytes(content)
+
+
+async def _process_transcript(
+    transcript: str, meeting_id: str, metadata: Optional[Dict] = None
+) -> Dict:
+    """
+    Run the summarization pipeline off the event loop.
+
+    Inference is CPU/GPU-bound, so it runs in the threadpool while the
+    semaphore caps the number of concurrent inferences. Results are cached
+    by transcript content, so repeated transcripts skip inference.
+
+    Args:
+        transcript: Raw transcript text
+        meeting_id: Meeting identifier
+        metadata: Optional metadata dictionary
+
+    Returns:
+        Pipeline result dictionary
+    """
+    key = response_cache.make_key(transcript)
+
+    cached = response_cache.get(key)
+    if cached is not None:
+        logger.info(f"Serving cached result for meeting: {meeting_id}")
+        return {**cached, "meeting_id": meeting_id, "metadata": metadata or {}}
+
+    async with main.inference_semaphore:
+        result = await run_in_threadpool(
+            main.pipeline.process_transcript,
+            transcript=transcript,
+            meeting_id=meeting_id,
+            metadata=metadata,
+        )
+
+    response_cache.set(key, dict(result))
+
+    return result
+
 
 @router.post("/summarize", response_model=SummarizeResponse)
 async def summarize_transcript(request: SummarizeRequest):
@@ -44,7 +148,7 @@ async def summarize_transcript(request: SummarizeRequest):
         logger.info(f"Processing summarization request for meeting: {request.meeting_id}")
 
         # Process transcript
-        result = main.pipeline.process_transcript(
+        result = await _process_transcript(
             transcript=request.transcript,
             meeting_id=request.meeting_id or "api_request",
             metadata=request.metadata or {},
@@ -95,28 +199,20 @@ async def summarize_file(
             status_code=400, detail="Invalid file type. Only .txt and .json are supported"
         )
 
+    content = await _read_upload(file, settings.max_upload_bytes)
+
     try:
         logger.info(f"Processing uploaded file: {file.filename}")
 
-        # Save uploaded file to temp location
-        with tempfile.NamedTemporaryFile(
-            mode="wb", delete=False, suffix=Path(file.filename).suffix
-        ) as tmp_file:
-            content = await file.read()
-            tmp_file.write(content)
-            tmp_path = tmp_file.name
-
-        # Read and process
-        from src.utils.io import load_transcript
-
-        transcript = load_transcript(tmp_path)
+        # Parse directly from memory
+        transcript = parse_transcript(content, Path(file.filename).suffix)
 
         # Use filename as meeting_id if not provided
         if meeting_id is None:
             meeting_id = Path(file.filename).stem
 
         # Process
-        result = main.pipeline.process_transcript(
+        result = await _process_transcript(
             transcript=transcript, meeting_id=meeting_id, metadata={"filename": file.filename}
         )
 
@@ -129,9 +225,6 @@ async def summarize_file(
 
         result["compression_ratio"] = compression_ratio
 
-        # Cleanup temp file
-        Path(tmp_path).unlink()
-
         logger.info(f"Successfully processed file: {file.filename}")
 
         return result
@@ -161,23 +254,20 @@ async def upload_audio(file: UploadFile = File(...), meeting_id: str = None):
     try:
         logger.info(f"Processing audio upload: {file.filename}")
 
-        # Save uploaded file
-        with tempfile.NamedTemporaryFile(
-            mode="wb", delete=False, suffix=Path(file.filename).suffix
-        ) as tmp_file:
-            content = await file.read()
-            tmp_file.write(content)
-            tmp_path = tmp_file.name
+        # Stream uploaded file to temp location
+        tmp_path = await _spool_upload(file, suffix=Path(file.filename).suffix)
 
         # Transcribe using Azure Speech
-        transcript = AzureSpeechTranscriber.transcribe_audio_file(tmp_path)
+        transcript = await run_in_threadpool(
+            AzureSpeechTranscriber.transcribe_audio_file, str(tmp_path)
+        )
 
         if not transcript:
             raise HTTPException(status_code=500, detail="Transcription failed")
 
         # Generate summary if pipeline loaded
         if main.pipeline:
-            result = main.pipeline.process_transcript(
+            result = await _process_transcript(
                 transcript=transcript,
                 meeting_id=meeting_id or Path(file.filename).stem,
             )
@@ -188,7 +278,7 @@ async def upload_audio(file: UploadFile = File(...), meeting_id: str = None):
             entities = {}
 
         # Cleanup
-        Path(tmp_path).unlink()
+        tmp_path.unlink()
 
         return {
             "meeting_id": meeting_id or Path(file.filename).stem,
@@ -1,14 +1,27 @@
 """FastAPI application main file."""
 
+import asyncio
+import os
 from contextlib import asynccontextmanager
 
+# Let the Rust tokenizers backend use multiple threads for batched calls;
+# must be set before transformers is imported
+os.environ.setdefault("TOKENIZERS_PARALLELISM", "true")
+
+# Let the CUDA caching allocator grow segments in place instead of fragmenting
+# across requests of varying length; must be set before CUDA is initialized
+os.environ.setdefault("PYTORCH_CUDA_ALLOC_CONF", "expandable_segments:True")
+
+import torch
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from src import __version__
 from src.config import settings
 from src.pipelines.end_to_end import MeetingSummarizationPipeline
-from src.summarization.model_loader import load_finetuned_model
+from src.summarization.inference import warmup_generate
+from src.summarization.model_loader import compile_model, load_finetuned_model
 from src.utils.logger import logger
 
 # Global variables for models (loaded at startup)
@@ -16,6 +29,9 @@ pipeline: MeetingSummarizationPipeline = None
 model = None
 tokenizer = None
 
+# Bounds how many requests run the (blocking) pipeline at once
+inference_semaphore = asyncio.Semaphore(settings.max_concurrent_inferences)
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -32,6 +48,16 @@ async def lifespan(app: FastAPI):
         # Load summarization model
         model, tokenizer = load_finetuned_model()
 
+        # Compile once at startup so requests don't pay the trace cost
+        if settings.torch_compile:
+            model = compile_model(model)
+
+        # Warm up at the longest and a typical input length, so the compiled
+        # dynamic-shape graph and the GPU memory pool are in place before serving
+        if settings.torch_compile or torch.cuda.is_available():
+            warmup_generate(model, tokenizer, num_words=settings.max_input_length)
+            warmup_generate(model, tokenizer, num_words=128)
+
         # Initialize pipeline
         pipeline = MeetingSummarizationPipeline(
             model=model, tokenizer=tokenizer, ner_backend=settings.ner_backend
@@ -55,6 +81,7 @@ app = FastAPI(
     description="AI-powered meeting transcript summarization with NER extraction",
     version=__version__,
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # Add CORS middleware
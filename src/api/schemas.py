@@ -56,3 +56,15 @@ class HealthResponse(BaseModel):
     model_loaded: bool
     ner_backend: str
     version: str
+    azure_speech_enabled: bool = False
+    teams_integration_enabled: bool = False
+
+
+class AudioUploadResponse(BaseModel):
+    """Response schema for /meetings/upload-audio endpoint."""
+
+    meeting_id: str
+    transcript: str
+    summary: str
+    entities: Dict
+    audio_file: str
@@ -1,12 +1,16 @@
 """Central configuration module using Pydantic settings."""
 
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Literal
 
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+# Whether the HuggingFace cache environment variables have been set in this process
+_HF_ENV_APPLIED = False
+
 
 class Settings(BaseSettings):
     """Application settings with environment variable support."""
@@ -30,6 +34,9 @@ class Settings(BaseSettings):
     ner_backend: Literal["spacy", "huggingface"] = Field(default="spacy")
     spacy_model: str = Field(default="en_core_web_sm")
     hf_ner_model: str = Field(default="dslim/bert-base-NER")
+    low_cpu_mem_usage: bool = Field(default=True)  # mmap weights instead of copying
+    quantize_int8: bool = Field(default=False)  # int8 dynamic quantization on CPU
+    torch_compile: bool = Field(default=False)  # torch.compile the model at API startup
 
     # Training hyperparameters
     learning_rate: float = Field(default=5e-5)
@@ -43,6 +50,9 @@ class Settings(BaseSettings):
     eval_steps: int = Field(default=100)
     save_steps: int = Field(default=500)
     save_total_limit: int = Field(default=3)
+    gradient_checkpointing: bool = Field(default=False)  # less activation memory, more compute
+    train_torch_compile: bool = Field(default=False)  # torch.compile the model for training
+    dataloader_num_workers: int = Field(default=2)
 
     # Inference parameters
     num_beams: int = Field(default=4)
@@ -52,10 +62,17 @@ class Settings(BaseSettings):
     min_summary_length: int = Field(default=30)
     max_summary_length: int = Field(default=200)
 
+    # Preprocessing
+    clean_cache_size: int = Field(default=0)  # memoized clean_transcript results; 0 disables
+
     # API configuration
     api_host: str = Field(default="0.0.0.0")
     api_port: int = Field(default=8000)
     api_workers: int = Field(default=1)
+    max_upload_bytes: int = Field(default=50 * 1024 * 1024)  # transcript uploads
+    max_concurrent_inferences: int = Field(default=1)
+    response_cache_size: int = Field(default=1024)  # 0 disables caching
+    response_cache_ttl: int = Field(default=3600)  # seconds
     cors_origins: List[str] = Field(
         default=["http://localhost:3000", "http://localhost:8501"]
     )
@@ -82,6 +99,7 @@ class Settings(BaseSettings):
     teams_client_secret: str = Field(default="")
     teams_tenant_id: str = Field(default="")
     teams_redirect_uri: str = Field(default="http://localhost:8000/auth/callback")
+    teams_token_cache: Path = Field(default=".cache/teams_token_cache.json")  # MSAL tokens
 
     # Real-time streaming settings
     streaming_buffer_size: int = Field(default=500)  # words
@@ -116,10 +134,31 @@ class Settings(BaseSettings):
             self.hf_home = self.project_root / self.hf_home
         if not self.transformers_cache.is_absolute():
             self.transformers_cache = self.project_root / self.transformers_cache
-
-        # Set environment variables for HuggingFace cache
-        os.environ["HF_HOME"] = str(self.hf_home)
-        os.environ["TRANSFORMERS_CACHE"] = str(self.transformers_cache)
+        if not self.teams_token_cache.is_absolute():
+            self.teams_token_cache = self.project_root / self.teams_token_cache
+
+    def ensure_hf_env(self) -> None:
+        """
+        Point the HuggingFace cache environment variables at the configured directories.
+
+        Called by the model loaders before loading HF models; only the first
+        call in a process touches os.environ. HF libraries read these variables
+        when they are imported, which may already have happened, so the loaders
+        also pass cache_dir explicitly; the variables still reach subprocesses
+        and HF libraries imported later.
+        """
+        global _HF_ENV_APPLIED
+        if _HF_ENV_APPLIED:
+            return
+        _HF_ENV_APPLIED = True
+
+        # Only write when the value differs, since each write goes through putenv
+        for name, value in (
+            ("HF_HOME", str(self.hf_home)),
+            ("TRANSFORMERS_CACHE", str(self.transformers_cache)),
+        ):
+            if os.environ.get(name) != value:
+                os.environ[name] = value
 
     def ensure_dirs(self) -> None:
         """Create necessary directories if they don't exist."""
@@ -136,5 +175,32 @@ class Settings(BaseSettings):
             directory.mkdir(parents=True, exist_ok=True)
 
 
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Get the application settings, creating them on first call.
+
+    Returns:
+        Cached Settings instance
+    """
+    return Settings()
+
+
+class _LazySettings:
+    """Proxy that defers creating Settings until an attribute is first accessed."""
+
+    def __getattr__(self, name):
+        return getattr(get_settings(), name)
+
+    def __setattr__(self, name, value):
+        setattr(get_settings(), name, value)
+
+    def __delattr__(self, name):
+        delattr(get_settings(), name)
+
+    def __repr__(self) -> str:
+        return repr(get_settings())
+
+
 # Global settings instance
-settings = Settings()
+settings = _LazySettings()
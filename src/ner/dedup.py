@@ -0,0 +1,49 @@
+"""Entity deduplication helpers shared by the NER backends."""
+
+import re
+import string
+from typing import Dict
+
+# Labels the backends use for organizations
+ORG_LABELS = {"ORG", "ORGANIZATION"}
+
+# Trailing corporate suffixes, e.g. "Microsoft Corp." or "Acme, Inc."
+_ORG_SUFFIX_RE = re.compile(r"[\s,]+(?:corp|corporation|inc|incorporated|ltd|llc|co)\.?$")
+
+_STRIP_CHARS = string.punctuation + string.whitespace
+
+
+def identity_key(text: str, label: str) -> str:
+    """
+    Normalize an entity mention so that trivial variants share one key.
+
+    Lowercases, collapses whitespace, strips surrounding punctuation and, for
+    organizations, drops common corporate suffixes. "Microsoft", "microsoft"
+    and "Microsoft Corp." all map to "microsoft".
+
+    Args:
+        text: Entity surface text
+        label: Entity label
+
+    Returns:
+        Identity key for the entity
+    """
+    key = " ".join(text.lower().split()).strip(_STRIP_CHARS)
+
+    if label in ORG_LABELS:
+        key = _ORG_SUFFIX_RE.sub("", key).strip(_STRIP_CHARS)
+
+    return key or text
+
+
+def most_common_form(surface_counts: Dict[str, int]) -> str:
+    """
+    Pick the display text for a group of deduplicated mentions.
+
+    Args:
+        surface_counts: Mapping of surface forms to occurrence counts, in first-seen order
+
+    Returns:
+        Most frequent surface form (earliest seen on ties)
+    """
+    return max(surface_counts, key=surface_counts.get)
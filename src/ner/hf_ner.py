@@ -1,99 +1,186 @@
 """HuggingFace-based Named Entity Recognition."""
 
+import heapq
 from collections import defaultdict
-from typing import Dict, List
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional, Tuple
 
+import torch
 from transformers import pipeline
 
 from src.config import settings
+from src.ner.dedup import identity_key, most_common_form
 from src.utils.logger import logger
 
+# Map common HF labels to standard labels
+_LABEL_MAP = {
+    "PER": "PERSON",
+    "LOC": "LOCATION",
+    "ORG": "ORGANIZATION",
+    "MISC": "MISCELLANEOUS",
+}
+
+
+@lru_cache(maxsize=4)
+def _get_hf_pipeline(model_name: str):
+    """
+    Load a HuggingFace NER pipeline, reusing it across HuggingFaceNER instances.
+
+    Args:
+        model_name: HuggingFace model name
+
+    Returns:
+        Token classification pipeline
+    """
+    return pipeline(
+        "ner",
+        model=model_name,
+        aggregation_strategy="simple",  # Aggregate sub-tokens
+        device=0 if torch.cuda.is_available() else -1,
+        # Passed explicitly: HF reads HF_HOME when it is imported, which may
+        # happen before settings.ensure_hf_env() runs
+        model_kwargs={"cache_dir": str(settings.transformers_cache)},
+    )
+
+
+def _chunk(text: str, max_chars: int = 1800, overlap: int = 200) -> Iterator[Tuple[int, str]]:
+    """
+    Split text into overlapping windows that fit within the NER model's input length.
+
+    Args:
+        text: Input text
+        max_chars: Maximum window length in characters
+        overlap: Number of characters shared by consecutive windows
+
+    Yields:
+        Tuples of (offset of the window in text, window text)
+    """
+    step = max_chars - overlap
+    offset = 0
+    while True:
+        yield offset, text[offset : offset + max_chars]
+        if offset + max_chars >= len(text):
+            break
+        offset += step
+
 
 class HuggingFaceNER:
     """NER using HuggingFace token classification models."""
 
-    def __init__(self, model_name: str = None):
+    def __init__(self, model_name: str = None, batch_size: int = 8):
         """
         Initialize HuggingFace NER.
 
         Args:
             model_name: HuggingFace model name (default: from settings)
+            batch_size: Number of text windows per forward pass
         """
         self.model_name = model_name or settings.hf_ner_model
+        self.batch_size = batch_size
+        settings.ensure_hf_env()
 
         logger.info(f"Loading HuggingFace NER model: {self.model_name}")
-        self.pipeline = pipeline(
-            "ner",
-            model=self.model_name,
-            aggregation_strategy="simple",  # Aggregate sub-tokens
-        )
+        self.pipeline = _get_hf_pipeline(self.model_name)
         logger.info("HuggingFace NER model loaded successfully")
 
-    def extract_entities(self, text: str) -> Dict[str, List[Dict]]:
+    def extract_entities(self, text: str, top_k: Optional[int] = None) -> Dict[str, List[Dict]]:
         """
         Extract named entities from text.
 
         Args:
             text: Input text
+            top_k: Only return the top_k most frequent entities per type (default: all)
 
         Returns:
             Dictionary mapping entity types to lists of entity information
         """
-        # Run NER pipeline
-        results = self.pipeline(text)
+        # Run NER pipeline over overlapping windows, batched
+        chunks = list(_chunk(text))
+        chunk_results = self.pipeline(
+            [window for _, window in chunks], batch_size=self.batch_size
+        )
 
-        # Group entities by type
-        entities_by_type = defaultdict(list)
+        # Aggregate count, score sum, up to 3 examples and surface forms per
+        # (label, identity key) in one pass, so trivial variants are merged
+        aggregated = {}
 
-        for entity in results:
+        for entity, start, end in self._iter_chunk_entities(chunks, chunk_results):
             # Map HuggingFace labels to standard labels
             label = self._normalize_label(entity["entity_group"])
-
-            entity_info = {
-                "text": entity["word"].strip(),
-                "label": label,
-                "score": entity["score"],
-                "start": entity["start"],
-                "end": entity["end"],
-            }
-            entities_by_type[label].append(entity_info)
-
-        # Deduplicate and count frequencies
-        result = {}
-        for label, entities in entities_by_type.items():
-            # Count occurrences
-            entity_counts = defaultdict(int)
-            entity_examples = defaultdict(list)
-            entity_scores = defaultdict(list)
-
-            for ent in entities:
-                entity_text = ent["text"]
-                entity_counts[entity_text] += 1
-                entity_scores[entity_text].append(ent["score"])
-
-                if len(entity_examples[entity_text]) < 3:  # Keep up to 3 examples
-                    entity_examples[entity_text].append(
-                        {"start": ent["start"], "end": ent["end"]}
-                    )
-
-            # Format results
-            result[label] = [
+            entity_text = entity["word"].strip()
+            key = (label, identity_key(entity_text, label))
+
+            slot = aggregated.get(key)
+            if slot is None:
+                aggregated[key] = [1, entity["score"], [(start, end)], {entity_text: 1}]
+            else:
+                slot[0] += 1
+                slot[1] += entity["score"]
+                if len(slot[2]) < 3:  # Keep up to 3 examples
+                    slot[2].append((start, end))
+                slot[3][entity_text] = slot[3].get(entity_text, 0) + 1
+
+        # Group by type, displaying the most frequent surface form
+        entities_by_type = defaultdict(list)
+        for (label, _), (count, score_sum, examples, surface_counts) in aggregated.items():
+            entities_by_type[label].append(
                 {
-                    "entity": entity_text,
+                    "entity": most_common_form(surface_counts),
                     "count": count,
-                    "avg_confidence": sum(entity_scores[entity_text])
-                    / len(entity_scores[entity_text]),
-                    "examples": entity_examples[entity_text],
+                    "avg_confidence": score_sum / count,
+                    "examples": [{"start": start, "end": end} for start, end in examples],
                 }
-                for entity_text, count in sorted(
-                    entity_counts.items(), key=lambda x: x[1], reverse=True
-                )
-            ]
+            )
+
+        # Sort by frequency; a heap suffices when only the top_k are wanted
+        if top_k is None:
+            result = {
+                label: sorted(entities, key=lambda x: x["count"], reverse=True)
+                for label, entities in entities_by_type.items()
+            }
+        else:
+            result = {
+                label: heapq.nlargest(top_k, entities, key=lambda x: x["count"])
+                for label, entities in entities_by_type.items()
+            }
 
-        logger.info(f"Extracted {sum(len(v) for v in result.values())} unique entities")
+        logger.info(f"Extracted {len(aggregated)} unique entities")
 
         return dict(result)
 
+    @staticmethod
+    def _iter_chunk_entities(
+        chunks: List[Tuple[int, str]], chunk_results: List[List[Dict]]
+    ) -> Iterator[Tuple[Dict, int, int]]:
+        """
+        Map per-window entities back onto the full text.
+
+        Offsets are shifted by each window's position. Entities in the region
+        shared by two windows are kept from whichever window they start closest
+        to the middle of, so each entity is counted once and never cut off.
+
+        Args:
+            chunks: (offset, window text) tuples from _chunk
+            chunk_results: Pipeline output for each window
+
+        Yields:
+            Tuples of (pipeline entity, start, end) with offsets into the full text
+        """
+        for i, ((offset, window), entities) in enumerate(zip(chunks, chunk_results)):
+            # Boundaries halfway through the overlap with the neighbouring windows
+            lower = 0
+            if i > 0:
+                prev_offset, prev_window = chunks[i - 1]
+                lower = (offset + prev_offset + len(prev_window)) // 2
+            upper = float("inf")
+            if i + 1 < len(chunks):
+                upper = (chunks[i + 1][0] + offset + len(window)) // 2
+
+            for entity in entities:
+                start = entity["start"] + offset
+                if lower <= start < upper:
+                    yield entity, start, entity["end"] + offset
+
     def get_entity_summary(self, text: str) -> Dict[str, int]:
         """
         Get a summary count of entities by type.
@@ -118,15 +205,7 @@ class HuggingFaceNER:
         Returns:
             Normalized label
         """
-        # Map common HF labels to standard labels
-        label_map = {
-            "PER": "PERSON",
-            "LOC": "LOCATION",
-            "ORG": "ORGANIZATION",
-            "MISC": "MISCELLANEOUS",
-        }
-
         # Remove B-, I- prefixes if present
         clean_label = label.replace("B-", "").replace("I-", "")
 
-        return label_map.get(clean_label, clean_label)
+        return _LABEL_MAP.get(clean_label, clean_label)
@@ -1,14 +1,36 @@
 """spaCy-based Named Entity Recognition."""
 
+import heapq
 from collections import defaultdict
-from typing import Dict, List
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
 
 import spacy
 from spacy.language import Language
+from spacy.tokens import Doc
 
 from src.config import settings
+from src.ner.dedup import identity_key, most_common_form
 from src.utils.logger import logger
 
+# Pipeline components not needed for entity extraction
+SPACY_DISABLED_PIPES = ["tagger", "parser", "lemmatizer", "attribute_ruler"]
+
+
+@lru_cache(maxsize=4)
+def _load_spacy(model_name: str, disable: Tuple[str, ...]) -> Language:
+    """
+    Load a spaCy model, reusing it across SpacyNER instances.
+
+    Args:
+        model_name: spaCy model name
+        disable: Pipeline components to disable
+
+    Returns:
+        Loaded spaCy pipeline
+    """
+    return spacy.load(model_name, disable=list(disable))
+
 
 class SpacyNER:
     """NER using spaCy models."""
@@ -23,8 +45,11 @@ class SpacyNER:
         self.model_name = model_name or settings.spacy_model
 
         try:
-            self.nlp: Language = spacy.load(self.model_name)
-            logger.info(f"Loaded spaCy model: {self.model_name}")
+            self.nlp: Language = _load_spacy(self.model_name, tuple(SPACY_DISABLED_PIPES))
+            logger.info(
+                f"Loaded spaCy model: {self.model_name} "
+                f"(active pipes: {', '.join(self.nlp.pipe_names)})"
+            )
         except OSError:
             logger.error(
                 f"spaCy model '{self.model_name}' not found. "
@@ -32,59 +57,102 @@ class SpacyNER:
             )
             raise
 
-    def extract_entities(self, text: str) -> Dict[str, List[Dict]]:
+        # Components batched NER needs; everything else is skipped in extract_entities_batch
+        self._ner_pipes = [
+            name for name in self.nlp.pipe_names if name in ("tok2vec", "transformer", "ner")
+        ]
+
+    def extract_entities(self, text: str, top_k: Optional[int] = None) -> Dict[str, List[Dict]]:
         """
         Extract named entities from text.
 
         Args:
             text: Input text
+            top_k: Only return the top_k most frequent entities per type (default: all)
 
         Returns:
             Dictionary mapping entity types to lists of entity information
         """
-        doc = self.nlp(text)
+        return self._aggregate_entities(self.nlp(text), top_k)
 
-        # Group entities by type
-        entities_by_type = defaultdict(list)
+    def extract_entities_batch(
+        self, texts: Iterable[str], batch_size: int = 32, top_k: Optional[int] = None
+    ) -> List[Dict[str, List[Dict]]]:
+        """
+        Extract named entities from several texts using batched spaCy processing.
+
+        Args:
+            texts: Input texts
+            batch_size: Number of texts per spaCy batch
+            top_k: Only return the top_k most frequent entities per type (default: all)
+
+        Returns:
+            One entities dictionary per input text, in input order
+        """
+        with self.nlp.select_pipes(enable=self._ner_pipes):
+            results = [
+                self._aggregate_entities(doc, top_k)
+                for doc in self.nlp.pipe(texts, batch_size=batch_size, n_process=1)
+            ]
+
+        logger.info(f"Extracted entities from {len(results)} texts")
+
+        return results
+
+    @staticmethod
+    def _aggregate_entities(doc: Doc, top_k: Optional[int] = None) -> Dict[str, List[Dict]]:
+        """
+        Group a document's entities by type, counting repeated mentions.
+
+        Args:
+            doc: Processed spaCy document
+            top_k: Only keep the top_k most frequent entities per type (default: all)
+
+        Returns:
+            Dictionary mapping entity types to lists of entity information
+        """
+        # Aggregate count, up to 3 examples and surface forms per
+        # (label, identity key) in one pass, so trivial variants are merged
+        aggregated = {}
 
         for ent in doc.ents:
-            entity_info = {
-                "text": ent.text,
-                "label": ent.label_,
-                "start": ent.start_char,
-                "end": ent.end_char,
-            }
-            entities_by_type[ent.label_].append(entity_info)
-
-        # Deduplicate and count frequencies
-        result = {}
-        for label, entities in entities_by_type.items():
-            # Count occurrences
-            entity_counts = defaultdict(int)
-            entity_examples = defaultdict(list)
-
-            for ent in entities:
-                entity_counts[ent["text"]] += 1
-                if len(entity_examples[ent["text"]]) < 3:  # Keep up to 3 examples
-                    entity_examples[ent["text"]].append(
-                        {"start": ent["start"], "end": ent["end"]}
-                    )
-
-            # Format results
-            result[label] = [
+            key = (ent.label_, identity_key(ent.text, ent.label_))
+
+            slot = aggregated.get(key)
+            if slot is None:
+                aggregated[key] = [1, [(ent.start_char, ent.end_char)], {ent.text: 1}]
+            else:
+                slot[0] += 1
+                if len(slot[1]) < 3:  # Keep up to 3 examples
+                    slot[1].append((ent.start_char, ent.end_char))
+                slot[2][ent.text] = slot[2].get(ent.text, 0) + 1
+
+        # Group by type, displaying the most frequent surface form
+        entities_by_type = defaultdict(list)
+        for (label, _), (count, examples, surface_counts) in aggregated.items():
+            entities_by_type[label].append(
                 {
-                    "entity": entity_text,
+                    "entity": most_common_form(surface_counts),
                     "count": count,
-                    "examples": entity_examples[entity_text],
+                    "examples": [{"start": start, "end": end} for start, end in examples],
                 }
-                for entity_text, count in sorted(
-                    entity_counts.items(), key=lambda x: x[1], reverse=True
-                )
-            ]
+            )
+
+        # Sort by frequency; a heap suffices when only the top_k are wanted
+        if top_k is None:
+            result = {
+                label: sorted(entities, key=lambda x: x["count"], reverse=True)
+                for label, entities in entities_by_type.items()
+            }
+        else:
+            result = {
+                label: heapq.nlargest(top_k, entities, key=lambda x: x["count"])
+                for label, entities in entities_by_type.items()
+            }
 
-        logger.info(f"Extracted {sum(len(v) for v in result.values())} unique entities")
+        logger.info(f"Extracted {len(aggregated)} unique entities")
 
-        return dict(result)
+        return result
 
     def get_entity_summary(self, text: str) -> Dict[str, int]:
         """
@@ -1,6 +1,10 @@
 """Unified NER interface with backend switching."""
 
-from typing import Dict, List, Literal
+import copy
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Literal, Optional
 
 from src.config import settings
 from src.ner.hf_ner import HuggingFaceNER
@@ -11,15 +15,23 @@ from src.utils.logger import logger
 class NERExtractor:
     """Unified interface for NER with switchable backends."""
 
-    def __init__(self, backend: Literal["spacy", "huggingface"] = None):
+    def __init__(
+        self, backend: Literal["spacy", "huggingface"] = None, cache_size: int = 32
+    ):
         """
         Initialize NER extractor with specified backend.
 
         Args:
             backend: NER backend to use ('spacy' or 'huggingface').
                     If None, uses settings.ner_backend
+            cache_size: Number of recent texts whose entities are cached (0 disables caching)
         """
         self.backend = backend or settings.ner_backend
+        self.cache_size = cache_size
+        self._cache: OrderedDict = OrderedDict()  # (text digest, top_k) -> entities
+        # The extractor is shared across threads (API threadpool, batch executor,
+        # realtime pipeline), so cache reads and writes are serialized
+        self._cache_lock = threading.Lock()
 
         logger.info(f"Initializing NER with backend: {self.backend}")
 
@@ -32,17 +44,89 @@ class NERExtractor:
                 f"Invalid NER backend: {self.backend}. Must be 'spacy' or 'huggingface'"
             )
 
-    def extract_entities(self, text: str) -> Dict[str, List[Dict]]:
+    def extract_entities(self, text: str, top_k: Optional[int] = None) -> Dict[str, List[Dict]]:
         """
         Extract named entities from text.
 
+        Results for recently seen texts are served from an LRU cache keyed on
+        a digest of the text, so re-running NER on the same transcript is free.
+
         Args:
             text: Input text
+            top_k: Only return the top_k most frequent entities per type (default: all)
 
         Returns:
             Dictionary mapping entity types to lists of entity information
         """
-        return self.ner.extract_entities(text)
+        key = self._cache_key(text, top_k)
+
+        entities = self._cache_get(key)
+        if entities is None:
+            entities = self.ner.extract_entities(text, top_k=top_k)
+            self._cache_put(key, entities)
+
+        return entities
+
+    def extract_entities_batch(
+        self, texts: List[str], top_k: Optional[int] = None
+    ) -> List[Dict[str, List[Dict]]]:
+        """
+        Extract named entities from several texts.
+
+        Cached texts are served from the LRU cache; the rest go through the
+        backend's batched path (spaCy's nlp.pipe) when it has one.
+
+        Args:
+            texts: Input texts
+            top_k: Only return the top_k most frequent entities per type (default: all)
+
+        Returns:
+            One entities dictionary per input text, in input order
+        """
+        keys = [self._cache_key(text, top_k) for text in texts]
+        results = [self._cache_get(key) for key in keys]
+
+        missing = [i for i, entities in enumerate(results) if entities is None]
+        if missing:
+            missing_texts = [texts[i] for i in missing]
+            extract_batch = getattr(self.ner, "extract_entities_batch", None)
+            if extract_batch is not None:
+                fresh = extract_batch(missing_texts, top_k=top_k)
+            else:
+                fresh = [self.ner.extract_entities(text, top_k=top_k) for text in missing_texts]
+
+            for i, entities in zip(missing, fresh):
+                results[i] = entities
+                self._cache_put(keys[i], entities)
+
+        return results
+
+    @staticmethod
+    def _cache_key(text: str, top_k: Optional[int]) -> tuple:
+        """Build the cache key for a text: a digest of its content plus top_k."""
+        return (hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest(), top_k)
+
+    def _cache_get(self, key: tuple) -> Optional[Dict[str, List[Dict]]]:
+        """Return a copy of the cached entities for key, marking them most recently used."""
+        with self._cache_lock:
+            entities = self._cache.get(key)
+            if entities is None:
+                return None
+            self._cache.move_to_end(key)
+
+        # Callers get their own copy, so they cannot mutate the cached entry
+        return copy.deepcopy(entities)
+
+    def _cache_put(self, key: tuple, entities: Dict[str, List[Dict]]) -> None:
+        """Cache a copy of entities for key, evicting the least recently used entries."""
+        if self.cache_size <= 0:
+            return
+
+        entities = copy.deepcopy(entities)
+        with self._cache_lock:
+            self._cache[key] = entities
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
 
     def get_entity_summary(self, text: str) -> Dict[str, int]:
         """
@@ -54,7 +138,8 @@ class NERExtractor:
         Returns:
             Dictionary mapping entity types to counts
         """
-        return self.ner.get_entity_summary(text)
+        entities = self.extract_entities(text)
+        return {label: len(ents) for label, ents in entities.items()}
 
     def format_entities(self, entities: Dict[str, List[Dict]]) -> Dict:
         """
@@ -91,3 +176,15 @@ class NERExtractor:
         """
         entities = self.extract_entities(text)
         return self.format_entities(entities)
+
+    def extract_and_format_batch(self, texts: List[str]) -> List[Dict]:
+        """
+        Extract entities from several texts and return formatted output for each.
+
+        Args:
+            texts: Input texts
+
+        Returns:
+            Formatted entities dictionaries, in input order
+        """
+        return [self.format_entities(entities) for entities in self.extract_entities_batch(texts)]
@@ -1,16 +1,24 @@
 """End-to-end pipeline for meeting summarization."""
 
+import io
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Optional, Union
+from typing import Dict, List, Optional, Union
 
 from transformers import AutoModelForSeq2SeqLM, AutoTokenizer
 
 from src.ner.unified_ner import NERExtractor
 from src.preprocess.cleaner import clean_transcript
-from src.summarization.inference import generate_summary
-from src.utils.io import load_transcript, save_json, save_markdown
+from src.summarization.inference import batch_generate, generate_summary
+from src.utils.io import load_transcript, save_bundle
 from src.utils.logger import logger
 
+# Summarization and NER are independent, so they run side by side; torch and
+# spaCy both release the GIL for their heavy lifting
+_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="pipeline")
+
 
 class MeetingSummarizationPipeline:
     """End-to-end pipeline for meeting transcript summarization."""
@@ -58,13 +66,19 @@ class MeetingSummarizationPipeline:
         logger.info("Step 1/3: Cleaning transcript...")
         cleaned_transcript = clean_transcript(transcript)
 
-        # Step 2: Generate summary
+        # Steps 2 and 3: Generate summary and extract entities concurrently
         logger.info("Step 2/3: Generating summary...")
-        summary = generate_summary(cleaned_transcript, self.model, self.tokenizer)
+        summary_future = _EXECUTOR.submit(
+            generate_summary, cleaned_transcript, self.model, self.tokenizer
+        )
 
-        # Step 3: Extract entities
         logger.info("Step 3/3: Extracting named entities...")
-        entities = self.ner_extractor.extract_and_format(cleaned_transcript)
+        entities_future = _EXECUTOR.submit(
+            self.ner_extractor.extract_and_format, cleaned_transcript
+        )
+
+        summary = summary_future.result()
+        entities = entities_future.result()
 
         # Compile results
         result = {
@@ -118,31 +132,154 @@ class MeetingSummarizationPipeline:
 
         return result
 
-    def _save_outputs(self, result: Dict, output_dir: Path) -> None:
+    def process_batch(
+        self,
+        input_paths: List[Union[str, Path]],
+        output_dir: Union[str, Path],
+        batch_size: int = 8,
+    ) -> List[Dict]:
         """
-        Save pipeline outputs to files.
+        Process multiple transcript files with batched summary generation.
+
+        A background thread loads and cleans the next batch of files while
+        the current batch is being summarized, so file I/O overlaps with
+        generate(). Outputs for each file are saved to output_dir/<meeting_id>,
+        using the filename as meeting_id.
 
         Args:
-            result: Pipeline result dictionary
-            output_dir: Output directory
+            input_paths: Paths to transcript files (.txt or .json)
+            output_dir: Base directory to save outputs
+            batch_size: Number of transcripts per generate() call
+
+        Returns:
+            List of result dictionaries for successfully processed files
         """
+        input_paths = [Path(p) for p in input_paths]
         output_dir = Path(output_dir)
-        output_dir.mkdir(parents=True, exist_ok=True)
 
-        meeting_id = result["meeting_id"]
+        logger.info(f"Processing {len(input_paths)} files (batch_size={batch_size})")
+
+        # Double buffer: at most two prepared batches wait while one is generated
+        batches: queue.Queue = queue.Queue(maxsize=2)
+
+        def produce_batches() -> None:
+            batch = []
+            try:
+                for path in input_paths:
+                    try:
+                        transcript = load_transcript(path)
+                        cleaned_transcript = clean_transcript(transcript)
+                    except Exception as e:
+                        logger.error(f"Failed to load {path.name}: {e}")
+                        continue
+
+                    batch.append((path, transcript, cleaned_transcript))
+                    if len(batch) == batch_size:
+                        batches.put(batch)
+                        batch = []
+
+                if batch:
+                    batches.put(batch)
+            finally:
+                # Always release the consumer, even if the producer fails
+                batches.put(None)
+
+        producer = threading.Thread(target=produce_batches, daemon=True)
+        producer.start()
+
+        results = []
+        while (batch := batches.get()) is not None:
+            summaries = self._summarize_batch(batch, batch_size)
+            batch = [item for item, summary in zip(batch, summaries) if summary is not None]
+            summaries = [summary for summary in summaries if summary is not None]
+            if not batch:
+                continue
+
+            cleaned = [cleaned_transcript for _, _, cleaned_transcript in batch]
+            try:
+                # One nlp.pipe pass over the batch instead of one call per file
+                batch_entities = self.ner_extractor.extract_and_format_batch(cleaned)
+            except Exception as e:
+                logger.error(f"Batched NER failed, falling back to per-file NER: {e}")
+                batch_entities = [None] * len(batch)
+
+            for (path, transcript, cleaned_transcript), summary, entities in zip(
+                batch, summaries, batch_entities
+            ):
+                meeting_id = path.stem
+                try:
+                    if entities is None:
+                        entities = self.ner_extractor.extract_and_format(cleaned_transcript)
+
+                    result = {
+                        "meeting_id": meeting_id,
+                        "summary": summary,
+                        "entities": entities,
+                        "metadata": {},
+                        "transcript_length": len(transcript),
+                        "cleaned_transcript_length": len(cleaned_transcript),
+                        "summary_length": len(summary),
+                    }
+
+                    self._save_outputs(result, output_dir / meeting_id)
+                    results.append(result)
+                except Exception as e:
+                    logger.error(f"Failed to process {path.name}: {e}")
+
+        producer.join()
+
+        logger.info(f"Batch processing complete: {len(results)}/{len(input_paths)} files")
+
+        return results
+
+    def _summarize_batch(self, batch: List[tuple], batch_size: int) -> List[Optional[str]]:
+        """
+        Summarize a prepared batch, falling back to one file at a time on failure.
+
+        A single bad input (or a CUDA OOM on a long batch) would otherwise fail
+        every file in the batch, so the batch is retried file by file.
+
+        Args:
+            batch: (path, transcript, cleaned_transcript) tuples
+            batch_size: Number of transcripts per generate() call
 
-        # Save full output as JSON
-        full_output_path = output_dir / "full_output.json"
-        save_json(result, full_output_path)
+        Returns:
+            Summary for each file, or None for files that failed
+        """
+        cleaned = [cleaned_transcript for _, _, cleaned_transcript in batch]
 
-        # Save entities as separate JSON
-        entities_path = output_dir / "entities.json"
-        save_json(result["entities"], entities_path)
+        try:
+            return batch_generate(cleaned, self.model, self.tokenizer, batch_size=batch_size)
+        except Exception as e:
+            logger.error(f"Batched generation failed, falling back to per-file generation: {e}")
 
-        # Generate and save Markdown summary
-        markdown_content = self._generate_markdown_summary(result)
-        summary_path = output_dir / "summary.md"
-        save_markdown(markdown_content, summary_path)
+        summaries = []
+        for path, _, cleaned_transcript in batch:
+            try:
+                summaries.append(generate_summary(cleaned_transcript, self.model, self.tokenizer))
+            except Exception as e:
+                logger.error(f"Failed to summarize {path.name}: {e}")
+                summaries.append(None)
+
+        return summaries
+
+    def _save_outputs(self, result: Dict, output_dir: Path) -> None:
+        """
+        Save pipeline outputs to files.
+
+        Args:
+            result: Pipeline result dictionary
+            output_dir: Output directory
+        """
+        # Full output, entities and a Markdown summary, written in one go
+        save_bundle(
+            output_dir,
+            {
+                "full_output.json": result,
+                "entities.json": result["entities"],
+                "summary.md": self._generate_markdown_summary(result),
+            },
+        )
 
         logger.info(f"Outputs saved to {output_dir}")
 
@@ -161,52 +298,39 @@ class MeetingSummarizationPipeline:
         entities = result["entities"]
 
         # Build markdown
-        lines = []
-
-        # Title
-        lines.append(f"# Meeting Summary: {meeting_id}")
-        lines.append("")
+        buf = io.StringIO()
+        write = buf.write
 
-        # Summary section
-        lines.append("## Summary")
-        lines.append("")
-        lines.append(summary)
-        lines.append("")
+        # Title and summary section
+        write(f"# Meeting Summary: {meeting_id}\n\n## Summary\n\n{summary}\n\n")
 
         # Entities section
-        lines.append("## Named Entities")
-        lines.append("")
-        lines.append(
+        write(
+            "## Named Entities\n\n"
             f"**Total Unique Entities:** {entities['total_unique_entities']} "
-            f"(extracted using {entities['backend']})"
+            f"(extracted using {entities['backend']})\n\n"
         )
-        lines.append("")
 
         for entity_type in sorted(entities["entities_by_type"].keys()):
             entity_list = entities["entities_by_type"][entity_type]
             if entity_list:
-                lines.append(f"### {entity_type}")
-                lines.append("")
+                write(f"### {entity_type}\n\n")
                 for item in entity_list[:10]:  # Show top 10 per type
-                    entity_name = item["entity"]
-                    count = item["count"]
-                    lines.append(f"- **{entity_name}** (mentioned {count} time(s))")
-                lines.append("")
+                    write(f"- **{item['entity']}** (mentioned {item['count']} time(s))\n")
+                write("\n")
 
         # Metadata section
-        lines.append("## Metadata")
-        lines.append("")
-        lines.append(f"- **Original Transcript Length:** {result['transcript_length']} characters")
-        lines.append(
-            f"- **Cleaned Transcript Length:** {result['cleaned_transcript_length']} characters"
-        )
-        lines.append(f"- **Summary Length:** {result['summary_length']} characters")
         compression_ratio = (
             result["summary_length"] / result["transcript_length"] * 100
             if result["transcript_length"] > 0
             else 0
         )
-        lines.append(f"- **Compression Ratio:** {compression_ratio:.1f}%")
-        lines.append("")
+        write(
+            "## Metadata\n\n"
+            f"- **Original Transcript Length:** {result['transcript_length']} characters\n"
+            f"- **Cleaned Transcript Length:** {result['cleaned_transcript_length']} characters\n"
+            f"- **Summary Length:** {result['summary_length']} characters\n"
+            f"- **Compression Ratio:** {compression_ratio:.1f}%\n"
+        )
 
-        return "\n".join(lines)
+        return buf.getvalue()
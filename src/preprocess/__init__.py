@@ -7,8 +7,13 @@ from src.preprocess.cleaner import (
 )
 from src.preprocess.segmenter import (
     TranscriptSegment,
+    TranscriptSegments,
+    iter_segments,
+    iter_teams_messages,
     parse_teams_format,
+    segment_by_known_speakers,
     segment_by_speaker,
+    segment_by_speaker_batch,
     segment_by_time,
 )
 
@@ -17,7 +22,12 @@ __all__ = [
     "normalize_speaker_names",
     "remove_filler_words",
     "TranscriptSegment",
+    "TranscriptSegments",
     "segment_by_speaker",
+    "iter_segments",
+    "segment_by_speaker_batch",
+    "segment_by_known_speakers",
     "segment_by_time",
     "parse_teams_format",
+    "iter_teams_messages",
 ]
@@ -1,34 +1,123 @@
 """Text cleaning utilities for transcript preprocessing."""
 
 import re
+from functools import lru_cache
+
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+from src.config import settings
+
+# Patterns are compiled once at import rather than on every call
+_MULTISPACE_RE = re.compile(r" {2,}")
+_MULTINEWLINE_RE = re.compile(r"\n{3,}")
+_SPECIAL_RE = re.compile(r"[^\w\s\.\,\!\?\:\;\-\[\]\(\)@\$\%\/]")
+
+# Common OCR mistakes, fixed in a single scan
+_OCR_MAP = {"l1": "li", "0n": "on"}
+_OCR_RE = re.compile("|".join(_OCR_MAP))
+
+# (literal every match contains, pattern, replacement). Applied in order, since a
+# later pattern may match the output of an earlier one.
+_SPEAKER_REPLACEMENTS = [
+    ("(", re.compile(r"(\w+)\s+\(.*?\):"), r"\1:"),  # Remove titles in parentheses
+    ("-", re.compile(r"(\w+)\s+-\s+"), r"\1: "),  # Replace dash with colon
+    ("[", re.compile(r"\[[\d:APM\s]+\]\s+(\w+\s+\w+):"), r"\1:"),  # Remove timestamps
+]
+
+# All filler words in a single alternation so the text is scanned once.
+# "like" is kept when followed by a proper noun.
+if re2 is not None:
+    # RE2 matches in linear time but has no lookahead, so the "like" check
+    # moves into the replacement callback
+    _FILLERS_RE = re2.compile(r"(?i)\b(?:um+|uh+|like|you know|I mean|kind of|sort of)\b")
+    _KEEP_LIKE_RE = re.compile(r"\s+[A-Z]", re.IGNORECASE)
+
+    def _filler_replacement(match) -> str:
+        """Drop a matched filler word unless it is "like" before a proper noun."""
+        word = match.group(0)
+        if word.lower() == "like" and _KEEP_LIKE_RE.match(match.string, match.end()):
+            return word
+        return ""
+
+else:
+    _FILLERS_RE = re.compile(
+        r"\b(?:um+|uh+|like(?!\s+[A-Z])|you know|I mean|kind of|sort of)\b",
+        re.IGNORECASE,
+    )
+    _filler_replacement = ""
+
+
+# Memoized _clean_transcript, built on first use from settings.clean_cache_size
+_clean_cache = None
 
 
 def clean_transcript(text: str) -> str:
     """
     Clean transcript text by removing noise and normalizing whitespace.
 
+    Results are optionally memoized for workloads that re-process identical
+    transcripts (e.g. re-summarization). The cache size is read from
+    settings.clean_cache_size on every call; 0 (the default) disables caching
+    so one-off calls don't hold on to text.
+
+    Args:
+        text: Raw transcript text
+
+    Returns:
+        Cleaned transcript text
+    """
+    cache_size = settings.clean_cache_size
+    if cache_size <= 0:
+        return _clean_transcript(text)
+    return _get_clean_cache(cache_size)(text)
+
+
+def _get_clean_cache(cache_size: int):
+    """
+    Return the memoized cleaner, rebuilding it if the configured size changed.
+
+    Args:
+        cache_size: Maximum number of cached results
+
+    Returns:
+        lru_cache-wrapped _clean_transcript
+    """
+    global _clean_cache
+    if _clean_cache is None or _clean_cache.cache_parameters()["maxsize"] != cache_size:
+        _clean_cache = lru_cache(maxsize=cache_size)(_clean_transcript)
+    return _clean_cache
+
+
+def _clean_transcript(text: str) -> str:
+    """
+    Uncached implementation of clean_transcript.
+
     Args:
         text: Raw transcript text
 
     Returns:
         Cleaned transcript text
     """
+    # Passes below are skipped when a substring check (much cheaper than a
+    # regex scan) shows they cannot match, which is common on clean transcripts
+
     # Remove multiple spaces
-    text = re.sub(r" {2,}", " ", text)
+    if "  " in text:
+        text = _MULTISPACE_RE.sub(" ", text)
 
     # Remove multiple newlines (keep at most 2)
-    text = re.sub(r"\n{3,}", "\n\n", text)
+    if "\n\n\n" in text:
+        text = _MULTINEWLINE_RE.sub("\n\n", text)
 
     # Fix common OCR errors
-    text = text.replace("l1", "li")  # Common OCR mistake
-    text = text.replace("0n", "on")
+    if "l1" in text or "0n" in text:
+        text = _OCR_RE.sub(lambda m: _OCR_MAP[m.group(0)], text)
 
     # Remove special characters that don't add meaning
-    text = re.sub(r"[^\w\s\.\,\!\?\:\;\-\[\]\(\)@\$\%\/]", "", text)
-
-    # Normalize quotation marks
-    text = text.replace(""", '"').replace(""", '"')
-    text = text.replace("'", "'").replace("'", "'")
+    text = _SPECIAL_RE.sub("", text)
 
     # Strip leading/trailing whitespace
     text = text.strip()
@@ -49,15 +138,10 @@ def normalize_speaker_names(text: str) -> str:
     Returns:
         Transcript with normalized speaker names
     """
-    # Common variations
-    replacements = {
-        r"(\w+)\s+\(.*?\):": r"\1:",  # Remove titles in parentheses
-        r"(\w+)\s+-\s+": r"\1: ",  # Replace dash with colon
-        r"\[[\d:APM\s]+\]\s+(\w+\s+\w+):": r"\1:",  # Remove timestamps in brackets
-    }
-
-    for pattern, replacement in replacements.items():
-        text = re.sub(pattern, replacement, text)
+    # Common variations; a substring check is far cheaper than a regex scan
+    for literal, pattern, replacement in _SPEAKER_REPLACEMENTS:
+        if literal in text:
+            text = pattern.sub(replacement, text)
 
     return text
 
@@ -72,20 +156,9 @@ def remove_filler_words(text: str) -> str:
     Returns:
         Text with filler words removed
     """
-    fillers = [
-        r"\bum+\b",
-        r"\buh+\b",
-        r"\blike\b(?!\s+[A-Z])",  # Keep "like" when followed by proper noun
-        r"\byou know\b",
-        r"\bI mean\b",
-        r"\bkind of\b",
-        r"\bsort of\b",
-    ]
-
-    for filler in fillers:
-        text = re.sub(filler, "", text, flags=re.IGNORECASE)
+    text = _FILLERS_RE.sub(_filler_replacement, text)
 
     # Clean up extra spaces created by removals
-    text = re.sub(r" {2,}", " ", text)
+    text = _MULTISPACE_RE.sub(" ", text)
 
     return text
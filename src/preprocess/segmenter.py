@@ -1,13 +1,65 @@
 """Transcript segmentation utilities."""
 
+import bisect
 import re
-from datetime import datetime
-from typing import Dict, List, Optional
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, time
+from functools import lru_cache, partial
+from typing import BinaryIO, Dict, Iterator, List, Optional, Sequence, Union
+
+import orjson
+
+from src.config import settings
+from src.utils.io import iter_teams_export_messages
+from src.utils.logger import logger
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Speaker names start with a capital and may contain letters (accented ones
+# included), spaces, periods, apostrophes and hyphens, e.g. "Kevin O'Brien"
+_SPEAKER_NAME = r"[A-ZÀ-ÖØ-Þ](?:[^\W\d_]|[ .'’\-]){0,64}"
+
+# Speaker turns are "[timestamp] Speaker Name: text" or "Speaker Name: text" at the
+# start of a line, running until the next line that starts a turn. The
+# timestamp/speaker parts are bounded, which keeps backtracking linear.
+_TURN_BOUNDARY_RE = re.compile(rf"^(?:\[|{_SPEAKER_NAME}:)", re.MULTILINE)
+_TURN_HEAD_RE = re.compile(
+    rf"(?:\[(?P<ts>[^\]]{{1,64}})\]\s+)?(?P<spk>{_SPEAKER_NAME}):[ \t]*"
+)
+
+# Optional "[timestamp] " between a line start and a known speaker name
+_TIMESTAMP_PREFIX_RE = re.compile(r"\[(?P<ts>[^\]]{1,64})\]\s+")
+
+# With use_ner_fallback, transcripts at least this long fall back to spaCy speaker
+# detection when the speaker pattern finds at most one turn
+_NER_FALLBACK_MIN_CHARS = 500
+
+# Only this leading slice of the transcript is scanned for speaker names, which
+# keeps the fallback fast and well under spaCy's nlp.max_length
+_NER_FALLBACK_MAX_CHARS = 100_000
+
+# Supported timestamp formats, grouped by shape
+_TIMESTAMP_FORMATS_12H = ("%I:%M %p", "%I:%M:%S %p")  # 10:15 AM, 10:15:30 AM
+_TIMESTAMP_FORMATS_24H = ("%H:%M", "%H:%M:%S")  # 14:30, 14:30:45
+_TIMESTAMP_FORMATS_ISO = ("%Y-%m-%dT%H:%M:%S",)  # ISO format
+_TIMESTAMP_FORMATS = _TIMESTAMP_FORMATS_12H + _TIMESTAMP_FORMATS_24H + _TIMESTAMP_FORMATS_ISO
+
+# Fast path for the common HH:MM[:SS][ AM|PM] shapes
+_TIME_RE = re.compile(r"(\d{1,2}):(\d{2})(?::(\d{2}))?(?: ([AaPp][Mm]))?")
+
+# Format that parsed the previous timestamp; transcripts rarely mix formats
+_last_timestamp_format: Optional[str] = None
 
 
 class TranscriptSegment:
     """Represents a segment of transcript."""
 
+    __slots__ = ("speaker", "text", "timestamp", "start_line")
+
     def __init__(
         self,
         speaker: str,
@@ -39,7 +91,229 @@ class TranscriptSegment:
         }
 
 
-def segment_by_speaker(text: str) -> List[TranscriptSegment]:
+class TranscriptSegments:
+    """
+    Transcript segments stored column-wise.
+
+    Keeps one list per field instead of one object per turn, which is much
+    cheaper for long meetings. It behaves like a list of TranscriptSegment:
+    indexing and iteration yield segment views whose attribute writes go back
+    to the columns, slicing returns a new TranscriptSegments, and append()
+    takes a TranscriptSegment.
+    """
+
+    __slots__ = ("speakers", "texts", "timestamps", "start_lines")
+
+    def __init__(self):
+        """Initialize an empty set of segments."""
+        self.speakers: List[str] = []
+        self.texts: List[str] = []
+        self.timestamps: List[Optional[str]] = []
+        self.start_lines: List[Optional[int]] = []
+
+    def add(
+        self,
+        speaker: str,
+        text: str,
+        timestamp: Optional[str] = None,
+        start_line: Optional[int] = None,
+    ) -> None:
+        """
+        Add a segment from its fields, without creating a TranscriptSegment.
+
+        Args:
+            speaker: Speaker name
+            text: Segment text
+            timestamp: Optional timestamp
+            start_line: Optional line number in original transcript
+        """
+        self.speakers.append(speaker)
+        self.texts.append(text)
+        self.timestamps.append(timestamp)
+        self.start_lines.append(start_line)
+
+    def append(self, segment: TranscriptSegment) -> None:
+        """
+        Add a segment.
+
+        Args:
+            segment: Segment to add
+        """
+        self.add(segment.speaker, segment.text, segment.timestamp, segment.start_line)
+
+    def __len__(self) -> int:
+        return len(self.speakers)
+
+    def __getitem__(
+        self, index: Union[int, slice]
+    ) -> Union[TranscriptSegment, "TranscriptSegments"]:
+        if isinstance(index, slice):
+            sliced = TranscriptSegments()
+            sliced.speakers = self.speakers[index]
+            sliced.texts = self.texts[index]
+            sliced.timestamps = self.timestamps[index]
+            sliced.start_lines = self.start_lines[index]
+            return sliced
+        # Normalizes negative indices and raises IndexError when out of range
+        return _SegmentView(self, range(len(self.speakers))[index])
+
+    def __setitem__(self, index: int, segment: TranscriptSegment) -> None:
+        self.speakers[index] = segment.speaker
+        self.texts[index] = segment.text
+        self.timestamps[index] = segment.timestamp
+        self.start_lines[index] = segment.start_line
+
+    def __iter__(self) -> Iterator[TranscriptSegment]:
+        for index in range(len(self.speakers)):
+            yield _SegmentView(self, index)
+
+    def to_dict(self, index: int) -> Dict:
+        """
+        Convert one segment to a dictionary.
+
+        Args:
+            index: Segment index
+
+        Returns:
+            Segment dictionary
+        """
+        return {
+            "speaker": self.speakers[index],
+            "text": self.texts[index],
+            "timestamp": self.timestamps[index],
+            "start_line": self.start_lines[index],
+        }
+
+
+def _column_property(column: str) -> property:
+    """
+    Build a property that reads and writes one TranscriptSegments column.
+
+    Args:
+        column: Column attribute name (e.g. 'speakers')
+
+    Returns:
+        Property for a _SegmentView field
+    """
+
+    def fget(view: "_SegmentView"):
+        return getattr(view._segments, column)[view._index]
+
+    def fset(view: "_SegmentView", value) -> None:
+        getattr(view._segments, column)[view._index] = value
+
+    return property(fget, fset)
+
+
+class _SegmentView(TranscriptSegment):
+    """TranscriptSegment backed by one row of a TranscriptSegments."""
+
+    __slots__ = ("_segments", "_index")
+
+    speaker = _column_property("speakers")
+    text = _column_property("texts")
+    timestamp = _column_property("timestamps")
+    start_line = _column_property("start_lines")
+
+    def __init__(self, segments: TranscriptSegments, index: int):
+        """
+        Initialize a view of one segment.
+
+        Args:
+            segments: Segments holding the data
+            index: Row of the segment (non-negative)
+        """
+        self._segments = segments
+        self._index = index
+
+
+def _speaker_turns(text: str):
+    """
+    Yield (speaker, text, timestamp, start_line) for each speaker turn.
+
+    Args:
+        text: Raw transcript text
+
+    Yields:
+        Turn fields in transcript order
+    """
+    # Every turn needs a colon; skip the scan entirely otherwise
+    if ":" not in text:
+        return
+
+    # Only lines that could start a turn are candidates for the full pattern
+    boundaries = [match.start() for match in _TURN_BOUNDARY_RE.finditer(text)]
+    last = len(boundaries)
+    boundaries.append(len(text))
+
+    line_num = 0
+    i = 0
+    head = None
+    while i < last:
+        if head is None:
+            head = _match_turn_head(text, boundaries[i])
+            if head is None:
+                # Text before the first turn belongs to no speaker
+                i += 1
+                continue
+
+        # The turn runs until the next line that starts a turn. Candidate lines
+        # that don't parse as one (e.g. "[inaudible]") stay part of this turn.
+        i = bisect.bisect_right(boundaries, head.end("spk") + 1, i + 1)
+        next_head = None
+        while i < last:
+            next_head = _match_turn_head(text, boundaries[i])
+            if next_head is not None:
+                break
+            i += 1
+
+        timestamp = head.group("ts")  # Optional timestamp
+        # Interned, so the many turns of one speaker share a single string
+        speaker = sys.intern(head.group("spk").strip())
+        content = text[head.end() : boundaries[i]].strip()
+
+        yield speaker, content, timestamp, line_num
+        line_num += 1
+        head = next_head
+
+
+def _match_turn_head(text: str, pos: int) -> Optional[re.Match]:
+    """
+    Match a speaker turn head ("[timestamp] Speaker Name: ") at a position.
+
+    Args:
+        text: Raw transcript text
+        pos: Start of a candidate line
+
+    Returns:
+        The head match, or None if the line doesn't start a turn or is a
+        speaker label with no text after it
+    """
+    head = _TURN_HEAD_RE.match(text, pos)
+    if head is None or head.end("spk") + 1 >= len(text):
+        return None
+    return head
+
+
+def iter_segments(text: str) -> Iterator[TranscriptSegment]:
+    """
+    Lazily segment transcript by speaker turns.
+
+    Yields the same turns as segment_by_speaker one at a time, so callers that
+    consume segments once never hold them all. There is no spaCy fallback for
+    transcripts the speaker pattern cannot split.
+
+    Args:
+        text: Raw transcript text
+
+    Yields:
+        TranscriptSegment for each turn
+    """
+    for turn in _speaker_turns(text):
+        yield TranscriptSegment(*turn)
+
+
+def segment_by_speaker(text: str, use_ner_fallback: bool = False) -> TranscriptSegments:
     """
     Segment transcript by speaker turns.
 
@@ -50,30 +324,179 @@ def segment_by_speaker(text: str) -> List[TranscriptSegment]:
 
     Args:
         text: Raw transcript text
+        use_ner_fallback: When the speaker pattern finds at most one turn in a
+            long transcript, detect speaker names with spaCy NER instead (e.g.
+            lowercase names). Off by default, since it loads a spaCy model.
 
     Returns:
-        List of TranscriptSegment objects
+        TranscriptSegments with one entry per turn
     """
-    segments = []
+    segments = TranscriptSegments()
+    for turn in _speaker_turns(text):
+        segments.add(*turn)
 
-    # Pattern to match speaker lines
-    # Matches: [timestamp] Speaker Name: text OR Speaker Name: text
-    pattern = r"(?:\[(.*?)\]\s+)?([A-Z][a-zA-Z\s\.]+?):\s*(.+?)(?=(?:\n\[|\n[A-Z][a-zA-Z\s\.]+?:|\Z))"
+    if use_ner_fallback and len(segments) <= 1 and len(text) >= _NER_FALLBACK_MIN_CHARS:
+        speakers = _detect_speakers_with_ner(text)
+        if speakers:
+            ner_segments = segment_by_known_speakers(text, speakers)
+            if len(ner_segments) > len(segments):
+                return ner_segments
 
-    matches = re.finditer(pattern, text, re.DOTALL)
+    return segments
 
-    line_num = 0
-    for match in matches:
-        timestamp = match.group(1)  # Optional timestamp
-        speaker = match.group(2).strip()
-        content = match.group(3).strip()
-
-        segments.append(
-            TranscriptSegment(
-                speaker=speaker, text=content, timestamp=timestamp, start_line=line_num
-            )
+
+def segment_by_speaker_batch(
+    texts: Sequence[str], max_workers: Optional[int] = None, use_ner_fallback: bool = False
+) -> List[TranscriptSegments]:
+    """
+    Segment several transcripts in parallel worker processes.
+
+    Segmentation is regex-bound and holds the GIL, so processes rather than
+    threads are used. Small batches run in-process, where pool startup would
+    cost more than it saves.
+
+    Args:
+        texts: Raw transcript texts
+        max_workers: Maximum worker processes (defaults to the CPU count)
+        use_ner_fallback: Passed to segment_by_speaker; each worker process
+            loads its own spaCy model when enabled
+
+    Returns:
+        Segments for each transcript, in input order
+    """
+    segment = partial(segment_by_speaker, use_ner_fallback=use_ner_fallback)
+    if len(texts) <= 1 or max_workers == 1:
+        return [segment(text) for text in texts]
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(segment, texts, chunksize=8))
+
+
+def _detect_speakers_with_ner(text: str) -> List[str]:
+    """
+    Find speaker names the speaker pattern misses (e.g. lowercase or accented names).
+
+    A PERSON entity counts as a speaker when it starts a line, optionally after
+    a timestamp, and is directly followed by a colon.
+
+    Only the leading _NER_FALLBACK_MAX_CHARS characters (cut at a line break)
+    are scanned; the names found there are then matched across the whole text.
+
+    Args:
+        text: Raw transcript text
+
+    Returns:
+        Detected speaker names in order of first appearance, or an empty list
+        if spaCy or its model is unavailable or the text cannot be processed
+    """
+    # Imported lazily so preprocessing doesn't pay spaCy's import cost up front
+    try:
+        from src.ner.spacy_ner import SPACY_DISABLED_PIPES, _load_spacy
+
+        nlp = _load_spacy(settings.spacy_model, tuple(SPACY_DISABLED_PIPES))
+    except (ImportError, OSError) as e:
+        logger.warning(f"spaCy speaker detection unavailable: {e}")
+        return []
+
+    max_chars = min(_NER_FALLBACK_MAX_CHARS, nlp.max_length)
+    if len(text) > max_chars:
+        cut = text.rfind("\n", 0, max_chars)
+        text = text[: cut if cut > 0 else max_chars]
+
+    try:
+        doc = nlp(text)
+    except ValueError as e:
+        logger.warning(f"spaCy speaker detection failed: {e}")
+        return []
+
+    speakers = {}
+    for ent in doc.ents:
+        if ent.label_ != "PERSON" or not text.startswith(":", ent.end_char):
+            continue
+
+        line_start = text.rfind("\n", 0, ent.start_char) + 1
+        if line_start == ent.start_char or _TIMESTAMP_PREFIX_RE.fullmatch(
+            text, line_start, ent.start_char
+        ):
+            speakers[ent.text] = None
+
+    return list(speakers)
+
+
+def _known_speaker_turns(text: str, speakers: Sequence[str]):
+    """
+    Find turn heads for a closed set of speaker names.
+
+    Uses an Aho-Corasick automaton when pyahocorasick is installed, so all
+    names are matched in a single linear pass, and a regex alternation otherwise.
+
+    Args:
+        text: Transcript text
+        speakers: Known speaker names
+
+    Yields:
+        Tuples of (line start, content start, speaker, timestamp) in text order
+    """
+    if ahocorasick is None:
+        names = "|".join(re.escape(name) for name in sorted(speakers, key=len, reverse=True))
+        pattern = re.compile(
+            rf"^(?:\[(?P<ts>[^\]]{{1,64}})\]\s+)?(?P<spk>{names}):[ \t]*", re.MULTILINE
         )
-        line_num += 1
+        for match in pattern.finditer(text):
+            yield match.start(), match.end(), match.group("spk"), match.group("ts")
+        return
+
+    automaton = ahocorasick.Automaton()
+    for name in speakers:
+        automaton.add_word(f"{name}:", name)
+    automaton.make_automaton()
+
+    for end_idx, name in automaton.iter(text):
+        name_start = end_idx - len(name)
+        line_start = text.rfind("\n", 0, name_start) + 1
+
+        # Names only start a turn at the beginning of a line, after an optional timestamp
+        timestamp = None
+        if line_start != name_start:
+            prefix = _TIMESTAMP_PREFIX_RE.fullmatch(text, line_start, name_start)
+            if prefix is None:
+                continue
+            timestamp = prefix.group("ts")
+
+        content_start = end_idx + 1
+        while content_start < len(text) and text[content_start] in " \t":
+            content_start += 1
+
+        yield line_start, content_start, name, timestamp
+
+
+def segment_by_known_speakers(text: str, speakers: Sequence[str]) -> TranscriptSegments:
+    """
+    Segment transcript by turns of a known set of speakers.
+
+    Faster than segment_by_speaker when the speakers are known up front (e.g.
+    from a Teams export), and only lines starting with one of them begin a turn.
+
+    Args:
+        text: Raw transcript text
+        speakers: Known speaker names
+
+    Returns:
+        TranscriptSegments with one entry per turn
+    """
+    segments = TranscriptSegments()
+
+    speakers = [name for name in dict.fromkeys(speakers) if name]
+    if not speakers or ":" not in text:
+        return segments
+
+    turns = list(_known_speaker_turns(text, speakers))
+
+    for line_num, (_, content_start, speaker, timestamp) in enumerate(turns):
+        # The turn runs until the next turn's line
+        end = turns[line_num + 1][0] if line_num + 1 < len(turns) else len(text)
+
+        segments.add(speaker, text[content_start:end].strip(), timestamp, line_num)
 
     return segments
 
@@ -91,7 +514,7 @@ def segment_by_time(text: str, window_minutes: int = 5) -> List[Dict]:
     """
     segments = segment_by_speaker(text)
 
-    if not segments or not any(s.timestamp for s in segments):
+    if not segments or not any(segments.timestamps):
         # No timestamps, return single segment
         return [{"window": "full", "content": text}]
 
@@ -99,11 +522,11 @@ def segment_by_time(text: str, window_minutes: int = 5) -> List[Dict]:
     current_window = []
     window_start = None
 
-    for segment in segments:
-        if segment.timestamp:
+    for i, segment_timestamp in enumerate(segments.timestamps):
+        if segment_timestamp:
             try:
                 # Parse timestamp (supports multiple formats)
-                timestamp = _parse_timestamp(segment.timestamp)
+                timestamp = _parse_timestamp(segment_timestamp)
 
                 if window_start is None:
                     window_start = timestamp
@@ -119,15 +542,15 @@ def segment_by_time(text: str, window_minutes: int = 5) -> List[Dict]:
                                 "segments": current_window,
                             }
                         )
-                    current_window = [segment.to_dict()]
+                    current_window = [segments.to_dict(i)]
                     window_start = timestamp
                 else:
-                    current_window.append(segment.to_dict())
+                    current_window.append(segments.to_dict(i))
             except ValueError:
                 # Invalid timestamp, add to current window
-                current_window.append(segment.to_dict())
+                current_window.append(segments.to_dict(i))
         else:
-            current_window.append(segment.to_dict())
+            current_window.append(segments.to_dict(i))
 
     # Add final window
     if current_window:
@@ -141,45 +564,109 @@ def segment_by_time(text: str, window_minutes: int = 5) -> List[Dict]:
     return time_windows
 
 
-def parse_teams_format(teams_data: Dict) -> str:
+def _format_teams_time(timestamp: str) -> str:
+    """
+    Format a Teams ISO-8601 timestamp as a 12-hour clock time.
+
+    Args:
+        timestamp: ISO-8601 timestamp, optionally with a "Z" suffix
+
+    Returns:
+        Formatted time, or the timestamp unchanged if it cannot be parsed
+    """
+    if timestamp.endswith("Z"):
+        timestamp_iso = timestamp[:-1] + "+00:00"
+    else:
+        timestamp_iso = timestamp
+
+    try:
+        return datetime.fromisoformat(timestamp_iso).strftime("%I:%M %p")
+    except ValueError:
+        return timestamp
+
+
+def _format_teams_message(message: Dict, formatted_times: Dict[str, str]) -> str:
+    """
+    Format a single Teams message as a transcript line.
+
+    Args:
+        message: Teams message dictionary
+        formatted_times: Cache of formatted times keyed by raw timestamp
+
+    Returns:
+        Transcript line for the message
+    """
+    speaker = message.get("speaker", "Unknown")
+    text = message.get("text", "")
+    timestamp = message.get("timestamp", "")
+
+    if not timestamp:
+        return f"{speaker}: {text}"
+
+    formatted_time = formatted_times.get(timestamp)
+    if formatted_time is None:
+        formatted_time = formatted_times[timestamp] = _format_teams_time(timestamp)
+
+    return f"[{formatted_time}] {speaker}: {text}"
+
+
+def parse_teams_format(teams_data: Union[Dict, str, bytes]) -> str:
     """
     Parse Microsoft Teams export format into plain text transcript.
 
     Args:
-        teams_data: Teams meeting export dictionary
+        teams_data: Teams meeting export, either parsed or as raw JSON (bytes are
+                    parsed directly, without decoding to str first)
 
     Returns:
         Formatted transcript text
+
+    Raises:
+        ValueError: If the export has no 'messages' field
     """
+    if isinstance(teams_data, (str, bytes)):
+        teams_data = orjson.loads(teams_data)
+
     if "messages" not in teams_data:
         raise ValueError("Invalid Teams format: missing 'messages' field")
 
-    transcript_parts = []
+    # Meetings repeat the same timestamps many times, so each is formatted once
+    formatted_times: Dict[str, str] = {}
 
-    for message in teams_data["messages"]:
-        speaker = message.get("speaker", "Unknown")
-        text = message.get("text", "")
-        timestamp = message.get("timestamp", "")
+    return "\n\n".join(
+        [_format_teams_message(message, formatted_times) for message in teams_data["messages"]]
+    )
 
-        if timestamp:
-            # Format timestamp
-            try:
-                dt = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
-                formatted_time = dt.strftime("%I:%M %p")
-            except ValueError:
-                formatted_time = timestamp
 
-            transcript_parts.append(f"[{formatted_time}] {speaker}: {text}")
-        else:
-            transcript_parts.append(f"{speaker}: {text}")
+def iter_teams_messages(fp: BinaryIO) -> Iterator[str]:
+    """
+    Stream transcript lines from a Teams export file without loading it whole.
+
+    Joining the lines with blank lines gives the same text as parse_teams_format.
+    Messages are parsed incrementally with ijson when it is installed (see
+    iter_teams_export_messages), so callers can segment and summarize while
+    the export is still being read.
 
-    return "\n\n".join(transcript_parts)
+    Args:
+        fp: Teams export opened in binary mode
+
+    Yields:
+        Transcript line for each message
+
+    Raises:
+        ValueError: If the export has no 'messages' field
+    """
+    formatted_times: Dict[str, str] = {}
+    for message in iter_teams_export_messages(fp):
+        yield _format_teams_message(message, formatted_times)
 
 
 def _parse_timestamp(timestamp_str: str) -> datetime:
     """
     Parse timestamp string into datetime object.
 
+    Time-only timestamps are placed on today's date.
+
     Args:
         timestamp_str: Timestamp string
 
@@ -189,25 +676,112 @@ def _parse_timestamp(timestamp_str: str) -> datetime:
     Raises:
         ValueError: If timestamp cannot be parsed
     """
-    # Try multiple formats
-    formats = [
-        "%I:%M %p",  # 10:15 AM
-        "%H:%M",  # 14:30
-        "%I:%M:%S %p",  # 10:15:30 AM
-        "%H:%M:%S",  # 14:30:45
-        "%Y-%m-%dT%H:%M:%S",  # ISO format
-    ]
+    parsed = _parse_timestamp_cached(timestamp_str)
+
+    if isinstance(parsed, time):
+        return datetime.combine(datetime.now().date(), parsed)
+
+    return parsed
+
+
+@lru_cache(maxsize=4096)
+def _parse_timestamp_cached(timestamp_str: str) -> Union[datetime, time]:
+    """
+    Parse a timestamp string, memoized since timestamps recur throughout a transcript.
+
+    Args:
+        timestamp_str: Timestamp string
+
+    Returns:
+        datetime for full timestamps, time for time-only formats
+
+    Raises:
+        ValueError: If timestamp cannot be parsed
+    """
+    global _last_timestamp_format
+
+    parsed_time = _fast_parse_time(timestamp_str)
+    if parsed_time is not None:
+        return parsed_time
 
-    for fmt in formats:
+    # Plain "YYYY-MM-DDTHH:MM:SS" only, so the result stays naive like strptime's
+    if len(timestamp_str) == 19 and timestamp_str[10] == "T":
         try:
-            # For time-only formats, use today's date
-            if "%" not in fmt or "Y" not in fmt:
-                today = datetime.now().date()
-                time_obj = datetime.strptime(timestamp_str, fmt).time()
-                return datetime.combine(today, time_obj)
-            else:
-                return datetime.strptime(timestamp_str, fmt)
+            return datetime.fromisoformat(timestamp_str)
+        except ValueError:
+            pass
+
+    for fmt in _candidate_formats(timestamp_str):
+        try:
+            parsed = datetime.strptime(timestamp_str, fmt)
         except ValueError:
             continue
 
+        _last_timestamp_format = fmt
+
+        # Time-only formats carry no date
+        return parsed if "%Y" in fmt else parsed.time()
+
     raise ValueError(f"Unable to parse timestamp: {timestamp_str}")
+
+
+def _fast_parse_time(timestamp_str: str) -> Optional[time]:
+    """
+    Parse HH:MM, HH:MM:SS and their 12-hour AM/PM variants without strptime.
+
+    Args:
+        timestamp_str: Timestamp string
+
+    Returns:
+        time object, or None if the string isn't one of these shapes (callers
+        then fall back to strptime)
+    """
+    match = _TIME_RE.fullmatch(timestamp_str)
+    if match is None:
+        return None
+
+    hour, minute = int(match.group(1)), int(match.group(2))
+    second = int(match.group(3)) if match.group(3) else 0
+    meridiem = match.group(4)
+
+    if meridiem:
+        if not 1 <= hour <= 12:
+            return None
+        hour = hour % 12 + (12 if meridiem.upper() == "PM" else 0)
+    elif hour > 23:
+        return None
+
+    if minute > 59 or second > 59:
+        return None
+
+    return time(hour, minute, second)
+
+
+def _candidate_formats(timestamp_str: str) -> List[str]:
+    """
+    Order timestamp formats so the likeliest match is tried first.
+
+    Formats matching the timestamp's shape (ISO, 12-hour or 24-hour) come
+    first, led by the format that parsed the previous timestamp. The other
+    formats follow as a fallback.
+
+    Args:
+        timestamp_str: Timestamp string
+
+    Returns:
+        Formats to try, in order
+    """
+    if "T" in timestamp_str:
+        preferred = _TIMESTAMP_FORMATS_ISO
+    elif timestamp_str[-2:].upper() in ("AM", "PM"):
+        preferred = _TIMESTAMP_FORMATS_12H
+    else:
+        preferred = _TIMESTAMP_FORMATS_24H
+
+    candidates = list(preferred)
+    if _last_timestamp_format in candidates:
+        candidates.remove(_last_timestamp_format)
+        candidates.insert(0, _last_timestamp_format)
+
+    candidates.extend(fmt for fmt in _TIMESTAMP_FORMATS if fmt not in preferred)
+    return candidates
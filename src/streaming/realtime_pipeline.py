@@ -1,13 +1,14 @@
 """Real-time summarization pipeline for streaming transcripts."""
 
 import asyncio
-from typing import Callable, Dict, Optional
+from collections import Counter, defaultdict
+from typing import Callable, Dict, List, Optional, Tuple
 
 from transformers import AutoModelForSeq2SeqLM, AutoTokenizer
 
 from src.ner.unified_ner import NERExtractor
 from src.streaming.transcript_buffer import TranscriptBuffer
-from src.summarization.inference import generate_summary
+from src.summarization.inference import batch_generate, generate_summary_from_ids
 from src.utils.logger import logger
 
 
@@ -21,6 +22,7 @@ class RealtimeSummarizationPipeline:
         ner_backend: str = "spacy",
         on_chunk_summarized: Optional[Callable[[str, Dict], None]] = None,
         on_entity_extracted: Optional[Callable[[Dict], None]] = None,
+        flush_batch_size: int = 1,
     ):
         """
         Initialize real-time pipeline.
@@ -31,6 +33,8 @@ class RealtimeSummarizationPipeline:
             ner_backend: NER backend to use
             on_chunk_summarized: Callback for chunk summaries (chunk_text, summary_data)
             on_entity_extracted: Callback for extracted entities
+            flush_batch_size: Number of chunks to collect before summarizing them in
+                one batched generate call (trades chunk latency for throughput)
         """
         self.model = model
         self.tokenizer = tokenizer
@@ -39,11 +43,17 @@ class RealtimeSummarizationPipeline:
         self.buffer = TranscriptBuffer()
         self.on_chunk_summarized = on_chunk_summarized
         self.on_entity_extracted = on_entity_extracted
+        self.flush_batch_size = flush_batch_size
+
+        self.pending_chunks: List[str] = []
 
         self.chunk_summaries = []
-        self.all_entities = {}
+        self.all_entities: Dict[str, Counter] = defaultdict(Counter)
         self.complete_transcript = []
 
+        # Token IDs of each chunk summary, kept for the final meta-summary
+        self.summary_token_ids: List[List[int]] = []
+
         logger.info("Real-time summarization pipeline initialized")
 
     async def process_text_async(self, text: str, is_final: bool = False):
@@ -60,43 +70,83 @@ class RealtimeSummarizationPipeline:
         chunk = self.buffer.add_text(text)
 
         if chunk:
-            # Process chunk
-            await self._process_chunk(chunk)
+            self.pending_chunks.append(chunk)
 
-        # If final, process remaining buffer
+        # If final, flush remaining buffer
         if is_final:
             remaining = self.buffer.get_remaining()
             if remaining:
-                await self._process_chunk(remaining)
+                self.pending_chunks.append(remaining)
+
+        if self.pending_chunks and (
+            is_final or len(self.pending_chunks) >= self.flush_batch_size
+        ):
+            await self._process_pending_chunks()
 
+        if is_final:
             # Generate final consolidated summary
             await self._generate_final_summary()
 
-    async def _process_chunk(self, chunk_text: str):
+    async def _process_pending_chunks(self):
+        """Summarize all pending chunks in one batch, then process each of them."""
+        chunks, self.pending_chunks = self.pending_chunks, []
+
+        logger.info(f"Processing {len(chunks)} chunk(s)...")
+
+        # Summarization (model-bound) and NER (CPU-bound) are independent, so overlap them
+        (summaries, token_ids), entities_list = await asyncio.gather(
+            asyncio.to_thread(self._summarize_chunks, chunks, len(self.summary_token_ids)),
+            asyncio.to_thread(
+                lambda: [self.ner_extractor.extract_and_format(chunk) for chunk in chunks]
+            ),
+        )
+
+        self.summary_token_ids.extend(token_ids)
+
+        for chunk_text, summary, entities in zip(chunks, summaries, entities_list):
+            await self._process_chunk(chunk_text, summary, entities)
+
+    def _summarize_chunks(
+        self, chunks: List[str], first_index: int
+    ) -> Tuple[List[str], List[List[int]]]:
         """
-        Process a chunk of transcript.
+        Summarize chunks in one batch and tokenize the summaries for the meta-summary.
 
         Args:
-            chunk_text: Chunk to process
+            chunks: Chunk texts
+            first_index: Position of the first chunk among all chunk summaries
+
+        Returns:
+            Tuple of (summaries, summary token IDs)
         """
-        logger.info(f"Processing chunk ({len(chunk_text)} chars)...")
+        summaries = batch_generate(chunks, self.model, self.tokenizer, batch_size=len(chunks))
 
-        # Generate summary for chunk
-        summary = await asyncio.to_thread(
-            generate_summary, chunk_text, self.model, self.tokenizer
-        )
+        # Summaries are joined with spaces for the meta-summary, so all but the
+        # very first are tokenized with their leading space
+        texts = [
+            summary if first_index + i == 0 else f" {summary}"
+            for i, summary in enumerate(summaries)
+        ]
+        token_ids = self.tokenizer(texts, add_special_tokens=False)["input_ids"]
 
-        # Extract entities
-        entities = await asyncio.to_thread(
-            self.ner_extractor.extract_and_format, chunk_text
-        )
+        return summaries, token_ids
+
+    async def _process_chunk(self, chunk_text: str, summary: str, entities: Dict):
+        """
+        Record a summarized chunk of transcript and notify callbacks.
 
-        # Store results
+        Args:
+            chunk_text: Chunk text
+            summary: Generated summary for the chunk
+            entities: Formatted entities extracted from the chunk
+        """
+        # Store results. Buffer chunks are words joined by single spaces, so
+        # counting spaces gives the word count without building a word list.
         chunk_data = {
             "chunk_number": len(self.chunk_summaries) + 1,
             "summary": summary,
             "entities": entities,
-            "word_count": len(chunk_text.split()),
+            "word_count": chunk_text.count(" ") + 1 if chunk_text else 0,
         }
 
         self.chunk_summaries.append(chunk_data)
@@ -104,12 +154,13 @@ class RealtimeSummarizationPipeline:
         # Merge entities
         self._merge_entities(entities)
 
-        # Notify callbacks
+        # Notify callbacks concurrently
+        callbacks = []
         if self.on_chunk_summarized:
-            await asyncio.to_thread(self.on_chunk_summarized, chunk_text, chunk_data)
-
+            callbacks.append(asyncio.to_thread(self.on_chunk_summarized, chunk_text, chunk_data))
         if self.on_entity_extracted:
-            await asyncio.to_thread(self.on_entity_extracted, entities)
+            callbacks.append(asyncio.to_thread(self.on_entity_extracted, entities))
+        await asyncio.gather(*callbacks)
 
         logger.info(f"Chunk processed: {len(summary)} char summary")
 
@@ -121,34 +172,26 @@ class RealtimeSummarizationPipeline:
             new_entities: New entities to merge
         """
         for entity_type, entity_list in new_entities.get("entities_by_type", {}).items():
-            if entity_type not in self.all_entities:
-                self.all_entities[entity_type] = {}
-
+            counts = self.all_entities[entity_type]
             for entity_info in entity_list:
-                entity_text = entity_info["entity"]
-                if entity_text not in self.all_entities[entity_type]:
-                    self.all_entities[entity_type][entity_text] = entity_info["count"]
-                else:
-                    self.all_entities[entity_type][entity_text] += entity_info["count"]
+                counts[entity_info["entity"]] += entity_info["count"]
 
     async def _generate_final_summary(self):
         """Generate final consolidated summary from all chunks."""
         logger.info("Generating final consolidated summary...")
 
-        # Combine all chunk summaries
-        all_summaries = " ".join([chunk["summary"] for chunk in self.chunk_summaries])
-
-        # Generate meta-summary if we have multiple chunks
+        # Generate meta-summary if we have multiple chunks, reusing the chunk
+        # summaries' token IDs rather than re-tokenizing their concatenation
         if len(self.chunk_summaries) > 1:
             final_summary = await asyncio.to_thread(
-                generate_summary,
-                all_summaries,
+                generate_summary_from_ids,
+                [token_id for ids in self.summary_token_ids for token_id in ids],
                 self.model,
                 self.tokenizer,
                 max_length=300,
             )
         else:
-            final_summary = all_summaries
+            final_summary = " ".join([chunk["summary"] for chunk in self.chunk_summaries])
 
         logger.info(f"Final summary generated ({len(final_summary)} chars)")
 
@@ -171,7 +214,9 @@ class RealtimeSummarizationPipeline:
     def reset(self):
         """Reset pipeline state."""
         self.buffer.clear()
+        self.pending_chunks = []
         self.chunk_summaries = []
-        self.all_entities = {}
+        self.all_entities = defaultdict(Counter)
         self.complete_transcript = []
+        self.summary_token_ids = []
         logger.info("Pipeline reset")
@@ -1,12 +1,31 @@
 """Transcript buffer for real-time streaming."""
 
 from collections import deque
-from typing import List, Optional
+from typing import Iterator, Optional, Tuple
 
 from src.config import settings
 from src.utils.logger import logger
 
 
+def _split_blob(blob: str, count: int) -> Tuple[str, str]:
+    """
+    Split a whitespace-normalized blob after its first count words.
+
+    Blobs hold words joined by single spaces, so a bounded split leaves the
+    tail intact instead of breaking every word out into its own string.
+
+    Args:
+        blob: Words joined by single spaces
+        count: Number of leading words (less than the blob's word count)
+
+    Returns:
+        Tuple of (first count words, remaining words)
+    """
+    parts = blob.split(" ", count)
+    tail = parts.pop()
+    return " ".join(parts), tail
+
+
 class TranscriptBuffer:
     """Buffer management for streaming transcripts with sliding window."""
 
@@ -25,7 +44,10 @@ class TranscriptBuffer:
         self.buffer_size = buffer_size or settings.streaming_buffer_size
         self.overlap = overlap or settings.streaming_overlap
 
+        # Incoming text blobs as (whitespace-normalized text, word count), so
+        # words are only split out when a blob straddles a chunk boundary
         self.buffer: deque = deque()
+        self.buffered_words = 0
         self.total_words = 0
         self.chunks_generated = 0
 
@@ -44,15 +66,27 @@ class TranscriptBuffer:
             Chunk of text if buffer is full, None otherwise
         """
         words = text.split()
-        self.buffer.extend(words)
-        self.total_words += len(words)
+        if words:
+            self.buffer.append((" ".join(words), len(words)))
+            self.buffered_words += len(words)
+            self.total_words += len(words)
 
         # Check if buffer is full
-        if len(self.buffer) >= self.buffer_size:
+        if self.buffered_words >= self.buffer_size:
             return self._extract_chunk()
 
         return None
 
+    def iter_words(self) -> Iterator[str]:
+        """
+        Iterate over the buffered words without joining them into one string.
+
+        Yields:
+            Buffered words in order
+        """
+        for blob, _ in self.buffer:
+            yield from blob.split()
+
     def _extract_chunk(self) -> str:
         """
         Extract a chunk from the buffer and maintain overlap.
@@ -60,23 +94,50 @@ class TranscriptBuffer:
         Returns:
             Chunk of text
         """
-        # Extract words up to buffer_size
-        chunk_words = list(self.buffer)[:self.buffer_size]
-        chunk_text = " ".join(chunk_words)
+        # Take whole blobs up to buffer_size words, splitting only the last one
+        parts = []
+        needed = self.buffer_size
+        for blob, count in self.buffer:
+            if count <= needed:
+                parts.append(blob)
+                needed -= count
+            else:
+                parts.append(_split_blob(blob, needed)[0])
+                needed = 0
+            if needed == 0:
+                break
+        chunk_text = " ".join(parts)
+        chunk_word_count = self.buffer_size - needed
 
         # Remove processed words but keep overlap
-        for _ in range(self.buffer_size - self.overlap):
-            if self.buffer:
-                self.buffer.popleft()
+        self._drop_words(self.buffer_size - self.overlap)
 
         self.chunks_generated += 1
         logger.info(
             f"Generated chunk #{self.chunks_generated} "
-            f"({len(chunk_words)} words, buffer remaining: {len(self.buffer)})"
+            f"({chunk_word_count} words, buffer remaining: {self.buffered_words})"
         )
 
         return chunk_text
 
+    def _drop_words(self, count: int) -> None:
+        """
+        Remove words from the front of the buffer.
+
+        Args:
+            count: Number of words to remove
+        """
+        while count > 0 and self.buffer:
+            blob, blob_count = self.buffer[0]
+            if blob_count <= count:
+                self.buffer.popleft()
+                self.buffered_words -= blob_count
+                count -= blob_count
+            else:
+                self.buffer[0] = (_split_blob(blob, count)[1], blob_count - count)
+                self.buffered_words -= count
+                count = 0
+
     def get_remaining(self) -> Optional[str]:
         """
         Get remaining text in buffer.
@@ -87,15 +148,18 @@ class TranscriptBuffer:
         if not self.buffer:
             return None
 
-        text = " ".join(self.buffer)
+        text = " ".join(blob for blob, _ in self.buffer)
+        word_count = self.buffered_words
         self.buffer.clear()
+        self.buffered_words = 0
 
-        logger.info(f"Flushed remaining buffer ({len(text.split())} words)")
+        logger.info(f"Flushed remaining buffer ({word_count} words)")
         return text
 
     def clear(self):
         """Clear the buffer."""
         self.buffer.clear()
+        self.buffered_words = 0
         self.total_words = 0
         self.chunks_generated = 0
         logger.info("Buffer cleared")
@@ -110,6 +174,6 @@ class TranscriptBuffer:
         return {
             "total_words_processed": self.total_words,
             "chunks_generated": self.chunks_generated,
-            "current_buffer_size": len(self.buffer),
+            "current_buffer_size": self.buffered_words,
             "buffer_capacity": self.buffer_size,
         }
@@ -2,7 +2,7 @@
 
 import asyncio
 import json
-from typing import Dict, Set
+from typing import Dict, List, Set
 
 try:
     import websockets
@@ -11,10 +11,65 @@ except ImportError:
     websockets = None
     WebSocketServerProtocol = None
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from src.config import settings
 from src.utils.logger import logger
 
 
+def _dumps(message: Dict) -> str:
+    """
+    Serialize a message to JSON, using orjson when available.
+
+    The result is decoded to str so clients keep receiving text frames.
+
+    Args:
+        message: Message dictionary
+
+    Returns:
+        JSON string
+    """
+    if orjson is not None:
+        return orjson.dumps(message, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(message)
+
+
+def _loads(message):
+    """
+    Parse an incoming JSON message, using orjson when available.
+
+    Args:
+        message: Raw message (str or bytes)
+
+    Returns:
+        Parsed JSON value
+
+    Raises:
+        json.JSONDecodeError: If the message is not valid JSON
+    """
+    if orjson is not None:
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError
+        return orjson.loads(message)
+    return json.loads(message)
+
+
+# Heartbeats are answered without parsing when they arrive in a canonical form
+_PING_MESSAGES = frozenset(
+    ['{"type":"ping"}', '{"type": "ping"}', b'{"type":"ping"}', b'{"type": "ping"}']
+)
+_PONG_MESSAGE = _dumps({"type": "pong"})
+
+# Longest heartbeat worth checking against _PING_MESSAGES, and longest message logged
+_MAX_PING_LENGTH = 32
+_MAX_LOGGED_MESSAGE_LENGTH = 200
+
+# Number of connection map shards (a power of two, so a shard is picked with a mask)
+CONNECTION_SHARDS = 16
+
+
 class WebSocketServer:
     """WebSocket server for broadcasting real-time updates."""
 
@@ -32,11 +87,28 @@ class WebSocketServer:
         self.host = host
         self.port = port
 
-        # Active connections per meeting
-        self.connections: Dict[str, Set[WebSocketServerProtocol]] = {}
+        # Active connections per meeting, sharded by meeting ID with a lock per
+        # shard so that churn in one meeting doesn't contend with others
+        self._shards: List[Dict[str, Set[WebSocketServerProtocol]]] = [
+            {} for _ in range(CONNECTION_SHARDS)
+        ]
+        self._locks = [asyncio.Lock() for _ in range(CONNECTION_SHARDS)]
 
         logger.info(f"WebSocket server initialized on {host}:{port}")
 
+    def _shard_index(self, meeting_id: str) -> int:
+        """Index of the shard holding a meeting's connections."""
+        return hash(meeting_id) & (CONNECTION_SHARDS - 1)
+
+    @property
+    def connections(self) -> Dict[str, Set[WebSocketServerProtocol]]:
+        """Snapshot of active connections per meeting across all shards."""
+        return {
+            meeting_id: set(conns)
+            for shard in self._shards
+            for meeting_id, conns in shard.items()
+        }
+
     async def register_client(self, websocket: WebSocketServerProtocol, meeting_id: str):
         """
         Register a client connection.
@@ -45,11 +117,13 @@ class WebSocketServer:
             websocket: WebSocket connection
             meeting_id: Meeting ID to subscribe to
         """
-        if meeting_id not in self.connections:
-            self.connections[meeting_id] = set()
+        index = self._shard_index(meeting_id)
+        async with self._locks[index]:
+            conns = self._shards[index].setdefault(meeting_id, set())
+            conns.add(websocket)
+            total = len(conns)
 
-        self.connections[meeting_id].add(websocket)
-        logger.info(f"Client connected to meeting {meeting_id} (total: {len(self.connections[meeting_id])})")
+        logger.info(f"Client connected to meeting {meeting_id} (total: {total})")
 
     async def unregister_client(self, websocket: WebSocketServerProtocol, meeting_id: str):
         """
@@ -59,13 +133,19 @@ class WebSocketServer:
             websocket: WebSocket connection
             meeting_id: Meeting ID
         """
-        if meeting_id in self.connections:
-            self.connections[meeting_id].discard(websocket)
-            logger.info(f"Client disconnected from meeting {meeting_id}")
+        index = self._shard_index(meeting_id)
+        async with self._locks[index]:
+            shard = self._shards[index]
+            if meeting_id not in shard:
+                return
+
+            shard[meeting_id].discard(websocket)
 
             # Clean up empty meeting rooms
-            if not self.connections[meeting_id]:
-                del self.connections[meeting_id]
+            if not shard[meeting_id]:
+                del shard[meeting_id]
+
+        logger.info(f"Client disconnected from meeting {meeting_id}")
 
     async def broadcast_to_meeting(self, meeting_id: str, message: Dict):
         """
@@ -75,31 +155,30 @@ class WebSocketServer:
             meeting_id: Meeting ID
             message: Message dictionary to broadcast
         """
-        if meeting_id not in self.connections:
-            logger.warning(f"No clients connected to meeting {meeting_id}")
-            return
+        index = self._shard_index(meeting_id)
+        async with self._locks[index]:
+            clients = tuple(self._shards[index].get(meeting_id, ()))
 
-        if not self.connections[meeting_id]:
+        if not clients:
+            logger.warning(f"No clients connected to meeting {meeting_id}")
             return
 
         # Convert message to JSON
-        message_json = json.dumps(message)
+        message_json = _dumps(message)
 
-        # Broadcast to all connected clients
-        disconnected = set()
-
-        for websocket in self.connections[meeting_id]:
-            try:
-                await websocket.send(message_json)
-            except Exception as e:
-                logger.error(f"Error sending to client: {e}")
-                disconnected.add(websocket)
+        # Broadcast to all connected clients concurrently (outside the shard lock),
+        # so one slow client doesn't hold up the rest
+        results = await asyncio.gather(
+            *(websocket.send(message_json) for websocket in clients), return_exceptions=True
+        )
 
         # Remove disconnected clients
-        for websocket in disconnected:
-            await self.unregister_client(websocket, meeting_id)
+        for websocket, result in zip(clients, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error sending to client: {result}")
+                await self.unregister_client(websocket, meeting_id)
 
-        logger.debug(f"Broadcasted to {len(self.connections[meeting_id])} clients")
+        logger.debug(f"Broadcasted to {len(self._shards[index].get(meeting_id, ()))} clients")
 
     async def handle_client(self, websocket: WebSocketServerProtocol, path: str):
         """
@@ -124,7 +203,7 @@ class WebSocketServer:
         try:
             # Send welcome message
             await websocket.send(
-                json.dumps(
+                _dumps(
                     {
                         "type": "connected",
                         "meeting_id": meeting_id,
@@ -135,13 +214,22 @@ class WebSocketServer:
 
             # Keep connection alive and handle incoming messages
             async for message in websocket:
-                # Handle heartbeat or control messages
+                # Fast path for heartbeats
+                if len(message) <= _MAX_PING_LENGTH and message in _PING_MESSAGES:
+                    await websocket.send(_PONG_MESSAGE)
+                    continue
+
+                # Handle other control messages
                 try:
-                    data = json.loads(message)
-                    if data.get("type") == "ping":
-                        await websocket.send(json.dumps({"type": "pong"}))
+                    data = _loads(message)
                 except json.JSONDecodeError:
-                    logger.warning(f"Invalid JSON message: {message}")
+                    logger.warning(
+                        f"Invalid JSON message: {message[:_MAX_LOGGED_MESSAGE_LENGTH]!r}"
+                    )
+                    continue
+
+                if isinstance(data, dict) and data.get("type") == "ping":
+                    await websocket.send(_PONG_MESSAGE)
 
         except websockets.exceptions.ConnectionClosed:
             logger.info(f"Client connection closed for meeting {meeting_id}")
@@ -163,10 +251,14 @@ class WebSocketServer:
         Returns:
             Dictionary with connection stats
         """
+        meetings = {
+            meeting_id: len(conns)
+            for shard in self._shards
+            for meeting_id, conns in shard.items()
+        }
+
         return {
-            "active_meetings": len(self.connections),
-            "total_connections": sum(len(conns) for conns in self.connections.values()),
-            "meetings": {
-                meeting_id: len(conns) for meeting_id, conns in self.connections.items()
-            },
+            "active_meetings": len(meetings),
+            "total_connections": sum(meetings.values()),
+            "meetings": meetings,
         }
@@ -5,8 +5,10 @@ from src.summarization.inference import (
     batch_generate,
     generate_structured_summary,
     generate_summary,
+    warmup_generate,
 )
 from src.summarization.model_loader import (
+    compile_model,
     get_device,
     load_base_model,
     load_finetuned_model,
@@ -17,11 +19,13 @@ __all__ = [
     "load_base_model",
     "load_finetuned_model",
     "get_device",
+    "compile_model",
     "SummarizationTrainer",
     "prepare_dataset",
     "generate_summary",
     "batch_generate",
     "generate_structured_summary",
+    "warmup_generate",
     "evaluate_model",
     "evaluate_from_files",
 ]
@@ -5,8 +5,8 @@ from typing import Dict, List
 
 from transformers import AutoModelForSeq2SeqLM, AutoTokenizer
 
-from src.summarization.inference import generate_summary
-from src.utils.io import save_json
+from src.summarization.inference import batch_generate
+from src.utils.io import load_transcript_summary_pairs, save_json
 from src.utils.logger import logger
 from src.utils.metrics import compute_rouge
 
@@ -17,6 +17,7 @@ def evaluate_model(
     test_transcripts: List[str],
     test_summaries: List[str],
     output_path: Path = None,
+    batch_size: int = 4,
 ) -> Dict[str, Dict[str, float]]:
     """
     Evaluate model on test set and compute ROUGE scores.
@@ -27,6 +28,7 @@ def evaluate_model(
         test_transcripts: List of test transcripts
         test_summaries: List of reference summaries
         output_path: Optional path to save metrics JSON
+        batch_size: Number of transcripts summarized per generate call
 
     Returns:
         Dictionary containing ROUGE scores
@@ -34,10 +36,7 @@ def evaluate_model(
     logger.info(f"Evaluating model on {len(test_transcripts)} examples")
 
     # Generate predictions
-    predictions = []
-    for transcript in test_transcripts:
-        summary = generate_summary(transcript, model, tokenizer)
-        predictions.append(summary)
+    predictions = batch_generate(test_transcripts, model, tokenizer, batch_size=batch_size)
 
     # Compute ROUGE scores
     logger.info("Computing ROUGE scores...")
@@ -92,24 +91,9 @@ def evaluate_from_files(
     Returns:
         Dictionary containing ROUGE scores
     """
-    transcripts_dir = Path(transcripts_dir)
-    summaries_dir = Path(summaries_dir)
-
     # Load test data
-    test_transcripts = []
-    test_summaries = []
-
-    for transcript_file in sorted(transcripts_dir.glob("*.txt")):
-        summary_file = summaries_dir / transcript_file.name
-
-        if not summary_file.exists():
-            logger.warning(f"Skipping {transcript_file.name}: summary not found")
-            continue
-
-        with open(transcript_file, "r", encoding="utf-8") as f:
-            test_transcripts.append(f.read().strip())
-
-        with open(summary_file, "r", encoding="utf-8") as f:
-            test_summaries.append(f.read().strip())
+    test_transcripts, test_summaries = load_transcript_summary_pairs(
+        transcripts_dir, summaries_dir
+    )
 
     return evaluate_model(model, tokenizer, test_transcripts, test_summaries, output_path)
@@ -1,13 +1,71 @@
 """Inference utilities for generating summaries."""
 
-from typing import List, Union
+import re
+from typing import Dict, List, Union
 
 import torch
 from transformers import AutoModelForSeq2SeqLM, AutoTokenizer
 
-from src.config import settings
+from src.config import get_settings, settings
 from src.utils.logger import logger
 
+# Keywords marking action items and decisions in generate_structured_summary. Like
+# the substring checks they replace, these match anywhere in a line.
+_ACTION_RE = re.compile(r"will|should|need to|action|todo|by", re.IGNORECASE)
+_DECISION_RE = re.compile(
+    r"decided|approved|agreed|consensus|resolution|determine", re.IGNORECASE
+)
+
+# Maximum number of action items and decisions kept in a structured summary
+ACTION_ITEMS_CAP = 10
+DECISIONS_CAP = 5
+
+
+def _generation_kwargs(
+    max_length: int = None,
+    min_length: int = None,
+    num_beams: int = None,
+    temperature: float = None,
+    do_sample: bool = None,
+) -> Dict:
+    """
+    Resolve generate() keyword arguments, filling unset values from settings.
+
+    Settings are fetched once rather than through the lazy proxy per attribute.
+    Beam-only and sampling-only options are left out when they don't apply, so
+    greedy decoding skips the beam scorer without generate() warning on every call.
+
+    Args:
+        max_length: Maximum summary length (defaults to settings)
+        min_length: Minimum summary length (defaults to settings)
+        num_beams: Number of beams for beam search (defaults to settings)
+        temperature: Sampling temperature (defaults to settings)
+        do_sample: Whether to use sampling (defaults to settings)
+
+    Returns:
+        Keyword arguments for model.generate
+    """
+    config = get_settings()
+    do_sample = do_sample if do_sample is not None else config.do_sample
+    num_beams = num_beams or config.num_beams
+
+    kwargs = {
+        "max_length": max_length or config.max_summary_length,
+        "min_length": min_length or config.min_summary_length,
+        "num_beams": num_beams,
+        "do_sample": do_sample,
+        "use_cache": True,
+    }
+
+    if num_beams > 1:
+        kwargs["early_stopping"] = True
+
+    if do_sample:
+        kwargs["temperature"] = temperature or config.temperature
+        kwargs["top_p"] = config.top_p
+
+    return kwargs
+
 
 def generate_summary(
     transcript: str,
@@ -35,38 +93,90 @@ def generate_summary(
     Returns:
         Generated summary text
     """
-    # Use settings defaults if not provided
-    max_length = max_length or settings.max_summary_length
-    min_length = min_length or settings.min_summary_length
-    num_beams = num_beams or settings.num_beams
-    temperature = temperature or settings.temperature
-    do_sample = do_sample if do_sample is not None else settings.do_sample
-
-    # Get device
-    device = next(model.parameters()).device
-
     # Tokenize input
     inputs = tokenizer(
         transcript,
         max_length=settings.max_input_length,
         truncation=True,
         return_tensors="pt",
+        return_attention_mask=True,
+        return_token_type_ids=False,
+    )
+
+    return _generate_from_inputs(
+        inputs, model, tokenizer, max_length, min_length, num_beams, temperature, do_sample
+    )
+
+
+def generate_summary_from_ids(
+    token_ids: List[int],
+    model: AutoModelForSeq2SeqLM,
+    tokenizer: AutoTokenizer,
+    max_length: int = None,
+) -> str:
+    """
+    Generate summary for text that has already been tokenized.
+
+    Lets callers that already hold token IDs (e.g. for chunk summaries) skip
+    tokenizing the text again.
+
+    Args:
+        token_ids: Token IDs without special tokens
+        model: Fine-tuned model
+        tokenizer: Tokenizer
+        max_length: Maximum summary length (defaults to settings)
+
+    Returns:
+        Generated summary text
+    """
+    # Truncate like the tokenizer would, leaving room for the special tokens
+    budget = settings.max_input_length - tokenizer.num_special_tokens_to_add()
+    input_ids = tokenizer.build_inputs_with_special_tokens(token_ids[:budget])
+
+    inputs = {"input_ids": torch.tensor([input_ids])}
+
+    return _generate_from_inputs(inputs, model, tokenizer, max_length)
+
+
+def _generate_from_inputs(
+    inputs: Dict[str, torch.Tensor],
+    model: AutoModelForSeq2SeqLM,
+    tokenizer: AutoTokenizer,
+    max_length: int = None,
+    min_length: int = None,
+    num_beams: int = None,
+    temperature: float = None,
+    do_sample: bool = None,
+) -> str:
+    """
+    Generate and decode a summary for one tokenized input.
+
+    Args:
+        inputs: Tokenized model inputs for a single sequence
+        model: Fine-tuned model
+        tokenizer: Tokenizer
+        max_length: Maximum summary length (defaults to settings)
+        min_length: Minimum summary length (defaults to settings)
+        num_beams: Number of beams for beam search (defaults to settings)
+        temperature: Sampling temperature (defaults to settings)
+        do_sample: Whether to use sampling (defaults to settings)
+
+    Returns:
+        Generated summary text
+    """
+    # Use settings defaults if not provided
+    generation_kwargs = _generation_kwargs(
+        max_length, min_length, num_beams, temperature, do_sample
     )
 
+    # Get device
+    device = next(model.parameters()).device
+
     inputs = {k: v.to(device) for k, v in inputs.items()}
 
     # Generate
-    with torch.no_grad():
-        outputs = model.generate(
-            **inputs,
-            max_length=max_length,
-            min_length=min_length,
-            num_beams=num_beams,
-            temperature=temperature,
-            do_sample=do_sample,
-            top_p=settings.top_p if do_sample else None,
-            early_stopping=True,
-        )
+    with torch.inference_mode():
+        outputs = model.generate(**inputs, **generation_kwargs)
 
     # Decode
     summary = tokenizer.decode(outputs[0], skip_special_tokens=True)
@@ -76,6 +186,26 @@ def generate_summary(
     return summary
 
 
+def warmup_generate(
+    model: AutoModelForSeq2SeqLM,
+    tokenizer: AutoTokenizer,
+    num_words: int = 512,
+) -> None:
+    """
+    Run a single generation on dummy input.
+
+    Triggers lazy compilation and memory allocation up front so the first
+    real request doesn't pay for them.
+
+    Args:
+        model: Model to warm up
+        tokenizer: Tokenizer
+        num_words: Number of words in the dummy input
+    """
+    logger.info("Running warmup generation...")
+    generate_summary(" ".join(["meeting"] * num_words), model, tokenizer)
+
+
 def batch_generate(
     transcripts: List[str],
     model: AutoModelForSeq2SeqLM,
@@ -94,18 +224,22 @@ def batch_generate(
     Returns:
         List of generated summaries
     """
-    summaries = []
+    summaries = [None] * len(transcripts)
 
     logger.info(f"Generating summaries for {len(transcripts)} transcripts")
 
-    for i in range(0, len(transcripts), batch_size):
-        batch = transcripts[i : i + batch_size]
+    # Batch transcripts of similar length together so little compute is spent on padding
+    order = sorted(range(len(transcripts)), key=lambda idx: len(transcripts[idx]))
 
-        batch_summaries = [
-            generate_summary(transcript, model, tokenizer) for transcript in batch
-        ]
+    for i in range(0, len(order), batch_size):
+        batch_indices = order[i : i + batch_size]
+
+        batch_summaries = _generate_batch(
+            [transcripts[idx] for idx in batch_indices], model, tokenizer
+        )
 
-        summaries.extend(batch_summaries)
+        for idx, summary in zip(batch_indices, batch_summaries):
+            summaries[idx] = summary
 
         logger.info(
             f"Processed {min(i + batch_size, len(transcripts))}/{len(transcripts)}"
@@ -114,6 +248,43 @@ def batch_generate(
     return summaries
 
 
+def _generate_batch(
+    texts: List[str],
+    model: AutoModelForSeq2SeqLM,
+    tokenizer: AutoTokenizer,
+) -> List[str]:
+    """
+    Generate summaries for a batch of texts in a single generate call.
+
+    Args:
+        texts: Input texts
+        model: Fine-tuned model
+        tokenizer: Tokenizer
+
+    Returns:
+        Generated summaries, in input order
+    """
+    device = next(model.parameters()).device
+
+    # Tokenize the whole batch, padding to its longest text
+    inputs = tokenizer(
+        texts,
+        max_length=settings.max_input_length,
+        truncation=True,
+        padding=True,
+        return_tensors="pt",
+        return_attention_mask=True,
+        return_token_type_ids=False,
+    )
+
+    inputs = {k: v.to(device) for k, v in inputs.items()}
+
+    with torch.inference_mode():
+        outputs = model.generate(**inputs, **_generation_kwargs())
+
+    return tokenizer.batch_decode(outputs, skip_special_tokens=True)
+
+
 def generate_structured_summary(
     transcript: str,
     model: AutoModelForSeq2SeqLM,
@@ -145,35 +316,26 @@ def generate_structured_summary(
 
     # Simple keyword-based extraction
     for line in lines:
-        lower_line = line.lower()
+        # Only "Speaker: text" lines are extracted, so skip the keyword scans otherwise
+        if ":" not in line:
+            continue
 
         # Action items
-        if any(
-            keyword in lower_line
-            for keyword in ["will", "should", "need to", "action", "todo", "by"]
-        ):
-            if ":" in line:
-                action_items.append(line.split(":", 1)[1].strip())
+        if len(action_items) < ACTION_ITEMS_CAP and _ACTION_RE.search(line):
+            action_items.append(line.split(":", 1)[1].strip())
 
         # Decisions
-        if any(
-            keyword in lower_line
-            for keyword in [
-                "decided",
-                "approved",
-                "agreed",
-                "consensus",
-                "resolution",
-                "determine",
-            ]
-        ):
-            if ":" in line:
-                decisions.append(line.split(":", 1)[1].strip())
+        if len(decisions) < DECISIONS_CAP and _DECISION_RE.search(line):
+            decisions.append(line.split(":", 1)[1].strip())
+
+        # Stop scanning once both lists are full
+        if len(action_items) >= ACTION_ITEMS_CAP and len(decisions) >= DECISIONS_CAP:
+            break
 
     return {
         "summary": main_summary,
-        "action_items": action_items[:10],  # Limit to top 10
-        "decisions": decisions[:5],  # Limit to top 5
+        "action_items": action_items,
+        "decisions": decisions,
         "transcript_length": len(transcript),
         "summary_length": len(main_summary),
     }
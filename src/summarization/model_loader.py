@@ -10,23 +10,94 @@ from src.config import settings
 from src.utils.logger import logger
 
 
-def load_base_model() -> Tuple[AutoModelForSeq2SeqLM, AutoTokenizer]:
+def _pretrained_kwargs(half_precision: bool = True) -> dict:
+    """
+    Build keyword arguments for ``from_pretrained`` that keep load-time memory low.
+
+    With ``low_cpu_mem_usage`` enabled, weights are materialized directly from the
+    (memory-mapped) checkpoint instead of into a randomly initialized copy first.
+    For inference on GPU the weights are loaded in half precision: bfloat16 where
+    supported (Ampere and newer), which keeps fp32's range, and float16 otherwise.
+    Set ``LOW_CPU_MEM_USAGE=false`` to fall back to eager loading.
+
+    Args:
+        half_precision: Load half-precision weights on GPU. Disable for training,
+                        where the optimizer needs fp32 master weights.
+
+    Returns:
+        Dictionary of keyword arguments
+    """
+    kwargs = {"low_cpu_mem_usage": settings.low_cpu_mem_usage}
+    if half_precision and torch.cuda.is_available():
+        kwargs["torch_dtype"] = (
+            torch.bfloat16 if torch.cuda.is_bf16_supported() else torch.float16
+        )
+    return kwargs
+
+
+def _maybe_quantize(model: AutoModelForSeq2SeqLM, device: str) -> AutoModelForSeq2SeqLM:
+    """
+    Apply int8 dynamic quantization to the model's linear layers if enabled.
+
+    Quantization is only applied on CPU, where int8 matmuls are supported by
+    PyTorch's fbgemm/qnnpack backends.
+
+    Args:
+        model: Loaded model
+        device: Device the model is on
+
+    Returns:
+        Quantized model, or the original model if quantization is disabled
+    """
+    if not settings.quantize_int8:
+        return model
+
+    if device != "cpu":
+        logger.warning("int8 quantization is only supported on CPU, skipping")
+        return model
+
+    logger.info("Applying int8 dynamic quantization to linear layers")
+    return torch.ao.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+
+
+def _check_fast_tokenizer(tokenizer: AutoTokenizer) -> None:
+    """
+    Warn when no Rust-backed fast tokenizer is available for the model.
+
+    Args:
+        tokenizer: Loaded tokenizer
+    """
+    if not tokenizer.is_fast:
+        logger.warning(
+            f"{type(tokenizer).__name__} is not a fast tokenizer; tokenization will be slow"
+        )
+
+
+def load_base_model(for_training: bool = False) -> Tuple[AutoModelForSeq2SeqLM, AutoTokenizer]:
     """
     Load base pre-trained model from HuggingFace Hub.
 
+    Args:
+        for_training: Keep fp32 weights for fine-tuning; mixed precision is then
+                      handled by the Trainer's autocast instead
+
     Returns:
         Tuple of (model, tokenizer)
     """
     logger.info(f"Loading base model: {settings.summarization_model}")
+    settings.ensure_hf_env()
 
     tokenizer = AutoTokenizer.from_pretrained(
         settings.summarization_model,
         cache_dir=settings.transformers_cache,
+        use_fast=True,
     )
+    _check_fast_tokenizer(tokenizer)
 
     model = AutoModelForSeq2SeqLM.from_pretrained(
         settings.summarization_model,
         cache_dir=settings.transformers_cache,
+        **_pretrained_kwargs(half_precision=not for_training),
     )
 
     # Move to GPU if available
@@ -64,22 +135,46 @@ def load_finetuned_model(
         logger.warning(
             f"Fine-tuned model not found at {checkpoint_path}. Loading base model instead."
         )
-        return load_base_model()
+        model, tokenizer = load_base_model()
+        return _maybe_quantize(model, model.device.type), tokenizer
 
     logger.info(f"Loading fine-tuned model from: {checkpoint_path}")
 
-    tokenizer = AutoTokenizer.from_pretrained(checkpoint_path)
-    model = AutoModelForSeq2SeqLM.from_pretrained(checkpoint_path)
+    tokenizer = AutoTokenizer.from_pretrained(checkpoint_path, use_fast=True)
+    _check_fast_tokenizer(tokenizer)
+    model = AutoModelForSeq2SeqLM.from_pretrained(checkpoint_path, **_pretrained_kwargs())
 
     # Move to GPU if available
     device = "cuda" if torch.cuda.is_available() else "cpu"
     model = model.to(device)
+    model = _maybe_quantize(model, device)
 
     logger.info(f"Fine-tuned model loaded successfully on device: {device}")
 
     return model, tokenizer
 
 
+def compile_model(model: AutoModelForSeq2SeqLM) -> AutoModelForSeq2SeqLM:
+    """
+    Compile the model's forward pass with torch.compile.
+
+    Compilation happens lazily on the first call, so follow this with
+    warmup generations before serving requests. Shapes are compiled as dynamic
+    since input lengths vary per request, and CUDA graphs ("reduce-overhead")
+    are only used on GPU, where they cut per-step launch overhead.
+
+    Args:
+        model: Loaded model
+
+    Returns:
+        Model with compiled forward pass
+    """
+    mode = "reduce-overhead" if torch.cuda.is_available() else "default"
+    logger.info(f"Compiling model forward pass with torch.compile (mode={mode})...")
+    model.forward = torch.compile(model.forward, mode=mode, fullgraph=False, dynamic=True)
+    return model
+
+
 def get_device() -> str:
     """
     Get the device to use for model inference.
@@ -1,7 +1,8 @@
 """Training utilities for fine-tuning summarization model."""
 
+import hashlib
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
 import torch
 from datasets import Dataset, load_dataset
@@ -14,8 +15,12 @@ from transformers import (
 )
 
 from src.config import settings
+from src.utils.io import load_transcript_summary_pairs
 from src.utils.logger import logger
 
+# Part of the tokenized dataset cache key; bump when preprocessing changes
+_TOKENIZED_CACHE_VERSION = 1
+
 
 class SummarizationTrainer:
     """Wrapper for HuggingFace Trainer for summarization fine-tuning."""
@@ -56,6 +61,10 @@ class SummarizationTrainer:
 
         logger.info(f"Starting training. Checkpoints will be saved to: {output_dir}")
 
+        # Mixed precision: bf16 where supported (no loss scaling needed), fp16 otherwise
+        use_cuda = torch.cuda.is_available()
+        use_bf16 = use_cuda and torch.cuda.is_bf16_supported()
+
         # Training arguments
         training_args = Seq2SeqTrainingArguments(
             output_dir=str(output_dir),
@@ -73,14 +82,24 @@ class SummarizationTrainer:
             logging_dir=str(output_dir / "logs"),
             logging_steps=50,
             predict_with_generate=True,
-            fp16=torch.cuda.is_available(),  # Use mixed precision if GPU available
+            bf16=use_bf16,
+            fp16=use_cuda and not use_bf16,
+            optim="adamw_torch_fused" if use_cuda else "adamw_torch",
+            gradient_checkpointing=settings.gradient_checkpointing,
+            torch_compile=settings.train_torch_compile,
+            dataloader_num_workers=settings.dataloader_num_workers,
+            # Under torchrun, each GPU runs its own DDP process; all parameters get gradients
+            ddp_find_unused_parameters=False,
+            ddp_backend="nccl" if use_cuda else None,
             push_to_hub=False,
             load_best_model_at_end=True if self.eval_dataset else False,
         )
 
-        # Data collator
+        # Data collator (pads per batch; multiples of 8 suit tensor cores in mixed precision)
         data_collator = DataCollatorForSeq2Seq(
-            tokenizer=self.tokenizer, model=self.model
+            tokenizer=self.tokenizer,
+            model=self.model,
+            pad_to_multiple_of=8 if torch.cuda.is_available() else None,
         )
 
         # Initialize trainer
@@ -93,22 +112,65 @@ class SummarizationTrainer:
             data_collator=data_collator,
         )
 
+        # Under distributed training only the main process logs and saves the tokenizer
+        is_main_process = trainer.is_world_process_zero()
+
         # Train
-        logger.info("Training started...")
+        if is_main_process:
+            logger.info("Training started...")
         train_result = trainer.train()
 
-        # Save final model
-        logger.info(f"Saving final model to {output_dir}")
+        # Save final model (save_model only writes from the main process)
+        if is_main_process:
+            logger.info(f"Saving final model to {output_dir}")
         trainer.save_model(str(output_dir))
-        self.tokenizer.save_pretrained(str(output_dir))
 
-        # Log training metrics
-        metrics = train_result.metrics
-        logger.info(f"Training completed. Metrics: {metrics}")
+        if is_main_process:
+            self.tokenizer.save_pretrained(str(output_dir))
+
+            # Log training metrics
+            metrics = train_result.metrics
+            logger.info(f"Training completed. Metrics: {metrics}")
+
+
+def _tokenized_cache_file(
+    transcripts: List[str], summaries: List[str], tokenizer: AutoTokenizer
+) -> Path:
+    """
+    Path of the on-disk cache for a tokenized dataset.
+
+    The name hashes the texts, the tokenizer and the length limits, so any
+    change to them results in a new cache file.
+
+    Args:
+        transcripts: Transcript texts
+        summaries: Summary texts
+        tokenizer: Tokenizer used for encoding
+
+    Returns:
+        Path to the Arrow cache file
+    """
+    hasher = hashlib.blake2b(digest_size=16)
+    hasher.update(
+        f"{_TOKENIZED_CACHE_VERSION}|{tokenizer.name_or_path}|{len(tokenizer)}|"
+        f"{settings.max_input_length}|{settings.max_target_length}".encode()
+    )
+    for transcript, summary in zip(transcripts, summaries):
+        hasher.update(transcript.encode("utf-8"))
+        hasher.update(b"\0")
+        hasher.update(summary.encode("utf-8"))
+        hasher.update(b"\0")
+
+    cache_dir = settings.transformers_cache / "tokenized"
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    return cache_dir / f"{hasher.hexdigest()}.arrow"
 
 
 def prepare_dataset(
-    transcripts_dir: Path, summaries_dir: Path, tokenizer: AutoTokenizer
+    transcripts_dir: Path,
+    summaries_dir: Path,
+    tokenizer: AutoTokenizer,
+    num_proc: Optional[int] = None,
 ) -> Dataset:
     """
     Prepare dataset from transcript and summary files.
@@ -117,60 +179,53 @@ def prepare_dataset(
         transcripts_dir: Directory containing transcript files
         summaries_dir: Directory containing summary files
         tokenizer: Tokenizer to use for encoding
+        num_proc: Number of processes for tokenization. Defaults to a single
+            process, since fast tokenizers already encode batches in parallel;
+            worth raising for large datasets on many-core machines.
 
     Returns:
         Prepared HuggingFace Dataset
     """
-    transcripts_dir = Path(transcripts_dir)
-    summaries_dir = Path(summaries_dir)
-
     # Load transcript-summary pairs
-    data = {"transcript": [], "summary": []}
-
-    transcript_files = sorted(transcripts_dir.glob("*.txt"))
-
-    for transcript_file in transcript_files:
-        summary_file = summaries_dir / transcript_file.name
-
-        if not summary_file.exists():
-            logger.warning(f"Summary not found for {transcript_file.name}, skipping")
-            continue
-
-        with open(transcript_file, "r", encoding="utf-8") as f:
-            transcript = f.read().strip()
-
-        with open(summary_file, "r", encoding="utf-8") as f:
-            summary = f.read().strip()
-
-        data["transcript"].append(transcript)
-        data["summary"].append(summary)
+    transcripts, summaries = load_transcript_summary_pairs(transcripts_dir, summaries_dir)
+    data = {"transcript": transcripts, "summary": summaries}
 
     logger.info(f"Loaded {len(data['transcript'])} transcript-summary pairs")
 
     # Create HuggingFace dataset
     dataset = Dataset.from_dict(data)
 
-    # Tokenize
+    # Tokenize without padding; the data collator pads each batch to its
+    # longest example instead of every example to the maximum length
     def preprocess_function(examples):
         inputs = tokenizer(
             examples["transcript"],
             max_length=settings.max_input_length,
             truncation=True,
-            padding="max_length",
         )
 
         labels = tokenizer(
             examples["summary"],
             max_length=settings.max_target_length,
             truncation=True,
-            padding="max_length",
         )
 
         inputs["labels"] = labels["input_ids"]
         return inputs
 
+    # Reuse the tokenized dataset from an earlier run when nothing has changed
+    cache_file = _tokenized_cache_file(transcripts, summaries, tokenizer)
+    if cache_file.exists():
+        logger.info(f"Loading tokenized dataset from cache: {cache_file}")
+
     tokenized_dataset = dataset.map(
-        preprocess_function, batched=True, remove_columns=dataset.column_names
+        preprocess_function,
+        batched=True,
+        batch_size=1000,
+        num_proc=num_proc,
+        remove_columns=dataset.column_names,
+        cache_file_name=str(cache_file),
+        load_from_cache_file=True,
     )
 
     return tokenized_dataset
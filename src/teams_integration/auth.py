@@ -1,12 +1,19 @@
 """Microsoft Teams OAuth2 authentication manager."""
 
-from typing import Optional
+import os
+import time
+from typing import Dict, Optional
 
 try:
-    from msal import ConfidentialClientApplication, PublicClientApplication
+    from msal import (
+        ConfidentialClientApplication,
+        PublicClientApplication,
+        SerializableTokenCache,
+    )
 except ImportError:
     ConfidentialClientApplication = None
     PublicClientApplication = None
+    SerializableTokenCache = None
 
 from src.config import settings
 from src.utils.logger import logger
@@ -22,6 +29,9 @@ class TeamsAuthManager:
         "https://graph.microsoft.com/User.Read",
     ]
 
+    # Tokens are refreshed this many seconds before they expire
+    REFRESH_MARGIN_SECONDS = 300
+
     def __init__(self, use_device_code: bool = True):
         """
         Initialize Teams authentication manager.
@@ -42,11 +52,18 @@ class TeamsAuthManager:
 
         self.use_device_code = use_device_code
 
+        # Persistent MSAL token cache, so later processes can refresh silently
+        # instead of re-running the OAuth flow
+        self.token_cache = SerializableTokenCache()
+        if settings.teams_token_cache.exists():
+            self.token_cache.deserialize(settings.teams_token_cache.read_text(encoding="utf-8"))
+
         if use_device_code:
             # Public client for device code flow (user authentication)
             self.app = PublicClientApplication(
                 client_id=settings.teams_client_id,
                 authority=f"https://login.microsoftonline.com/{settings.teams_tenant_id}",
+                token_cache=self.token_cache,
             )
         else:
             # Confidential client for client credentials flow (app-only)
@@ -57,9 +74,11 @@ class TeamsAuthManager:
                 client_id=settings.teams_client_id,
                 client_credential=settings.teams_client_secret,
                 authority=f"https://login.microsoftonline.com/{settings.teams_tenant_id}",
+                token_cache=self.token_cache,
             )
 
         self.access_token: Optional[str] = None
+        self.expires_at = 0.0
         logger.info(f"Teams auth manager initialized (device_code={use_device_code})")
 
     def authenticate(self) -> str:
@@ -100,9 +119,8 @@ class TeamsAuthManager:
         result = self.app.acquire_token_by_device_flow(flow)
 
         if "access_token" in result:
-            self.access_token = result["access_token"]
             logger.info("✓ Authentication successful!")
-            return self.access_token
+            return self._store_token(result)
         else:
             error = result.get("error_description", "Unknown error")
             raise RuntimeError(f"Authentication failed: {error}")
@@ -114,13 +132,53 @@ class TeamsAuthManager:
         result = self.app.acquire_token_for_client(scopes=self.SCOPES)
 
         if "access_token" in result:
-            self.access_token = result["access_token"]
             logger.info("✓ Authentication successful!")
-            return self.access_token
+            return self._store_token(result)
         else:
             error = result.get("error_description", "Unknown error")
             raise RuntimeError(f"Authentication failed: {error}")
 
+    def _store_token(self, result: Dict) -> str:
+        """
+        Keep a newly acquired token and persist the MSAL cache if it changed.
+
+        Args:
+            result: MSAL token response containing "access_token"
+
+        Returns:
+            Access token string
+        """
+        self.access_token = result["access_token"]
+        self.expires_at = time.time() + float(result.get("expires_in", 0))
+
+        if self.token_cache.has_state_changed:
+            cache_path = settings.teams_token_cache
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            # Owner-only permissions from creation, since the cache holds refresh tokens
+            fd = os.open(cache_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(self.token_cache.serialize())
+            self.token_cache.has_state_changed = False
+
+        return self.access_token
+
+    def _acquire_token_silent(self) -> Optional[Dict]:
+        """
+        Get a token from the MSAL cache, refreshing it with a refresh token if needed.
+
+        Returns:
+            MSAL token response, or None if interactive authentication is required
+        """
+        if not self.use_device_code:
+            # Client credentials need no user; MSAL serves cached tokens itself
+            return self.app.acquire_token_for_client(scopes=self.SCOPES)
+
+        accounts = self.app.get_accounts()
+        if not accounts:
+            return None
+
+        return self.app.acquire_token_silent(self.SCOPES, account=accounts[0])
+
     def get_access_token(self) -> str:
         """
         Get current access token, refreshing if needed.
@@ -128,12 +186,14 @@ class TeamsAuthManager:
         Returns:
             Valid access token
         """
-        if not self.access_token:
-            return self.authenticate()
+        if self.access_token and time.time() < self.expires_at - self.REFRESH_MARGIN_SECONDS:
+            return self.access_token
 
-        # TODO: Implement token refresh logic
-        # For now, just return existing token
-        return self.access_token
+        result = self._acquire_token_silent()
+        if result and "access_token" in result:
+            return self._store_token(result)
+
+        return self.authenticate()
 
     def is_authenticated(self) -> bool:
         """Check if currently authenticated."""
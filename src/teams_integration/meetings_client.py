@@ -1,13 +1,24 @@
 """Microsoft Graph API client for Teams meetings."""
 
-from datetime import datetime
-from typing import Dict, List, Optional
+import asyncio
+from datetime import datetime, timedelta
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import orjson
 
 try:
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
 except ImportError:
     requests = None
 
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
 from src.teams_integration.auth import TeamsAuthManager
 from src.utils.logger import logger
 
@@ -17,6 +28,15 @@ class TeamsMeetingsClient:
 
     GRAPH_API_BASE = "https://graph.microsoft.com/v1.0"
 
+    # Transient Graph API statuses that are retried with backoff (429 honours Retry-After)
+    RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+    # Maximum number of sub-requests Graph accepts in one $batch request
+    BATCH_LIMIT = 20
+
+    # Meeting fields requested by iter_user_meetings by default
+    MEETING_FIELDS = ("id", "subject", "startDateTime", "endDateTime", "joinWebUrl")
+
     def __init__(self, auth_manager: TeamsAuthManager):
         """
         Initialize Teams meetings client.
@@ -28,12 +48,30 @@ class TeamsMeetingsClient:
             raise ImportError("requests not installed. Install with: pip install requests")
 
         self.auth_manager = auth_manager
+
+        # One pooled session, so calls reuse keep-alive connections instead of
+        # paying a TCP + TLS handshake each
+        self.session = requests.Session()
+        retries = Retry(total=3, backoff_factor=0.3, status_forcelist=self.RETRY_STATUSES)
+        self.session.mount(
+            "https://", HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=retries)
+        )
+
+        self._headers: Dict[str, str] = {}
+        self._headers_token: Optional[str] = None
+
+        # Async client for the concurrent a* methods, created on first use
+        self._aclient = None
+
         logger.info("Teams meetings client initialized")
 
     def _get_headers(self) -> Dict[str, str]:
-        """Get HTTP headers with authorization token."""
+        """Get HTTP headers with authorization token, rebuilt only when the token changes."""
         token = self.auth_manager.get_access_token()
-        return {"Authorization": f"Bearer {token}", "Content-Type": "application/json"}
+        if token != self._headers_token:
+            self._headers = {"Authorization": f"Bearer {token}", "Content-Type": "application/json"}
+            self._headers_token = token
+        return self._headers
 
     def list_user_meetings(self, limit: int = 10) -> List[Dict]:
         """
@@ -47,17 +85,44 @@ class TeamsMeetingsClient:
         """
         logger.info(f"Fetching user meetings (limit={limit})...")
 
+        meetings = list(
+            islice(self.iter_user_meetings(page_size=min(limit, 50), select=None), limit)
+        )
+
+        logger.info(f"Found {len(meetings)} meetings")
+        return meetings
+
+    def iter_user_meetings(
+        self, page_size: int = 50, select: Optional[Sequence[str]] = MEETING_FIELDS
+    ) -> Iterator[Dict]:
+        """
+        Iterate over the user's meetings, following Graph API pagination.
+
+        Pages are only fetched as the iterator is consumed, so callers can stop
+        early (e.g. with itertools.islice).
+
+        Args:
+            page_size: Number of meetings per page
+            select: Meeting fields to fetch, or None for all fields
+
+        Yields:
+            Meeting dictionaries
+        """
         url = f"{self.GRAPH_API_BASE}/me/onlineMeetings"
-        params = {"$top": limit}
+        params = {"$top": page_size}
+        if select:
+            params["$select"] = ",".join(select)
 
-        response = requests.get(url, headers=self._get_headers(), params=params)
-        response.raise_for_status()
+        while url:
+            response = self.session.get(url, headers=self._get_headers(), params=params)
+            response.raise_for_status()
 
-        data = response.json()
-        meetings = data.get("value", [])
+            data = orjson.loads(response.content)
+            yield from data.get("value", [])
 
-        logger.info(f"Found {len(meetings)} meetings")
-        return meetings
+            # The next link already carries the query parameters
+            url = data.get("@odata.nextLink")
+            params = None
 
     def get_meeting_details(self, meeting_id: str) -> Dict:
         """
@@ -73,10 +138,10 @@ class TeamsMeetingsClient:
 
         url = f"{self.GRAPH_API_BASE}/me/onlineMeetings/{meeting_id}"
 
-        response = requests.get(url, headers=self._get_headers())
+        response = self.session.get(url, headers=self._get_headers())
         response.raise_for_status()
 
-        return response.json()
+        return orjson.loads(response.content)
 
     def list_calendar_events(
         self, start_date: Optional[datetime] = None, end_date: Optional[datetime] = None
@@ -91,11 +156,29 @@ class TeamsMeetingsClient:
         Returns:
             List of calendar events
         """
+        url, params = self._calendar_events_request(start_date, end_date)
+
+        response = self.session.get(url, headers=self._get_headers(), params=params)
+        response.raise_for_status()
+
+        return self._teams_events(orjson.loads(response.content))
+
+    def _calendar_events_request(
+        self, start_date: Optional[datetime], end_date: Optional[datetime]
+    ) -> Tuple[str, Dict[str, str]]:
+        """
+        Build the URL and query parameters for a calendar events request.
+
+        Args:
+            start_date: Start date for events (defaults to now)
+            end_date: End date for events (defaults to 7 days from start)
+
+        Returns:
+            Tuple of (url, params)
+        """
         if start_date is None:
             start_date = datetime.now()
         if end_date is None:
-            from datetime import timedelta
-
             end_date = start_date + timedelta(days=7)
 
         logger.info(f"Fetching calendar events from {start_date} to {end_date}")
@@ -105,14 +188,20 @@ class TeamsMeetingsClient:
             "$filter": f"start/dateTime ge '{start_date.isoformat()}' and end/dateTime le '{end_date.isoformat()}'",
             "$select": "subject,start,end,onlineMeeting,organizer,attendees",
         }
+        return url, params
 
-        response = requests.get(url, headers=self._get_headers(), params=params)
-        response.raise_for_status()
+    @staticmethod
+    def _teams_events(data: Dict) -> List[Dict]:
+        """
+        Filter a calendar events response to events with online meetings.
 
-        data = response.json()
-        events = data.get("value", [])
+        Args:
+            data: Calendar events response body
 
-        # Filter to only events with online meetings
+        Returns:
+            List of calendar events with Teams meetings
+        """
+        events = data.get("value", [])
         teams_events = [e for e in events if e.get("onlineMeeting")]
 
         logger.info(f"Found {len(teams_events)} Teams meetings")
@@ -132,7 +221,7 @@ class TeamsMeetingsClient:
 
         url = f"{self.GRAPH_API_BASE}/me/onlineMeetings/{meeting_id}/attendanceReports"
 
-        response = requests.get(url, headers=self._get_headers())
+        response = self.session.get(url, headers=self._get_headers())
 
         if response.status_code == 404:
             logger.warning("Attendance reports not available for this meeting")
@@ -140,7 +229,7 @@ class TeamsMeetingsClient:
 
         response.raise_for_status()
 
-        data = response.json()
+        data = orjson.loads(response.content)
         reports = data.get("value", [])
 
         if not reports:
@@ -150,11 +239,224 @@ class TeamsMeetingsClient:
         report_id = reports[0]["id"]
         attendance_url = f"{url}/{report_id}/attendanceRecords"
 
-        response = requests.get(attendance_url, headers=self._get_headers())
+        response = self.session.get(attendance_url, headers=self._get_headers())
         response.raise_for_status()
 
-        data = response.json()
+        data = orjson.loads(response.content)
         participants = data.get("value", [])
 
         logger.info(f"Found {len(participants)} participants")
         return participants
+
+    def _batch_get(self, urls: List[str]) -> List[Tuple[int, Dict]]:
+        """
+        Send GET requests through the Graph $batch endpoint, BATCH_LIMIT at a time.
+
+        Args:
+            urls: Request URLs relative to GRAPH_API_BASE (e.g. "/me/onlineMeetings")
+
+        Returns:
+            (status, body) for each URL, in order
+        """
+        results: List[Tuple[int, Dict]] = [(0, {})] * len(urls)
+
+        for start in range(0, len(urls), self.BATCH_LIMIT):
+            chunk = urls[start : start + self.BATCH_LIMIT]
+            body = {
+                "requests": [
+                    {"id": str(i), "method": "GET", "url": url} for i, url in enumerate(chunk)
+                ]
+            }
+
+            response = self.session.post(
+                f"{self.GRAPH_API_BASE}/$batch",
+                headers=self._get_headers(),
+                data=orjson.dumps(body),
+            )
+            response.raise_for_status()
+
+            for item in orjson.loads(response.content).get("responses", []):
+                results[start + int(item["id"])] = (item["status"], item.get("body") or {})
+
+        return results
+
+    def batch_get_participants(self, meeting_ids: List[str]) -> Dict[str, List[Dict]]:
+        """
+        Get participants for many meetings using Graph $batch requests.
+
+        Same results as calling get_meeting_participants per meeting, but with
+        one request per BATCH_LIMIT meetings for each of the two lookups.
+
+        Args:
+            meeting_ids: Meeting IDs
+
+        Returns:
+            Dictionary mapping meeting IDs to participant lists
+
+        Raises:
+            requests.HTTPError: If a sub-request fails with a status other than 404
+        """
+        logger.info(f"Fetching participants for {len(meeting_ids)} meetings (batched)")
+
+        report_urls = [f"/me/onlineMeetings/{mid}/attendanceReports" for mid in meeting_ids]
+        participants: Dict[str, List[Dict]] = {mid: [] for mid in meeting_ids}
+
+        # Latest attendance report per meeting
+        record_requests = []
+        for mid, url, (status, body) in zip(
+            meeting_ids, report_urls, self._batch_get(report_urls)
+        ):
+            if status == 404:
+                logger.warning(f"Attendance reports not available for meeting {mid}")
+                continue
+            if status >= 400:
+                raise requests.HTTPError(f"Graph request {url} failed with status {status}")
+
+            reports = body.get("value", [])
+            if reports:
+                record_requests.append((mid, f"{url}/{reports[0]['id']}/attendanceRecords"))
+
+        # Attendance records for meetings that have a report
+        record_urls = [url for _, url in record_requests]
+        for (mid, url), (status, body) in zip(record_requests, self._batch_get(record_urls)):
+            if status >= 400:
+                raise requests.HTTPError(f"Graph request {url} failed with status {status}")
+            participants[mid] = body.get("value", [])
+
+        return participants
+
+    def _get_async_client(self) -> "httpx.AsyncClient":
+        """
+        Get the shared async HTTP client, creating it on first use.
+
+        Returns:
+            httpx AsyncClient
+
+        Raises:
+            ImportError: If httpx is not installed
+        """
+        if httpx is None:
+            raise ImportError("httpx not installed. Install with: pip install httpx")
+
+        if self._aclient is None:
+            self._aclient = httpx.AsyncClient(
+                timeout=30,
+                limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+            )
+        return self._aclient
+
+    async def _aget(self, url: str, params: Optional[Dict] = None) -> "httpx.Response":
+        """
+        Send an authorized GET request with the async client.
+
+        The access token is fetched off the event loop, since acquiring it may block.
+
+        Args:
+            url: Request URL
+            params: Optional query parameters
+
+        Returns:
+            HTTP response
+        """
+        headers = await asyncio.to_thread(self._get_headers)
+        return await self._get_async_client().get(url, headers=headers, params=params)
+
+    async def alist_calendar_events(
+        self, start_date: Optional[datetime] = None, end_date: Optional[datetime] = None
+    ) -> List[Dict]:
+        """
+        Async version of list_calendar_events.
+
+        Args:
+            start_date: Start date for events (defaults to now)
+            end_date: End date for events (defaults to 7 days from now)
+
+        Returns:
+            List of calendar events
+        """
+        url, params = self._calendar_events_request(start_date, end_date)
+
+        response = await self._aget(url, params=params)
+        response.raise_for_status()
+
+        return self._teams_events(orjson.loads(response.content))
+
+    async def aget_meeting_details(self, meeting_id: str) -> Dict:
+        """
+        Async version of get_meeting_details.
+
+        Args:
+            meeting_id: Meeting ID
+
+        Returns:
+            Meeting details dictionary
+        """
+        logger.info(f"Fetching meeting details: {meeting_id}")
+
+        response = await self._aget(f"{self.GRAPH_API_BASE}/me/onlineMeetings/{meeting_id}")
+        response.raise_for_status()
+
+        return orjson.loads(response.content)
+
+    async def aget_meeting_participants(self, meeting_id: str) -> List[Dict]:
+        """
+        Async version of get_meeting_participants.
+
+        Args:
+            meeting_id: Meeting ID
+
+        Returns:
+            List of participant dictionaries
+        """
+        logger.info(f"Fetching participants for meeting: {meeting_id}")
+
+        url = f"{self.GRAPH_API_BASE}/me/onlineMeetings/{meeting_id}/attendanceReports"
+
+        response = await self._aget(url)
+
+        if response.status_code == 404:
+            logger.warning("Attendance reports not available for this meeting")
+            return []
+
+        response.raise_for_status()
+
+        reports = orjson.loads(response.content).get("value", [])
+
+        if not reports:
+            return []
+
+        # Get latest report
+        response = await self._aget(f"{url}/{reports[0]['id']}/attendanceRecords")
+        response.raise_for_status()
+
+        participants = orjson.loads(response.content).get("value", [])
+
+        logger.info(f"Found {len(participants)} participants")
+        return participants
+
+    async def fetch_all_meeting_details(
+        self, meeting_ids: Iterable[str], max_concurrency: int = 10
+    ) -> List[Dict]:
+        """
+        Fetch details for many meetings concurrently.
+
+        Args:
+            meeting_ids: Meeting IDs
+            max_concurrency: Maximum number of requests in flight (Graph API rate limits)
+
+        Returns:
+            Meeting details dictionaries, in the order of meeting_ids
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def fetch(meeting_id: str) -> Dict:
+            async with semaphore:
+                return await self.aget_meeting_details(meeting_id)
+
+        return list(await asyncio.gather(*(fetch(meeting_id) for meeting_id in meeting_ids)))
+
+    async def aclose(self) -> None:
+        """Close the async HTTP client."""
+        if self._aclient is not None:
+            await self._aclient.aclose()
+            self._aclient = None
@@ -1,5 +1,10 @@
 """Azure Speech-to-Text integration for real-time transcription."""
 
+import queue
+import threading
+import time
+import wave
+from functools import lru_cache
 from typing import Callable, Optional
 
 try:
@@ -10,6 +15,32 @@ except ImportError:
 from src.config import settings
 from src.utils.logger import logger
 
+# Bytes pushed per write when streaming WAV files (0.4 s of 16 kHz 16-bit mono)
+PUSH_CHUNK_BYTES = 3200 * 4
+
+# Maximum recognition events waiting for user callbacks; the oldest are dropped beyond this
+EVENT_QUEUE_SIZE = 1024
+
+
+@lru_cache(maxsize=4)
+def _get_speech_config(key: str, region: str, language: str) -> "speechsdk.SpeechConfig":
+    """
+    Return a shared speech config for file transcription.
+
+    Callers must not modify the returned config, since it is reused across calls.
+
+    Args:
+        key: Azure Speech subscription key
+        region: Azure Speech region
+        language: Recognition language
+
+    Returns:
+        Cached SpeechConfig instance
+    """
+    speech_config = speechsdk.SpeechConfig(subscription=key, region=region)
+    speech_config.speech_recognition_language = language
+    return speech_config
+
 
 class AzureSpeechTranscriber:
     """Real-time audio transcription using Azure Cognitive Services."""
@@ -41,6 +72,11 @@ class AzureSpeechTranscriber:
         self.on_transcribed = on_transcribed
         self.on_speaker_detected = on_speaker_detected
 
+        # User callbacks run on a worker thread so slow callbacks never block the
+        # SDK thread that drains the audio buffer
+        self._events: queue.Queue = queue.Queue(maxsize=EVENT_QUEUE_SIZE)
+        self._dispatcher: Optional[threading.Thread] = None
+
         # Configure speech service
         speech_config = speechsdk.SpeechConfig(
             subscription=settings.azure_speech_key, region=settings.azure_speech_region
@@ -80,8 +116,7 @@ class AzureSpeechTranscriber:
         def recognizing_cb(evt):
             """Handle interim recognition results."""
             if self.on_transcribed:
-                text = evt.result.text
-                self.on_transcribed(text, is_final=False)
+                self._enqueue(self.on_transcribed, evt.result.text, False)
             logger.debug(f"Recognizing: {evt.result.text}")
 
         def recognized_cb(evt):
@@ -89,13 +124,13 @@ class AzureSpeechTranscriber:
             if evt.result.reason == speechsdk.ResultReason.RecognizedSpeech:
                 text = evt.result.text
                 if self.on_transcribed:
-                    self.on_transcribed(text, is_final=True)
+                    self._enqueue(self.on_transcribed, text, True)
 
                 # Extract speaker info if available
                 if settings.azure_speech_enable_diarization:
                     speaker_id = evt.result.speaker_id
                     if self.on_speaker_detected:
-                        self.on_speaker_detected(text, speaker_id)
+                        self._enqueue(self.on_speaker_detected, text, speaker_id)
 
                 logger.info(f"Recognized: {text}")
             elif evt.result.reason == speechsdk.ResultReason.NoMatch:
@@ -113,9 +148,43 @@ class AzureSpeechTranscriber:
         self.recognizer.recognized.connect(recognized_cb)
         self.recognizer.canceled.connect(canceled_cb)
 
+    def _enqueue(self, callback: Callable, *args) -> None:
+        """
+        Queue a user callback for the dispatcher, dropping the oldest event when full.
+
+        Args:
+            callback: User callback to invoke
+            *args: Arguments for the callback
+        """
+        while True:
+            try:
+                self._events.put_nowait((callback, args))
+                return
+            except queue.Full:
+                try:
+                    self._events.get_nowait()
+                    logger.warning("Recognition event queue full, dropping oldest event")
+                except queue.Empty:
+                    pass
+
+    def _dispatch_events(self) -> None:
+        """Invoke queued user callbacks until the stop sentinel arrives."""
+        while True:
+            event = self._events.get()
+            if event is None:
+                return
+            callback, args = event
+            try:
+                callback(*args)
+            except Exception as e:
+                logger.error(f"Transcription callback failed: {e}")
+
     def start_continuous_recognition(self):
         """Start continuous recognition from microphone."""
         logger.info("Starting continuous recognition...")
+        if self._dispatcher is None:
+            self._dispatcher = threading.Thread(target=self._dispatch_events, daemon=True)
+            self._dispatcher.start()
         self.recognizer.start_continuous_recognition()
 
     def stop_continuous_recognition(self):
@@ -123,6 +192,12 @@ class AzureSpeechTranscriber:
         logger.info("Stopping continuous recognition...")
         self.recognizer.stop_continuous_recognition()
 
+        # Let the dispatcher drain pending events, then stop it
+        if self._dispatcher is not None:
+            self._events.put(None)
+            self._dispatcher.join()
+            self._dispatcher = None
+
     @staticmethod
     def transcribe_audio_file(audio_file_path: str) -> str:
         """
@@ -142,11 +217,10 @@ class AzureSpeechTranscriber:
 
         logger.info(f"Transcribing audio file: {audio_file_path}")
 
-        # Configure speech service
-        speech_config = speechsdk.SpeechConfig(
-            subscription=settings.azure_speech_key, region=settings.azure_speech_region
+        # Speech config is shared across files; only the audio input is per file
+        speech_config = _get_speech_config(
+            settings.azure_speech_key, settings.azure_speech_region, settings.azure_speech_language
         )
-        speech_config.speech_recognition_language = settings.azure_speech_language
 
         # Configure audio input
         audio_config = speechsdk.audio.AudioConfig(filename=audio_file_path)
@@ -176,7 +250,9 @@ class AzureSpeechTranscriber:
 
     @staticmethod
     def transcribe_audio_file_continuous(
-        audio_file_path: str, on_partial: Optional[Callable[[str], None]] = None
+        audio_file_path: str,
+        on_partial: Optional[Callable[[str], None]] = None,
+        on_final: Optional[Callable[[str], None]] = None,
     ) -> str:
         """
         Transcribe an audio file with continuous recognition.
@@ -184,9 +260,11 @@ class AzureSpeechTranscriber:
         Args:
             audio_file_path: Path to audio file
             on_partial: Optional callback for partial results
+            on_final: Optional sink for recognized text. When given, each
+                      utterance is passed to it instead of being kept in memory
 
         Returns:
-            Complete transcribed text
+            Complete transcribed text (empty if on_final is given)
         """
         if speechsdk is None:
             raise ImportError("Azure Speech SDK not installed")
@@ -196,34 +274,55 @@ class AzureSpeechTranscriber:
 
         logger.info(f"Transcribing audio file (continuous): {audio_file_path}")
 
-        # Configure speech service
-        speech_config = speechsdk.SpeechConfig(
-            subscription=settings.azure_speech_key, region=settings.azure_speech_region
+        # Speech config is shared across files; only the audio input is per file
+        speech_config = _get_speech_config(
+            settings.azure_speech_key, settings.azure_speech_region, settings.azure_speech_language
         )
-        speech_config.speech_recognition_language = settings.azure_speech_language
 
-        # Configure audio input
-        audio_config = speechsdk.audio.AudioConfig(filename=audio_file_path)
+        all_text = []
+        done = threading.Event()
+
+        # WAV files are pushed at real-time pace, since feeding the service faster
+        # than 1x can overflow its buffer and force the session to restart
+        writer = None
+        if audio_file_path.lower().endswith(".wav"):
+            wav_file = wave.open(audio_file_path, "rb")
+            stream = speechsdk.audio.PushAudioInputStream(
+                stream_format=speechsdk.audio.AudioStreamFormat(
+                    samples_per_second=wav_file.getframerate(),
+                    bits_per_sample=wav_file.getsampwidth() * 8,
+                    channels=wav_file.getnchannels(),
+                )
+            )
+            audio_config = speechsdk.audio.AudioConfig(stream=stream)
+            writer = threading.Thread(
+                target=AzureSpeechTranscriber._push_wav_file,
+                args=(wav_file, stream, done),
+                daemon=True,
+            )
+        else:
+            audio_config = speechsdk.audio.AudioConfig(filename=audio_file_path)
 
         # Create recognizer
         recognizer = speechsdk.SpeechRecognizer(
             speech_config=speech_config, audio_config=audio_config
         )
 
-        # Collect all recognized text
-        all_text = []
-        done = False
+        # Recognized text is collected from an SDK thread; list.append is atomic,
+        # and the list is only read after recognition has stopped
 
         def recognized_cb(evt):
             if evt.result.reason == speechsdk.ResultReason.RecognizedSpeech:
                 text = evt.result.text
-                all_text.append(text)
+                if on_final:
+                    on_final(text)
+                else:
+                    all_text.append(text)
                 if on_partial:
                     on_partial(text)
 
         def stop_cb(evt):
-            nonlocal done
-            done = True
+            done.set()
 
         # Connect callbacks
         recognizer.recognized.connect(recognized_cb)
@@ -232,16 +331,46 @@ class AzureSpeechTranscriber:
 
         # Start recognition
         recognizer.start_continuous_recognition()
+        if writer is not None:
+            writer.start()
 
-        # Wait for completion
-        import time
-
-        while not done:
-            time.sleep(0.5)
+        # Block until the session stops or is canceled
+        done.wait()
 
         recognizer.stop_continuous_recognition()
+        if writer is not None:
+            writer.join()
 
         complete_text = " ".join(all_text)
         logger.info(f"Transcription complete: {len(complete_text)} characters")
 
         return complete_text
+
+    @staticmethod
+    def _push_wav_file(
+        wav_file: wave.Wave_read,
+        stream: "speechsdk.audio.PushAudioInputStream",
+        stop: threading.Event,
+    ) -> None:
+        """
+        Write a WAV file's frames to a push stream at real-time pace.
+
+        Args:
+            wav_file: Open WAV file (closed when done)
+            stream: Push stream feeding the recognizer (closed when done)
+            stop: Event set when recognition has ended early
+        """
+        frame_bytes = wav_file.getsampwidth() * wav_file.getnchannels()
+        frames_per_chunk = max(PUSH_CHUNK_BYTES // frame_bytes, 1)
+        chunk_seconds = frames_per_chunk / wav_file.getframerate()
+
+        try:
+            while not stop.is_set():
+                frames = wav_file.readframes(frames_per_chunk)
+                if not frames:
+                    break
+                stream.write(frames)
+                time.sleep(chunk_seconds)
+        finally:
+            stream.close()
+            wav_file.close()
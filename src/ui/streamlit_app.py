@@ -1,8 +1,10 @@
 """Streamlit app for meeting summarization."""
 
 import sys
+import threading
 from pathlib import Path
 
+import orjson
 import streamlit as st
 
 # Add src to path
@@ -11,6 +13,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from src.config import settings
 from src.pipelines.end_to_end import MeetingSummarizationPipeline
 from src.summarization.model_loader import load_finetuned_model
+from src.utils.io import parse_transcript
 from src.utils.logger import logger
 
 # Page config
@@ -19,7 +22,7 @@ st.set_page_config(
 )
 
 
-@st.cache_resource
+@st.cache_resource(max_entries=1)
 def load_models():
     """Load models (cached)."""
     try:
@@ -33,8 +36,64 @@ def load_models():
         return None
 
 
+@st.cache_resource(show_spinner=False)
+def start_model_warmup() -> threading.Thread:
+    """Load models in a background thread, once per server process."""
+    thread = threading.Thread(target=load_models, name="model-warmup", daemon=True)
+    thread.start()
+    return thread
+
+
+def read_upload(uploaded_file) -> str:
+    """
+    Parse an uploaded transcript, reusing the parsed text across reruns.
+
+    Args:
+        uploaded_file: Streamlit UploadedFile
+
+    Returns:
+        Transcript text
+    """
+    # file_id is unique per upload, unlike (name, size), which a different
+    # file can share
+    key = uploaded_file.file_id
+    if st.session_state.get("upload_key") != key:
+        # Uploads are already held in memory, so parse the buffer in place
+        # (JSON bytes go straight to orjson without an intermediate str)
+        st.session_state["upload_text"] = parse_transcript(
+            uploaded_file.getvalue(), Path(uploaded_file.name).suffix
+        )
+        st.session_state["upload_key"] = key
+    return st.session_state["upload_text"]
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def summarize(_pipeline: MeetingSummarizationPipeline, transcript: str, meeting_id: str) -> dict:
+    """Run the pipeline on a transcript (cached, so reruns skip generation)."""
+    return _pipeline.process_transcript(
+        transcript=transcript,
+        meeting_id=meeting_id,
+        metadata={"source": "streamlit"},
+    )
+
+
+@st.cache_data(show_spinner=False)
+def serialize_result(result: dict) -> bytes:
+    """Serialize a pipeline result for the JSON download (cached across reruns)."""
+    return orjson.dumps(result, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+
+
+@st.cache_data(show_spinner=False)
+def render_markdown(_pipeline: MeetingSummarizationPipeline, result: dict) -> str:
+    """Render a pipeline result as Markdown (cached across reruns)."""
+    return _pipeline._generate_markdown_summary(result)
+
+
 def main():
     """Main Streamlit app."""
+    # Start loading models while the page renders
+    start_model_warmup()
+
     st.title("📝 Teams Meeting Summarizer")
     st.markdown(
         "Upload a meeting transcript and get an AI-generated summary with named entity extraction."
@@ -51,19 +110,6 @@ def main():
             "This tool uses fine-tuned BART for summarization and spaCy/HuggingFace for NER."
         )
 
-    # Load pipeline
-    with st.spinner("Loading models..."):
-        pipeline = load_models()
-
-    if pipeline is None:
-        st.error(
-            "❌ Failed to load models. Please ensure models are downloaded and trained."
-        )
-        st.info("Run: `make setup` and `make train` to prepare the models.")
-        return
-
-    st.success("✅ Models loaded successfully!")
-
     # File upload
     st.header("Upload Transcript")
     uploaded_file = st.file_uploader(
@@ -78,13 +124,26 @@ def main():
 
     meeting_id = st.text_input("Meeting ID (optional)", placeholder="e.g., meeting_001")
 
+    # Load pipeline (usually already warm from the background load)
+    with st.spinner("Loading models..."):
+        pipeline = load_models()
+
+    if pipeline is None:
+        st.error(
+            "❌ Failed to load models. Please ensure models are downloaded and trained."
+        )
+        st.info("Run: `make setup` and `make train` to prepare the models.")
+        return
+
+    st.success("✅ Models loaded successfully!")
+
     # Process button
     if st.button("Generate Summary", type="primary"):
         transcript_text = None
 
         # Get transcript from file or text input
         if uploaded_file is not None:
-            transcript_text = uploaded_file.read().decode("utf-8")
+            transcript_text = read_upload(uploaded_file)
             if not meeting_id:
                 meeting_id = Path(uploaded_file.name).stem
         elif text_input.strip():
@@ -98,11 +157,7 @@ def main():
         # Process
         with st.spinner("Processing transcript..."):
             try:
-                result = pipeline.process_transcript(
-                    transcript=transcript_text,
-                    meeting_id=meeting_id,
-                    metadata={"source": "streamlit"},
-                )
+                result = summarize(pipeline, transcript_text, meeting_id)
 
                 # Display results
                 st.header("Results")
@@ -145,25 +200,20 @@ def main():
                 # Download results
                 st.subheader("💾 Download Results")
 
-                import json
-
                 col1, col2 = st.columns(2)
 
                 with col1:
-                    json_data = json.dumps(result, indent=2)
                     st.download_button(
                         label="Download JSON",
-                        data=json_data,
+                        data=serialize_result(result),
                         file_name=f"{meeting_id}_results.json",
                         mime="application/json",
                     )
 
                 with col2:
-                    # Generate markdown
-                    markdown = pipeline._generate_markdown_summary(result)
                     st.download_button(
                         label="Download Markdown",
-                        data=markdown,
+                        data=render_markdown(pipeline, result),
                         file_name=f"{meeting_id}_summary.md",
                         mime="text/markdown",
                     )
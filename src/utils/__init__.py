@@ -1,6 +1,15 @@
 """Utilities module."""
 
-from src.utils.io import load_json, load_transcript, save_json, save_markdown
+from src.utils.io import (
+    iter_teams_export_messages,
+    load_json,
+    load_transcript,
+    load_transcript_summary_pairs,
+    parse_transcript,
+    save_bundle,
+    save_json,
+    save_markdown,
+)
 from src.utils.logger import logger, setup_logger
 from src.utils.metrics import compute_rouge
 
@@ -8,7 +17,11 @@ __all__ = [
     "logger",
     "setup_logger",
     "load_transcript",
+    "load_transcript_summary_pairs",
+    "parse_transcript",
+    "iter_teams_export_messages",
     "load_json",
+    "save_bundle",
     "save_json",
     "save_markdown",
     "compute_rouge",
@@ -1,11 +1,23 @@
 """I/O utilities for loading and saving data."""
 
-import json
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, Union
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+import orjson
 
 from src.utils.logger import logger
 
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# JSON transcripts at least this large are parsed incrementally when ijson is
+# installed, instead of building the whole document in memory
+_STREAM_JSON_MIN_BYTES = 16 * 1024 * 1024
+
 
 def load_transcript(file_path: Union[str, Path]) -> str:
     """
@@ -26,40 +38,159 @@ def load_transcript(file_path: Union[str, Path]) -> str:
     if not file_path.exists():
         raise FileNotFoundError(f"Transcript file not found: {file_path}")
 
+    if file_path.suffix not in (".txt", ".json"):
+        raise ValueError(f"Unsupported file format: {file_path.suffix}")
+
+    if (
+        file_path.suffix == ".json"
+        and ijson is not None
+        and file_path.stat().st_size >= _STREAM_JSON_MIN_BYTES
+    ):
+        content = _load_large_json_transcript(file_path)
+    else:
+        # One read into a single buffer; JSON bytes go to orjson without being decoded
+        content = parse_transcript(file_path.read_bytes(), file_path.suffix)
+
     if file_path.suffix == ".txt":
-        with open(file_path, "r", encoding="utf-8") as f:
-            content = f.read()
         logger.info(f"Loaded text transcript from {file_path}")
-        return content
+    else:
+        logger.info(f"Loaded JSON transcript from {file_path}")
+
+    return content
+
+
+def _load_large_json_transcript(file_path: Path) -> str:
+    """
+    Load a large JSON transcript, streaming its messages if it is a Teams export.
+
+    Args:
+        file_path: Path to a JSON transcript
+
+    Returns:
+        Transcript text
+
+    Raises:
+        ValueError: If the JSON structure is unsupported
+    """
+    with open(file_path, "rb") as fp:
+        try:
+            return _flatten_teams_messages(iter_teams_export_messages(fp))
+        except ValueError:
+            # Not a Teams export (e.g. {"transcript": ...}); parse it whole
+            pass
+
+    return parse_transcript(file_path.read_bytes(), file_path.suffix)
+
+
+def iter_teams_export_messages(fp: BinaryIO) -> Iterator[Dict[str, Any]]:
+    """
+    Stream the messages of a Teams export without loading the whole file.
+
+    Messages are parsed incrementally with ijson when it is installed, so peak
+    memory holds one message rather than the whole document; otherwise the
+    file is read and parsed in one go.
+
+    Args:
+        fp: Teams export opened in binary mode
+
+    Yields:
+        Message dictionaries, in export order
+
+    Raises:
+        ValueError: If the export has no 'messages' field
+    """
+    if ijson is None:
+        data = orjson.loads(fp.read())
+        if "messages" not in data:
+            raise ValueError("Invalid Teams format: missing 'messages' field")
+        yield from data["messages"]
+        return
+
+    has_messages = False
+
+    def events():
+        nonlocal has_messages
+        for event in ijson.parse(fp, use_float=True):
+            if event[0] == "messages":
+                has_messages = True
+            yield event
+
+    yield from ijson.items(events(), "messages.item")
+
+    if not has_messages:
+        raise ValueError("Invalid Teams format: missing 'messages' field")
+
+
+def _flatten_teams_messages(messages: Iterable[Dict[str, Any]]) -> str:
+    """
+    Flatten Teams export messages into "[timestamp] Speaker: text" lines.
+
+    Args:
+        messages: Teams message dictionaries
+
+    Returns:
+        Transcript text
+    """
+    transcript_parts = [
+        f"[{timestamp}] {msg.get('speaker', 'Unknown')}: {msg.get('text', '')}"
+        if (timestamp := msg.get("timestamp"))
+        else f"{msg.get('speaker', 'Unknown')}: {msg.get('text', '')}"
+        for msg in messages
+    ]
+    return "\n".join(transcript_parts)
+
+
+def parse_transcript(content: Union[str, bytes], file_format: str) -> str:
+    """
+    Parse transcript text from in-memory file content.
+
+    Args:
+        content: Raw file content (bytes are decoded as UTF-8; .txt line
+            endings are normalized to '\\n' like a universal-newline read)
+        file_format: File suffix ('.txt' or '.json')
 
-    elif file_path.suffix == ".json":
-        with open(file_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+    Returns:
+        Transcript text
+
+    Raises:
+        ValueError: If file format or JSON structure is unsupported
+    """
+    if file_format == ".txt":
+        text = content.decode("utf-8") if isinstance(content, bytes) else content
+        return text.replace("\r\n", "\n").replace("\r", "\n")
+
+    elif file_format == ".json":
+        # orjson parses bytes and str directly
+        data = orjson.loads(content)
 
         # Handle Teams export format
         if "messages" in data:
-            # Extract transcript from Teams format
-            messages = data.get("messages", [])
-            transcript_parts = []
-            for msg in messages:
-                speaker = msg.get("speaker", "Unknown")
-                text = msg.get("text", "")
-                timestamp = msg.get("timestamp", "")
-                if timestamp:
-                    transcript_parts.append(f"[{timestamp}] {speaker}: {text}")
-                else:
-                    transcript_parts.append(f"{speaker}: {text}")
-            content = "\n".join(transcript_parts)
+            return _flatten_teams_messages(data["messages"])
         elif "transcript" in data:
-            content = data["transcript"]
+            return data["transcript"]
         else:
-            raise ValueError(f"Unsupported JSON structure in {file_path}")
-
-        logger.info(f"Loaded JSON transcript from {file_path}")
-        return content
+            raise ValueError("Unsupported JSON transcript structure")
 
     else:
-        raise ValueError(f"Unsupported file format: {file_path.suffix}")
+        raise ValueError(f"Unsupported file format: {file_format}")
+
+
+def _atomic_write(file_path: Path, payload: bytes) -> None:
+    """
+    Write a file atomically, so readers never see a partially written file.
+
+    Args:
+        file_path: Destination path
+        payload: File content
+    """
+    tmp_path = file_path.with_suffix(file_path.suffix + ".tmp")
+    tmp_path.write_bytes(payload)
+    os.replace(tmp_path, file_path)
+
+
+def _dump_json(data: Any) -> bytes:
+    """Serialize data as indented JSON bytes."""
+    return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
 
 
 def save_json(data: Dict[str, Any], file_path: Union[str, Path]) -> None:
@@ -73,8 +204,7 @@ def save_json(data: Dict[str, Any], file_path: Union[str, Path]) -> None:
     file_path = Path(file_path)
     file_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(file_path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    _atomic_write(file_path, _dump_json(data))
 
     logger.info(f"Saved JSON to {file_path}")
 
@@ -90,12 +220,34 @@ def save_markdown(content: str, file_path: Union[str, Path]) -> None:
     file_path = Path(file_path)
     file_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(file_path, "w", encoding="utf-8") as f:
-        f.write(content)
+    _atomic_write(file_path, content.encode("utf-8"))
 
     logger.info(f"Saved Markdown to {file_path}")
 
 
+def save_bundle(dir_path: Union[str, Path], files: Dict[str, Any]) -> None:
+    """
+    Save several files into one directory, creating it only once.
+
+    Args:
+        dir_path: Output directory
+        files: Mapping of file names to content. Bytes are written as-is, str as
+               UTF-8 text and anything else as indented JSON.
+    """
+    dir_path = Path(dir_path)
+    dir_path.mkdir(parents=True, exist_ok=True)
+
+    for name, content in files.items():
+        if isinstance(content, str):
+            content = content.encode("utf-8")
+        elif not isinstance(content, bytes):
+            content = _dump_json(content)
+
+        _atomic_write(dir_path / name, content)
+
+    logger.info(f"Saved {', '.join(files)} to {dir_path}")
+
+
 def load_json(file_path: Union[str, Path]) -> Dict[str, Any]:
     """
     Load JSON file.
@@ -114,8 +266,75 @@ def load_json(file_path: Union[str, Path]) -> Dict[str, Any]:
     if not file_path.exists():
         raise FileNotFoundError(f"JSON file not found: {file_path}")
 
-    with open(file_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    data = orjson.loads(file_path.read_bytes())
 
     logger.info(f"Loaded JSON from {file_path}")
     return data
+
+
+def _read_pair(transcript_path: str, summary_path: Path) -> Optional[Tuple[str, str]]:
+    """
+    Read a transcript and its reference summary.
+
+    Args:
+        transcript_path: Path to the transcript file
+        summary_path: Path to the reference summary file
+
+    Returns:
+        Tuple of (transcript, summary), or None if the summary is missing
+    """
+    try:
+        summary = summary_path.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return None
+
+    return Path(transcript_path).read_text(encoding="utf-8").strip(), summary.strip()
+
+
+def load_transcript_summary_pairs(
+    transcripts_dir: Union[str, Path],
+    summaries_dir: Union[str, Path],
+    max_workers: int = 16,
+) -> Tuple[List[str], List[str]]:
+    """
+    Load .txt transcripts and the summaries with the same file names.
+
+    Files are listed with os.scandir (no stat per file) and read in parallel,
+    which overlaps disk latency on slow or network storage.
+
+    Args:
+        transcripts_dir: Directory containing transcript files
+        summaries_dir: Directory containing summary files
+        max_workers: Maximum number of concurrent file reads
+
+    Returns:
+        Tuple of (transcripts, summaries), sorted by file name. Transcripts
+        without a summary are skipped.
+    """
+    summaries_dir = Path(summaries_dir)
+
+    with os.scandir(transcripts_dir) as it:
+        entries = sorted(
+            (entry for entry in it if entry.name.endswith(".txt") and entry.is_file()),
+            key=lambda entry: entry.name,
+        )
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pairs = list(
+            executor.map(
+                lambda entry: _read_pair(entry.path, summaries_dir / entry.name), entries
+            )
+        )
+
+    transcripts = []
+    summaries = []
+
+    for entry, pair in zip(entries, pairs):
+        if pair is None:
+            logger.warning(f"Summary not found for {entry.name}, skipping")
+            continue
+
+        transcripts.append(pair[0])
+        summaries.append(pair[1])
+
+    return transcripts, summaries
@@ -1,9 +1,28 @@
 """Metrics computation utilities."""
 
-from typing import Dict, List
+from functools import lru_cache
+from typing import Dict, List, Tuple
 
+import numpy as np
 from rouge_score import rouge_scorer
 
+ROUGE_METRICS = ("rouge1", "rouge2", "rougeL")
+
+
+@lru_cache(maxsize=8)
+def _get_scorer(metrics: Tuple[str, ...], use_stemmer: bool) -> rouge_scorer.RougeScorer:
+    """
+    Return a shared ROUGE scorer, built once per configuration.
+
+    Args:
+        metrics: ROUGE variants to compute
+        use_stemmer: Whether to apply Porter stemming to tokens
+
+    Returns:
+        Cached RougeScorer instance
+    """
+    return rouge_scorer.RougeScorer(list(metrics), use_stemmer=use_stemmer)
+
 
 def compute_rouge(
     predictions: List[str], references: List[str]
@@ -18,31 +37,37 @@ def compute_rouge(
     Returns:
         Dictionary containing ROUGE-1, ROUGE-2, and ROUGE-L scores
         with precision, recall, and F1 for each
+
+    Raises:
+        ValueError: If predictions and references differ in length
     """
-    scorer = rouge_scorer.RougeScorer(["rouge1", "rouge2", "rougeL"], use_stemmer=True)
+    if len(predictions) != len(references):
+        raise ValueError(
+            f"Got {len(predictions)} predictions but {len(references)} references"
+        )
 
-    scores = {
-        "rouge1": {"precision": [], "recall": [], "fmeasure": []},
-        "rouge2": {"precision": [], "recall": [], "fmeasure": []},
-        "rougeL": {"precision": [], "recall": [], "fmeasure": []},
-    }
+    scorer = _get_scorer(ROUGE_METRICS, True)
+
+    # Running (precision, recall, fmeasure) sums, one row per metric
+    totals = np.zeros((len(ROUGE_METRICS), 3), dtype=np.float64)
 
     for pred, ref in zip(predictions, references):
+        # An empty side scores zero on every metric, so skip tokenizing the other
+        if not pred or not ref:
+            continue
+
         score = scorer.score(ref, pred)
-        for metric_name in ["rouge1", "rouge2", "rougeL"]:
-            scores[metric_name]["precision"].append(score[metric_name].precision)
-            scores[metric_name]["recall"].append(score[metric_name].recall)
-            scores[metric_name]["fmeasure"].append(score[metric_name].fmeasure)
-
-    # Calculate averages
-    avg_scores = {}
-    for metric_name in ["rouge1", "rouge2", "rougeL"]:
-        avg_scores[metric_name] = {
-            "precision": sum(scores[metric_name]["precision"])
-            / len(scores[metric_name]["precision"]),
-            "recall": sum(scores[metric_name]["recall"]) / len(scores[metric_name]["recall"]),
-            "fmeasure": sum(scores[metric_name]["fmeasure"])
-            / len(scores[metric_name]["fmeasure"]),
-        }
+        for i, metric_name in enumerate(ROUGE_METRICS):
+            totals[i] += score[metric_name]
+
+    # Calculate averages (all zeros for empty input)
+    averages = totals / max(len(predictions), 1)
 
-    return avg_scores
+    return {
+        metric_name: {
+            "precision": float(row[0]),
+            "recall": float(row[1]),
+            "fmeasure": float(row[2]),
+        }
+        for metric_name, row in zip(ROUGE_METRICS, averages)
+    }
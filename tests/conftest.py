@@ -28,21 +28,21 @@ SAMPLE_TRANSCRIPT = """[10:00 AM] Alice Smith: Welcome everyone to the project k
 SAMPLE_SUMMARY = """The team held a project kickoff meeting to plan the launch of a new product by Q4. The project will consist of three main components (frontend, backend API, and database) with a 12-week timeline. A budget of $50,000 has been approved, which Carol will manage. The team decided to hire an additional engineer to meet the deadline, and Alice will coordinate with HR. The main risk identified is potential delays from third-party API integration."""
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_transcript():
     """Provide a sample transcript for testing."""
     return SAMPLE_TRANSCRIPT
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_summary():
     """Provide a sample summary for testing."""
     return SAMPLE_SUMMARY
 
 
-@pytest.fixture
-def temp_transcript_file(tmp_path):
-    """Create a temporary transcript file."""
-    file_path = tmp_path / "test_meeting.txt"
+@pytest.fixture(scope="session")
+def temp_transcript_file(tmp_path_factory):
+    """Create a temporary transcript file (shared by the session; do not modify)."""
+    file_path = tmp_path_factory.mktemp("transcripts") / "test_meeting.txt"
     file_path.write_text(SAMPLE_TRANSCRIPT)
     return file_path
@@ -7,23 +7,27 @@ from unittest.mock import MagicMock, patch
 from src.api.main import app
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def client():
-    """Create test client."""
+    """Create test client, shared by the module (startup events are not run)."""
     return TestClient(app)
 
 
 @pytest.fixture(autouse=True)
 def mock_pipeline_global():
     """Mock the global pipeline to avoid loading models."""
+    from src.api.endpoints import response_cache
+
+    response_cache.clear()
+
     with patch("src.api.main.pipeline") as mock_pipe:
         with patch("src.api.endpoints.main.pipeline", mock_pipe):
             mock_pipe.process_transcript = MagicMock(
-                return_value={
-                    "meeting_id": "test",
+                side_effect=lambda transcript, meeting_id=None, metadata=None: {
+                    "meeting_id": meeting_id or "test",
                     "summary": "Test summary",
                     "entities": {"total_unique_entities": 5, "backend": "spacy"},
-                    "metadata": {},
+                    "metadata": metadata or {},
                     "transcript_length": 100,
                     "cleaned_transcript_length": 95,
                     "summary_length": 20,
@@ -63,6 +67,19 @@ def test_summarize_endpoint(client):
     assert "compression_ratio" in data
 
 
+def test_summarize_endpoint_cached(client, mock_pipeline_global):
+    """Test repeated transcripts are served from the response cache."""
+    transcript = "This is a repeated meeting transcript with enough content to be valid."
+
+    first = client.post("/summarize", json={"transcript": transcript, "meeting_id": "first"})
+    second = client.post("/summarize", json={"transcript": transcript, "meeting_id": "second"})
+
+    assert first.status_code == 200
+    assert second.status_code == 200
+    assert second.json()["meeting_id"] == "second"
+    assert mock_pipeline_global.process_transcript.call_count == 1
+
+
 def test_summarize_endpoint_validation(client):
     """Test validation on summarize endpoint."""
     # Too short transcript
@@ -96,3 +113,14 @@ def test_summarize_file_invalid_extension(client):
     )
 
     assert response.status_code == 400
+
+
+def test_summarize_file_too_large(client):
+    """Test file upload exceeding the size limit."""
+    with patch("src.api.endpoints.settings.max_upload_bytes", 10):
+        response = client.post(
+            "/summarize-file",
+            files={"file": ("big.txt", b"x" * 100, "text/plain")},
+        )
+
+    assert response.status_code == 413
@@ -6,6 +6,16 @@ from unittest.mock import MagicMock, patch
 from src.pipelines.end_to_end import MeetingSummarizationPipeline
 
 
+@pytest.fixture(autouse=True)
+def clear_ner_model_caches():
+    """Drop NER models cached by earlier tests, which patch the loaders."""
+    from src.ner.hf_ner import _get_hf_pipeline
+    from src.ner.spacy_ner import _load_spacy
+
+    _get_hf_pipeline.cache_clear()
+    _load_spacy.cache_clear()
+
+
 @pytest.fixture
 def mock_pipeline():
     """Create a mocked pipeline for testing."""
@@ -21,16 +31,20 @@ def mock_pipeline():
             )
 
             # Mock NER results
+            formatted_entities = {
+                "backend": "spacy",
+                "total_unique_entities": 5,
+                "entity_types": ["PERSON", "ORG"],
+                "entities_by_type": {
+                    "PERSON": [{"entity": "Alice Smith", "count": 3, "examples": []}],
+                    "ORG": [{"entity": "Acme Corp", "count": 1, "examples": []}],
+                },
+            }
             pipeline.ner_extractor.extract_and_format = MagicMock(
-                return_value={
-                    "backend": "spacy",
-                    "total_unique_entities": 5,
-                    "entity_types": ["PERSON", "ORG"],
-                    "entities_by_type": {
-                        "PERSON": [{"entity": "Alice Smith", "count": 3, "examples": []}],
-                        "ORG": [{"entity": "Acme Corp", "count": 1, "examples": []}],
-                    },
-                }
+                return_value=formatted_entities
+            )
+            pipeline.ner_extractor.extract_and_format_batch = MagicMock(
+                side_effect=lambda texts: [formatted_entities] * len(texts)
             )
 
             yield pipeline
@@ -83,3 +97,264 @@ def test_markdown_generation(mock_pipeline, sample_transcript):
     assert "## Named Entities" in markdown
     assert "## Metadata" in markdown
     assert "Alice Smith" in markdown
+
+
+def test_process_batch(mock_pipeline, temp_transcript_file, tmp_path):
+    """Test batched processing of multiple files."""
+    second_file = tmp_path / "second_meeting.txt"
+    second_file.write_text(temp_transcript_file.read_text())
+
+    with patch("src.pipelines.end_to_end.batch_generate") as mock_batch:
+        mock_batch.return_value = ["Summary one", "Summary two"]
+
+        results = mock_pipeline.process_batch(
+            [temp_transcript_file, second_file], output_dir=tmp_path / "output", batch_size=2
+        )
+
+    assert mock_batch.call_count == 1
+    mock_pipeline.ner_extractor.extract_and_format_batch.assert_called_once()
+    assert [r["meeting_id"] for r in results] == ["test_meeting", "second_meeting"]
+    assert [r["summary"] for r in results] == ["Summary one", "Summary two"]
+    assert (tmp_path / "output" / "test_meeting" / "summary.md").exists()
+    assert (tmp_path / "output" / "second_meeting" / "summary.md").exists()
+
+
+def test_process_batch_generation_fallback(mock_pipeline, temp_transcript_file, tmp_path):
+    """Test a failed batch is retried per file and only the failing file is skipped."""
+    second_file = tmp_path / "second_meeting.txt"
+    second_file.write_text("Bob: second meeting")
+
+    def summarize(text, model, tokenizer):
+        if "second meeting" in text:
+            raise RuntimeError("CUDA out of memory")
+        return "Per-file summary"
+
+    with patch("src.pipelines.end_to_end.batch_generate", side_effect=RuntimeError("OOM")):
+        with patch("src.pipelines.end_to_end.generate_summary", side_effect=summarize):
+            results = mock_pipeline.process_batch(
+                [temp_transcript_file, second_file], output_dir=tmp_path / "output", batch_size=2
+            )
+
+    assert [r["meeting_id"] for r in results] == ["test_meeting"]
+    assert results[0]["summary"] == "Per-file summary"
+
+
+def test_hf_ner_aggregation():
+    """Test HuggingFace NER counts and average confidence per entity."""
+    from src.ner.hf_ner import HuggingFaceNER
+
+    raw_entities = [
+        {"entity_group": "PER", "word": "Alice", "score": 0.9, "start": 0, "end": 5},
+        {"entity_group": "PER", "word": "Alice ", "score": 0.7, "start": 20, "end": 25},
+        {"entity_group": "ORG", "word": "Acme", "score": 0.8, "start": 30, "end": 34},
+        {"entity_group": "PER", "word": "Bob", "score": 0.6, "start": 40, "end": 43},
+    ]
+
+    with patch("src.ner.hf_ner.pipeline") as mock_hf_pipeline:
+        mock_hf_pipeline.return_value = MagicMock(return_value=[raw_entities])
+        ner = HuggingFaceNER(model_name="test-model")
+
+    entities = ner.extract_entities("Alice met Bob at Acme.")
+
+    assert list(entities) == ["PERSON", "ORGANIZATION"]
+    alice, bob = entities["PERSON"]
+    assert alice["entity"] == "Alice"
+    assert alice["count"] == 2
+    assert alice["avg_confidence"] == pytest.approx(0.8)
+    assert alice["examples"] == [{"start": 0, "end": 5}, {"start": 20, "end": 25}]
+    assert bob["count"] == 1
+    assert bob["avg_confidence"] == pytest.approx(0.6)
+
+
+def test_hf_ner_long_text_chunking():
+    """Test long transcripts are split into windows and offsets mapped back."""
+    from src.ner.hf_ner import HuggingFaceNER
+
+    text = "word " * 1000  # 5000 characters
+
+    def entity(start):
+        return {
+            "entity_group": "PER",
+            "word": "Alice",
+            "score": 0.9,
+            "start": start,
+            "end": start + 5,
+        }
+
+    def fake_ner(windows, batch_size):
+        # Windows start at 0, 1600 and 3200; position 1650 lies in the first overlap
+        return [[entity(1000), entity(1650)], [entity(50), entity(1000)], [entity(1000)]]
+
+    with patch("src.ner.hf_ner.pipeline") as mock_hf_pipeline:
+        mock_hf_pipeline.return_value = MagicMock(side_effect=fake_ner)
+        ner = HuggingFaceNER(model_name="test-model", batch_size=4)
+
+    entities = ner.extract_entities(text)
+
+    windows = ner.pipeline.call_args.args[0]
+    assert len(windows) == 3
+    assert ner.pipeline.call_args.kwargs["batch_size"] == 4
+    # The entity seen by both overlapping windows is only counted once
+    assert entities["PERSON"][0]["count"] == 4
+    assert entities["PERSON"][0]["examples"] == [
+        {"start": 1000, "end": 1005},
+        {"start": 1650, "end": 1655},
+        {"start": 2600, "end": 2605},
+    ]
+
+
+def test_spacy_ner_batch():
+    """Test batched spaCy NER matches per-text extraction."""
+    import spacy
+
+    from src.ner.spacy_ner import SpacyNER
+
+    nlp = spacy.blank("en")
+    ruler = nlp.add_pipe("entity_ruler", name="ner")
+    ruler.add_patterns([{"label": "PERSON", "pattern": "Alice"}])
+
+    with patch("src.ner.spacy_ner.spacy.load", return_value=nlp):
+        ner = SpacyNER(model_name="test-model")
+
+    texts = ["Alice spoke. Alice agreed.", "Nobody here.", "Thanks Alice."]
+    results = ner.extract_entities_batch(texts)
+
+    assert results == [ner.extract_entities(text) for text in texts]
+    assert results[0]["PERSON"][0]["count"] == 2
+    assert results[1] == {}
+
+
+def test_ner_extractor_cache():
+    """Test repeated texts are served from the NER cache."""
+    from src.ner.unified_ner import NERExtractor
+
+    with patch("src.ner.unified_ner.SpacyNER") as mock_spacy:
+        mock_spacy.return_value.extract_entities.return_value = {"PERSON": []}
+        extractor = NERExtractor(backend="spacy", cache_size=1)
+
+        extractor.extract_and_format("first")
+        extractor.get_entity_summary("first")
+        extractor.extract_entities("second")
+        extractor.extract_entities("first")
+
+    assert mock_spacy.return_value.extract_entities.call_count == 3
+
+
+def test_ner_extractor_cache_returns_copies():
+    """Test callers cannot mutate cached entities."""
+    from src.ner.unified_ner import NERExtractor
+
+    with patch("src.ner.unified_ner.SpacyNER") as mock_spacy:
+        mock_spacy.return_value.extract_entities.return_value = {"PERSON": [{"count": 1}]}
+        extractor = NERExtractor(backend="spacy")
+
+        extractor.extract_entities("text")["PERSON"][0]["count"] = 99
+        cached = extractor.extract_entities("text")
+
+    assert cached == {"PERSON": [{"count": 1}]}
+    assert mock_spacy.return_value.extract_entities.call_count == 1
+
+
+def test_ner_extractor_batch():
+    """Test batched extraction serves cached texts and batches the rest."""
+    from src.ner.unified_ner import NERExtractor
+
+    with patch("src.ner.unified_ner.SpacyNER") as mock_spacy:
+        backend = mock_spacy.return_value
+        backend.extract_entities.return_value = {"PERSON": ["cached"]}
+        backend.extract_entities_batch.side_effect = lambda texts, top_k=None: [
+            {"PERSON": [text]} for text in texts
+        ]
+        extractor = NERExtractor(backend="spacy")
+
+        extractor.extract_entities("first")
+        results = extractor.extract_and_format_batch(["first", "second", "third"])
+
+    backend.extract_entities_batch.assert_called_once_with(["second", "third"], top_k=None)
+    assert [r["entities_by_type"]["PERSON"] for r in results] == [
+        ["cached"],
+        ["second"],
+        ["third"],
+    ]
+
+
+def test_spacy_ner_top_k():
+    """Test top_k keeps only the most frequent entities per type."""
+    import spacy
+
+    from src.ner.spacy_ner import SpacyNER
+
+    nlp = spacy.blank("en")
+    ruler = nlp.add_pipe("entity_ruler", name="ner")
+    ruler.add_patterns(
+        [{"label": "PERSON", "pattern": name} for name in ("Alice", "Bob", "Carol")]
+    )
+
+    with patch("src.ner.spacy_ner.spacy.load", return_value=nlp):
+        ner = SpacyNER(model_name="test-model")
+
+    text = "Bob and Alice. Carol and Alice. Bob and Alice."
+    entities = ner.extract_entities(text, top_k=2)
+
+    assert [e["entity"] for e in entities["PERSON"]] == ["Alice", "Bob"]
+    assert ner.extract_entities(text)["PERSON"][:2] == entities["PERSON"]
+
+
+def test_entity_identity_key_dedup():
+    """Test case, punctuation and corporate-suffix variants are merged."""
+    import spacy
+
+    from src.ner.spacy_ner import SpacyNER
+
+    nlp = spacy.blank("en")
+    ruler = nlp.add_pipe("entity_ruler", name="ner")
+    ruler.add_patterns(
+        [
+            {"label": "ORG", "pattern": [{"LOWER": "microsoft"}, {"LOWER": "corp"}]},
+            {"label": "ORG", "pattern": [{"LOWER": "microsoft"}]},
+        ]
+    )
+
+    with patch("src.ner.spacy_ner.spacy.load", return_value=nlp):
+        ner = SpacyNER(model_name="test-model")
+
+    entities = ner.extract_entities("Microsoft Corp met Microsoft. Then microsoft left.")
+
+    assert len(entities["ORG"]) == 1
+    assert entities["ORG"][0]["count"] == 3
+    assert entities["ORG"][0]["entity"] == "Microsoft Corp"
+
+
+def test_hf_ner_pipeline_reused():
+    """Test the HuggingFace NER pipeline is loaded once per model name."""
+    from src.ner.hf_ner import HuggingFaceNER
+
+    with patch("src.ner.hf_ner.pipeline") as mock_hf_pipeline:
+        first = HuggingFaceNER(model_name="test-model")
+        second = HuggingFaceNER(model_name="test-model")
+
+    assert mock_hf_pipeline.call_count == 1
+    assert first.pipeline is second.pipeline
+
+
+def test_hf_models_use_configured_cache():
+    """Test HF models load from the configured cache, whenever HF was imported."""
+    from src.config import settings
+    from src.ner.hf_ner import HuggingFaceNER
+    from src.summarization.model_loader import load_base_model
+
+    with patch("src.ner.hf_ner.pipeline") as mock_hf_pipeline:
+        HuggingFaceNER(model_name="test-model")
+
+    model_kwargs = mock_hf_pipeline.call_args.kwargs["model_kwargs"]
+    assert model_kwargs["cache_dir"] == str(settings.transformers_cache)
+
+    with patch("src.summarization.model_loader.AutoTokenizer") as mock_tokenizer, patch(
+        "src.summarization.model_loader.AutoModelForSeq2SeqLM"
+    ) as mock_model, patch("src.summarization.model_loader._check_fast_tokenizer"):
+        mock_model.from_pretrained.return_value.to.return_value.num_parameters.return_value = 1
+        load_base_model()
+
+    for loader in (mock_tokenizer, mock_model):
+        assert loader.from_pretrained.call_args.kwargs["cache_dir"] == settings.transformers_cache
+    assert settings.transformers_cache.is_relative_to(settings.project_root)
@@ -1,19 +1,56 @@
 """Tests for preprocessing modules."""
 
+import io
+import json
+from datetime import time
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
 import pytest
 
 from src.preprocess.cleaner import clean_transcript, normalize_speaker_names
-from src.preprocess.segmenter import parse_teams_format, segment_by_speaker
+from src.preprocess.segmenter import (
+    TranscriptSegment,
+    TranscriptSegments,
+    _parse_timestamp,
+    iter_teams_messages,
+    parse_teams_format,
+    segment_by_known_speakers,
+    segment_by_speaker,
+)
+from src.utils import io as io_utils
 
 
-def test_clean_transcript():
+@pytest.mark.parametrize(
+    "dirty_text,expected",
+    [
+        ("Hello    world\n\n\n\nMultiple   spaces", "Hello world\n\nMultiple spaces"),
+        ("  padded  ", "padded"),
+        ("l1ke 0n time", "like on time"),
+    ],
+)
+def test_clean_transcript(dirty_text, expected):
     """Test transcript cleaning."""
-    dirty_text = "Hello    world\n\n\n\nMultiple   spaces"
     cleaned = clean_transcript(dirty_text)
 
     assert "  " not in cleaned  # No double spaces
     assert "\n\n\n" not in cleaned  # Max 2 newlines
-    assert cleaned == "Hello world\n\nMultiple spaces"
+    assert cleaned == expected
+
+
+def test_clean_transcript_cache_follows_settings():
+    """Test the clean cache size is read at call time, not at import."""
+    from src.preprocess import cleaner
+
+    with patch.object(cleaner.settings, "clean_cache_size", 4):
+        assert clean_transcript("a  b") == "a b"
+        assert clean_transcript("a  b") == "a b"
+        assert cleaner._clean_cache.cache_info().hits == 1
+
+    with patch.object(cleaner.settings, "clean_cache_size", 0):
+        hits = cleaner._clean_cache.cache_info().hits
+        assert clean_transcript("a  b") == "a b"
+        assert cleaner._clean_cache.cache_info().hits == hits
 
 
 def test_normalize_speaker_names():
@@ -25,24 +62,181 @@ def test_normalize_speaker_names():
     assert "[10:00 AM]" not in normalized or ":" in normalized
 
 
+def test_normalize_speaker_names_combined():
+    """Test titles, dashes and timestamps are all normalized, including on one line."""
+    text = "[10:00 AM] John Smith (PM): Hi\nBob - Ok\nAlice (CEO): Yes"
+    normalized = normalize_speaker_names(text)
+
+    assert normalized == "John Smith: Hi\nBob: Ok\nAlice: Yes"
+
+
 def test_segment_by_speaker(sample_transcript):
     """Test speaker segmentation."""
     segments = segment_by_speaker(sample_transcript)
 
     assert len(segments) > 0
-    assert all(hasattr(seg, "speaker") for seg in segments)
-    assert all(hasattr(seg, "text") for seg in segments)
+    assert all(isinstance(seg, TranscriptSegment) for seg in segments)
 
     # Check specific speakers
-    speakers = [seg.speaker for seg in segments]
-    assert "Alice Smith" in speakers
-    assert "Bob Johnson" in speakers
-    assert "Carol Davis" in speakers
+    assert {"Alice Smith", "Bob Johnson", "Carol Davis"} <= set(segments.speakers)
 
 
-def test_parse_teams_format():
-    """Test Teams JSON format parsing."""
-    teams_data = {
+def test_segment_by_speaker_multiline_turns():
+    """Test turns spanning several lines and mixed timestamp formats."""
+    text = (
+        "[10:00 AM] Alice Smith: First line\nsecond line\n\n"
+        "Bob: Reply\n[10:02 AM] Alice Smith: Bye"
+    )
+    segments = segment_by_speaker(text)
+
+    assert [seg.speaker for seg in segments] == ["Alice Smith", "Bob", "Alice Smith"]
+    assert segments[0].text == "First line\nsecond line"
+    assert segments[0].timestamp == "10:00 AM"
+    assert segments[1].timestamp is None
+    assert segments[2].text == "Bye"
+
+
+def test_transcript_segments_list_behavior():
+    """Test segments slice, index and mutate like a list of TranscriptSegment."""
+    segments = segment_by_speaker("Alice: one\nBob: two\nCarol: three\nDan: four")
+
+    sliced = segments[1:3]
+    assert isinstance(sliced, TranscriptSegments)
+    assert [seg.speaker for seg in sliced] == ["Bob", "Carol"]
+    assert segments[-1].text == "four"
+    with pytest.raises(IndexError):
+        segments[4]
+
+    segments[0].text = "uno"
+    for seg in segments:
+        seg.speaker = seg.speaker.upper()
+    assert segments.texts[0] == "uno"
+    assert segments.speakers == ["ALICE", "BOB", "CAROL", "DAN"]
+    assert sliced.speakers == ["Bob", "Carol"]  # Slices are copies
+
+    segments.append(TranscriptSegment("Eve", "five", "10:00", 4))
+    segments[1] = TranscriptSegment("Frank", "deux")
+    assert segments[-1].to_dict() == {
+        "speaker": "Eve",
+        "text": "five",
+        "timestamp": "10:00",
+        "start_line": 4,
+    }
+    assert segments[1].to_dict() == {
+        "speaker": "Frank",
+        "text": "deux",
+        "timestamp": None,
+        "start_line": None,
+    }
+
+
+def test_segment_by_speaker_punctuated_names():
+    """Test names with apostrophes, hyphens and accents, and lines that aren't turns."""
+    segments = segment_by_speaker(
+        "Alice: hi\n[10:00] Mary-Jane: hola\nJosé García: olá\n[crosstalk] ...\nBob: yo"
+    )
+
+    assert [seg.speaker for seg in segments] == ["Alice", "Mary-Jane", "José García", "Bob"]
+    assert segments[1].text == "hola"
+    assert segments[2].text == "olá\n[crosstalk] ..."
+
+
+def test_segment_by_speaker_meeting_004():
+    """Test no turn of the synthetic meeting_004 transcript is dropped."""
+    path = Path(__file__).parent.parent / "data" / "synthetic" / "transcripts" / "meeting_004.txt"
+    text = path.read_text(encoding="utf-8")
+    segments = segment_by_speaker(text)
+
+    assert len(segments) == len(text.strip().split("\n\n"))
+    assert segments.speakers.count("Nurse Kevin O'Brien") == text.count("Nurse Kevin O'Brien:")
+
+
+def test_segment_by_known_speakers():
+    """Test only known speaker names at line starts begin a turn."""
+    text = (
+        "[10:00 AM] Ann Lee: Hello\nNote: not a speaker\n"
+        "Lee: Hi\nJo Ann: Also not a speaker\nAnn Lee: Bye"
+    )
+    segments = segment_by_known_speakers(text, ["Ann Lee", "Lee"])
+
+    assert [seg.speaker for seg in segments] == ["Ann Lee", "Lee", "Ann Lee"]
+    assert segments[0].text == "Hello\nNote: not a speaker"
+    assert segments[0].timestamp == "10:00 AM"
+    assert segments[1].text == "Hi\nJo Ann: Also not a speaker"
+
+
+def test_segment_by_speaker_ner_fallback():
+    """Test the opt-in spaCy fallback finds speakers the speaker pattern misses."""
+    import spacy
+
+    nlp = spacy.blank("en")
+    ruler = nlp.add_pipe("entity_ruler", name="ner")
+    ruler.add_patterns(
+        [
+            {"label": "PERSON", "pattern": "josé garcía"},
+            {"label": "PERSON", "pattern": "émilie"},
+        ]
+    )
+
+    text = "\n".join(
+        ["josé garcía: Let's review the roadmap for next quarter in detail."] * 4
+        + ["émilie: Sounds good, I will prepare the slides and share them."] * 4
+    )
+    assert len(text) >= 500
+
+    with patch("src.ner.spacy_ner._load_spacy", return_value=nlp) as load_spacy:
+        assert len(segment_by_speaker(text)) <= 1
+        load_spacy.assert_not_called()
+
+        segments = segment_by_speaker(text, use_ner_fallback=True)
+
+    assert [seg.speaker for seg in segments] == ["josé garcía"] * 4 + ["émilie"] * 4
+
+
+def test_segment_by_speaker_ner_fallback_bounded():
+    """Test the spaCy fallback only scans a leading slice and survives spaCy errors."""
+    import spacy
+
+    nlp = spacy.blank("en")
+    nlp.max_length = 1_000
+    text = "\n".join(["just some notes without any speaker labels"] * 100)
+    assert len(text) > nlp.max_length
+
+    with patch("src.ner.spacy_ner._load_spacy", return_value=nlp):
+        assert len(segment_by_speaker(text, use_ner_fallback=True)) <= 1
+
+    failing = MagicMock(max_length=1_000_000, side_effect=ValueError("[E088] Text too long"))
+    with patch("src.ner.spacy_ner._load_spacy", return_value=failing):
+        assert len(segment_by_speaker(text, use_ner_fallback=True)) <= 1
+
+
+@pytest.mark.parametrize(
+    "timestamp,expected",
+    [
+        ("10:15 AM", time(10, 15)),
+        ("12:05 am", time(0, 5)),
+        ("10:15:30 PM", time(22, 15, 30)),
+        ("14:30", time(14, 30)),
+        ("9:30:45", time(9, 30, 45)),
+    ],
+)
+def test_parse_timestamp_formats(timestamp, expected):
+    """Test all supported time formats parse to the expected time."""
+    assert _parse_timestamp(timestamp).time() == expected
+
+
+def test_parse_timestamp_iso_and_invalid():
+    """Test ISO timestamps keep their date and invalid times are rejected."""
+    assert _parse_timestamp("2024-10-15T10:00:00").isoformat() == "2024-10-15T10:00:00"
+
+    with pytest.raises(ValueError):
+        _parse_timestamp("25:00")
+
+
+@pytest.fixture(scope="module")
+def teams_data():
+    """Provide a small Teams export, shared by the module (do not modify)."""
+    return {
         "messages": [
             {
                 "timestamp": "2024-10-15T10:00:00Z",
@@ -57,6 +251,9 @@ def test_parse_teams_format():
         ]
     }
 
+
+def test_parse_teams_format(teams_data):
+    """Test Teams JSON format parsing."""
     transcript = parse_teams_format(teams_data)
 
     assert "John Doe" in transcript
@@ -64,8 +261,49 @@ def test_parse_teams_format():
     assert "Hello everyone" in transcript
     assert "Hi John" in transcript
 
+    # Raw JSON exports parse the same way
+    assert parse_teams_format(json.dumps(teams_data).encode("utf-8")) == transcript
+
+    # Streaming the export yields the same lines
+    export = io.BytesIO(json.dumps(teams_data).encode("utf-8"))
+    assert "\n\n".join(iter_teams_messages(export)) == transcript
 
-def test_parse_teams_format_invalid():
+
+@pytest.mark.parametrize("streaming", [True, False])
+def test_parse_teams_format_invalid(streaming):
     """Test Teams format parsing with invalid data."""
     with pytest.raises(ValueError):
         parse_teams_format({"invalid": "data"})
+
+    # The streaming parser rejects it too, with or without ijson
+    export = io.BytesIO(b'{"invalid": "data"}')
+    with patch("src.utils.io.ijson", io_utils.ijson if streaming else None):
+        with pytest.raises(ValueError, match="missing 'messages'"):
+            list(iter_teams_messages(export))
+
+
+def test_load_transcript_streams_large_json(teams_data, tmp_path):
+    """Test large JSON transcripts load the same whether streamed or not."""
+    teams_path = tmp_path / "teams.json"
+    teams_path.write_text(json.dumps(teams_data))
+    plain_path = tmp_path / "plain.json"
+    plain_path.write_text(json.dumps({"transcript": "Alice: hi"}))
+
+    expected = io_utils.load_transcript(teams_path)
+    with patch("src.utils.io._STREAM_JSON_MIN_BYTES", 0), patch(
+        "src.utils.io.iter_teams_export_messages", wraps=io_utils.iter_teams_export_messages
+    ) as stream:
+        assert io_utils.load_transcript(teams_path) == expected
+        assert io_utils.load_transcript(plain_path) == "Alice: hi"
+
+    assert stream.call_count == (2 if io_utils.ijson is not None else 0)
+
+
+def test_parse_transcript_txt_newlines():
+    """Test plain-text uploads get universal-newline translation."""
+    from src.utils.io import parse_transcript
+
+    content = "John: Hi\r\nJane: Hello\rJohn: Bye\n"
+    expected = "John: Hi\nJane: Hello\nJohn: Bye\n"
+    assert parse_transcript(content.encode("utf-8"), ".txt") == expected
+    assert parse_transcript(content, ".txt") == expected